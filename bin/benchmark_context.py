@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+Micro-benchmarks for active Context lookups in hot paths.  Reports the time per operation and the number of times
+that the active Context was looked up (i.e., via the ``ctx`` proxy or ``get_current_context``) per operation, for
+rendering help text and for accessing parsed Parameter values.
+"""
+
+import gc
+import logging
+from contextvars import Context as VarContext
+from time import perf_counter
+from types import new_class
+
+import cli_command_parser.context as context_module
+from cli_command_parser import Command, Context, Counter, Flag, Option
+from cli_command_parser.core import get_params
+
+log = logging.getLogger(__name__)
+
+
+class ContextBenchmark(Command):
+    size = Option('-s', type=int, default=50, help='Number of Options to generate in the benchmarked Command')
+    number: int = Option('-n', default=200, help='Number of times to run each operation per timing run')
+    repeat: int = Option('-r', default=3, help='Number of timing runs for each case (the fastest time is reported)')
+    verbose = Counter('-v', help='Increase logging verbosity (can specify multiple times)')
+
+    def main(self):
+        logging.basicConfig(level=logging.DEBUG if self.verbose else logging.INFO, format='%(message)s')
+        # This Command's own Context is active here, so the benchmarks are run with an empty context stack instead
+        VarContext().run(self._run)
+
+    def _run(self):
+        command_cls = _build_command(self.size)
+        formatter = get_params(command_cls).formatter
+        with Context([], command_cls, terminal_width=100):
+            self._report('format_help', lambda: formatter.format_help(allow_sys_argv=False), 1)
+
+        command = command_cls.parse(['--opt-1', 'a', '--flag-1'])
+        names = [f'opt_{i}' for i in range(self.size)]
+
+        def get_values():
+            cached = command.__dict__
+            for name in names:
+                cached.pop(name, None)  # Parsed values are cached in the instance's __dict__ after the first access
+                getattr(command, name)
+
+        self._report('Parameter.__get__', get_values, len(names))
+        with command.ctx:  # As when values are accessed in a Command's main method
+            self._report('Parameter.__get__ *', get_values, len(names))
+
+        print("* with the Command's Context active")
+
+    def _report(self, name: str, func, per_run: int):
+        func()  # Populate cached properties before counting lookups
+        lookups = _count_lookups(func) / per_run
+        seconds = self._time(func) / per_run
+        print(f'{name:<20} {seconds * 1_000_000:>10.2f} us/op {lookups:>8.1f} context lookups/op')
+
+    def _time(self, func) -> float:
+        times = []
+        for _ in range(self.repeat):
+            gc.collect()
+            start = perf_counter()
+            for _ in range(self.number):
+                func()
+            times.append(perf_counter() - start)
+        return min(times) / self.number
+
+
+class _CountingStack:
+    """Wraps the context stack ContextVar to count the number of times that the active Context is looked up."""
+
+    def __init__(self, stack):
+        self.stack = stack
+        self.count = 0
+
+    def get(self, *args):
+        self.count += 1
+        return self.stack.get(*args)
+
+    def set(self, value):
+        return self.stack.set(value)
+
+
+def _count_lookups(func) -> int:
+    original = context_module._context_stack
+    context_module._context_stack = counter = _CountingStack(original)
+    try:
+        func()
+    finally:
+        context_module._context_stack = original
+    return counter.count
+
+
+def _build_command(size: int):
+    attrs = {f'opt_{i}': Option(default=str(i), help=f'Option {i}') for i in range(size)}
+    attrs.update({f'flag_{i}': Flag(help=f'Flag {i}') for i in range(size // 2)})
+    # new_class is used so that the namespace is prepared by CommandMeta, as it would be for a class statement
+    return new_class('Generated', (Command,), exec_body=lambda ns: ns.update(attrs))
+
+
+if __name__ == '__main__':
+    ContextBenchmark.parse_and_run()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""
+Benchmark for argparse -> Command conversion using large generated scripts, to verify that the AST visitor and the
+converter scale linearly with the number of ``add_argument`` / ``add_parser`` / group calls.
+"""
+
+import gc
+import logging
+from math import log2
+from time import perf_counter
+
+from cli_command_parser import Command, Counter, Option
+
+log = logging.getLogger(__name__)
+
+
+class ConversionBenchmark(Command):
+    sizes = Option('-s', nargs='+', type=int, default=(1000, 2000, 4000, 8000), help='Numbers of calls to generate')
+    repeat: int = Option('-r', default=3, help='Number of times to run each case (the fastest time is reported)')
+    verbose = Counter('-v', help='Increase logging verbosity (can specify multiple times)')
+
+    def main(self):
+        logging.basicConfig(level=logging.DEBUG if self.verbose else logging.INFO, format='%(message)s')
+        from cli_command_parser.conversion import Script, convert_script
+
+        print(f'{"case":<10} {"calls":>6} {"visit (s)":>10} {"convert (s)":>12} {"us/call":>8} {"exponent":>8}')
+        for name, generator in (('flat', _flat_script), ('grouped', _grouped_script), ('subparsers', _sub_cmd_script)):
+            last = None
+            for size in self.sizes:
+                src_text = generator(size)
+                visit_time = self._time(lambda: Script(src_text).parsers)
+                script = Script(src_text)
+                script.parsers  # noqa
+                convert_time = self._time(lambda: convert_script(script))
+                total = visit_time + convert_time
+                # The exponent k in time ~ size^k between consecutive sizes; ~1 indicates linear scaling
+                exponent = f'{log2(total / last[1]) / log2(size / last[0]):.2f}' if last else '-'
+                last = (size, total)
+                per_call = total / size * 1_000_000
+                print(f'{name:<10} {size:>6} {visit_time:>10.3f} {convert_time:>12.3f} {per_call:>8.1f} {exponent:>8}')
+
+    def _time(self, func) -> float:
+        times = []
+        for _ in range(self.repeat):
+            gc.collect()
+            start = perf_counter()
+            func()
+            times.append(perf_counter() - start)
+        return min(times)
+
+
+def _flat_script(size: int) -> str:
+    lines = ['import argparse', 'parser = argparse.ArgumentParser()']
+    lines.extend(f"parser.add_argument('--opt-{i}', help='Option {i}')" for i in range(size))
+    return '\n'.join(lines)
+
+
+def _grouped_script(size: int) -> str:
+    lines = ['from argparse import ArgumentParser', 'parser = ArgumentParser()']
+    for i in range(0, size, 4):
+        lines.append(f"group_{i} = parser.add_argument_group('Group {i}')")
+        lines.append(f'me_group_{i} = group_{i}.add_mutually_exclusive_group()')
+        lines.extend(f"me_group_{i}.add_argument('--opt-{i + j}', action='store_true')" for j in range(3))
+    return '\n'.join(lines)
+
+
+def _sub_cmd_script(size: int) -> str:
+    lines = ['import argparse', 'parser = argparse.ArgumentParser()', "sub_parsers = parser.add_subparsers(dest='cmd')"]
+    for i in range(0, size, 2):
+        lines.append(f"sub_parser_{i} = sub_parsers.add_parser('cmd-{i}', help='Command {i}')")
+        lines.append(f"sub_parser_{i}.add_argument('--opt-{i}', nargs=argparse.REMAINDER)")
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    ConversionBenchmark.parse_and_run()
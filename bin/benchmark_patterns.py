@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""
+Benchmark for multi-pattern Regex / Glob inputs, comparing the combined alternation that is used when only a yes/no
+match result is needed against the per-pattern loop.
+"""
+
+import gc
+import logging
+from time import perf_counter
+
+from cli_command_parser import Command, Counter, Option
+from cli_command_parser.inputs import Glob, Regex
+
+log = logging.getLogger(__name__)
+
+
+class PatternBenchmark(Command):
+    count: int = Option('-c', default=60, help='Number of patterns to generate for each input')
+    number: int = Option('-n', default=5000, help='Number of values to validate per timing run')
+    repeat: int = Option('-r', default=3, help='Number of timing runs for each case (the fastest time is reported)')
+    verbose = Counter('-v', help='Increase logging verbosity (can specify multiple times)')
+
+    def main(self):
+        logging.basicConfig(level=logging.DEBUG if self.verbose else logging.INFO, format='%(message)s')
+        last = self.count - 1
+        cases = [
+            (
+                'anchored',
+                Regex(*(rf'^res{i}-[a-z]+-\d+$' for i in range(self.count))),
+                f'res{last}-abc-123',
+                'no-match',
+            ),
+            ('unanchored', Regex(*(rf'res{i}-[a-z]+-\d+' for i in range(self.count))), f'res{last}-a-1', 'x' * 500),
+            ('glob', Glob(*(f'res{i}-*-[0-9]*.txt' for i in range(self.count))), f'res{last}-a-1.txt', 'x' * 500),
+        ]
+        print(f'{"case":<12} {"value":<10} {"combined (s)":>12} {"loop (s)":>10} {"speedup":>8}')
+        for name, combined, matching, non_matching in cases:
+            loop = _without_combined(combined)
+            for label, value in (('match', matching), ('no match', non_matching)):
+                combined_time, loop_time = self._time(combined, value), self._time(loop, value)
+                speedup = loop_time / combined_time
+                print(f'{name:<12} {label:<10} {combined_time:>12.3f} {loop_time:>10.3f} {speedup:>7.1f}x')
+
+    def _time(self, input_type, value: str) -> float:
+        times = []
+        for _ in range(self.repeat):
+            gc.collect()
+            start = perf_counter()
+            for _ in range(self.number):
+                try:
+                    input_type(value)
+                except ValueError:
+                    pass
+            times.append(perf_counter() - start)
+        return min(times)
+
+
+def _without_combined(input_type):
+    clone = input_type.__class__.__new__(input_type.__class__)
+    for cls in input_type.__class__.__mro__:
+        for attr in getattr(cls, '__slots__', ()):
+            if hasattr(input_type, attr):
+                setattr(clone, attr, getattr(input_type, attr))
+    clone._combined = None
+    return clone
+
+
+if __name__ == '__main__':
+    PatternBenchmark.parse_and_run()
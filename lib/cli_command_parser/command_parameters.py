@@ -19,6 +19,7 @@ from .exceptions import AmbiguousCombo, AmbiguousShortForm, CommandDefinitionErr
 from .parameters import ActionFlag, ParamGroup, PassThru, help_action
 from .parameters.base import BaseOption, BasePositional, ParamBase, Parameter
 from .parameters.choice_map import Action, SubCommand
+from .utils import SuggestionIndex
 
 if TYPE_CHECKING:
     from .commands import Command
@@ -109,6 +110,17 @@ class CommandParameters:
         formatter.maybe_add_groups(self.groups)
         return formatter
 
+    @cached_property
+    def _option_suggestions(self) -> SuggestionIndex:
+        return SuggestionIndex(self.option_map)
+
+    def suggest_option(self, option: str) -> list[str]:
+        """
+        :param option: An option string that did not match any of the options defined for this Command
+        :return: The defined option strings that are most similar to the given one, if any
+        """
+        return self._option_suggestions.suggest(option)
+
     @cached_property
     def _has_help(self) -> Bool:
         return help_action in self.action_flags or (self.parent and self.parent._has_help)
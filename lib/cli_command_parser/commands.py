@@ -374,7 +374,7 @@ def main(argv: Argv | None = None, return_command: Bool = False, **kwargs) -> Co
     return command if return_command else None
 
 
-def print_help(command: Command, *, exit: bool = True, file: TextIO | None = None):  # noqa
+def print_help(command: Command, *, exit: bool = True, file: TextIO | None = None, pager: bool | None = None):  # noqa
     """
     User-callable version of the ``--help`` / ``-h`` action.  Prints help text, then optionally exits.
 
@@ -382,7 +382,9 @@ def print_help(command: Command, *, exit: bool = True, file: TextIO | None = Non
     :param exit: Whether a :class:`~.ParserExit` exception should be raised after help text is printed.  If True (the
       default), the program will exit with code 0 (success).  If False, no exception will be raised.
     :param file: The file-like object (stream) to write to; defaults to the current sys.stdout.
+    :param pager: Whether help text should be displayed using a pager when writing to a terminal.  Defaults to the
+      configured :attr:`~.CommandConfig.help_pager` value.
     """
-    print(get_params(command).formatter.format_help(), file=file)
+    get_params(command).formatter.write_help(file, pager=pager)
     if exit:
         raise ParserExit
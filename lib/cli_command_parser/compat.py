@@ -29,6 +29,9 @@ class WCTextWrapper(TextWrapper):
         "word". Whitespace chunks will be removed from the beginning and end of lines, but apart from that whitespace
         is preserved.
         """
+        if (text := ''.join(chunks)).isascii() and text.isprintable():
+            # The width of printable ASCII text is equal to its length, so the stdlib implementation can be used as-is
+            return super()._wrap_chunks(chunks)
         if self.width <= 0:
             raise ValueError(f'invalid width {self.width!r} (must be > 0)')
         if self.max_lines is not None:
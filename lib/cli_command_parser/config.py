@@ -32,10 +32,13 @@ __all__ = [
     'SubcommandAliasHelpMode',
     'AmbiguousComboMode',
     'AllowLeadingDash',
+    'ConfigSnapshot',
     'DEFAULT_CONFIG',
 ]
 
 _T = TypeVar('_T')
+# Incremented when a config that has child configs is modified, to invalidate the snapshots of all configs
+_snapshot_generation = 0
 
 
 # region Config Option Enums
@@ -261,7 +264,10 @@ class ConfigItem(Generic[_T]):
     def __get__(self, instance: CommandConfig | None, owner: Any) -> Self | _T:
         if instance is None:
             return self
-        return instance._data.get(self.name, self.default)
+        try:
+            return getattr(instance.snapshot, self.name)
+        except AttributeError:  # A field that was added after ConfigSnapshot was defined
+            return instance._data.get(self.name, self.default)
 
     def __set__(self, instance: CommandConfig, value: _T):
         if instance._read_only:
@@ -269,6 +275,7 @@ class ConfigItem(Generic[_T]):
         elif self.type is not None:
             value = self.type(value)
         instance._data[self.name] = value
+        instance._invalidate_snapshot()
 
     def __delete__(self, instance: CommandConfig):
         if instance._read_only:
@@ -277,6 +284,7 @@ class ConfigItem(Generic[_T]):
             del instance._data[self.name]
         except KeyError as e:
             raise AttributeError(f'No {self.name!r} config was stored for {instance}') from e
+        instance._invalidate_snapshot()
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__}({self.default!r}, type={self.type!r})>'
@@ -297,6 +305,7 @@ class DynamicConfigItem(ConfigItem[_T]):
         if instance._read_only:
             raise AttributeError(f'Unable to set attribute {self.name}={value!r} because {instance} is read-only')
         instance._data[self.name] = self.type(instance, value)
+        instance._invalidate_snapshot()
 
 
 def config_item(default: _T):
@@ -311,7 +320,7 @@ class CommandConfig:
 
     # Note: PyCharm may incorrectly think ConfigItem attrs are read only: https://youtrack.jetbrains.com/issue/PY-29770
 
-    __slots__ = ('_data', '_read_only')
+    __slots__ = ('_data', '_read_only', '_has_children', '_snapshot', '_snapshot_generation')
     _data: ChainMap
     _read_only: bool
     FIELDS: set[str] = set()
@@ -366,6 +375,9 @@ class CommandConfig:
         AmbiguousComboMode.PERMISSIVE, AmbiguousComboMode
     )
 
+    #: The max number of threads to use to concurrently convert values for multi-value Parameters with a file input type
+    file_input_workers: ConfigItem[int] = ConfigItem(0, int)
+
     # endregion
 
     # region Usage & Help Text Options
@@ -450,6 +462,10 @@ class CommandConfig:
     #: By default, that setting only defines where the parameter descriptions begin.
     strict_usage_column_width: ConfigItem[bool] = ConfigItem(False, bool)
 
+    #: Whether help text should be displayed using a pager (the command defined by the ``PAGER`` environment variable,
+    #: or ``less``) when it is written to a terminal
+    help_pager: ConfigItem[Bool] = ConfigItem(False, bool)
+
     @config_item(False)
     def wrap_usage_str(self, value: Any) -> int | bool:
         """
@@ -476,8 +492,15 @@ class CommandConfig:
     # endregion
 
     def __init__(self, parent: CommandConfig | None = None, read_only: bool = False, **kwargs):
-        self._data = parent._data.new_child() if parent else ChainMap()
+        if parent:
+            self._data = parent._data.new_child()
+            parent._has_children = True
+        else:
+            self._data = ChainMap()
         self._read_only = read_only
+        self._has_children = False
+        self._snapshot: ConfigSnapshot | None = None
+        self._snapshot_generation = -1
         if kwargs:
             try:
                 for key, val in kwargs.items():
@@ -496,5 +519,65 @@ class CommandConfig:
             return {key: getattr(self, key) for key in self.FIELDS}
         return {key: val for key, val in self._data.items() if key in self.FIELDS}
 
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        A frozen, flattened copy of the resolved value of every option in this config, including inherited and default
+        values.  It is only re-computed after this config or one of its parents is modified, so reading options from it
+        is a plain attribute lookup instead of a lookup through every level of config inheritance.
+        """
+        if (snapshot := self._snapshot) is None or self._snapshot_generation != _snapshot_generation:
+            cls, data = self.__class__, self._data
+            snapshot = ConfigSnapshot(
+                {key: data.get(key, getattr(cls, key).default) for key in ConfigSnapshot.__slots__}
+            )
+            self._snapshot, self._snapshot_generation = snapshot, _snapshot_generation
+        return snapshot
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The snapshot is excluded since it is only a cache
+        return {'_data': self._data, '_read_only': self._read_only, '_has_children': self._has_children}
+
+    def __setstate__(self, state: dict[str, Any]):
+        for key, val in state.items():
+            setattr(self, key, val)
+        self._snapshot, self._snapshot_generation = None, -1
+
+    def _invalidate_snapshot(self):
+        global _snapshot_generation
+        self._snapshot = None
+        if self._has_children:  # The snapshots of configs that inherit from this config also need to be re-computed
+            _snapshot_generation += 1
+
+
+class ConfigSnapshot:
+    """
+    A frozen, flattened view of the resolved values of all options in a :class:`CommandConfig`.  Obtained via
+    :attr:`CommandConfig.snapshot`.
+    """
+
+    __slots__ = tuple(sorted(CommandConfig.FIELDS))
+
+    def __init__(self, values: dict[str, Any]):
+        for key, val in values.items():
+            object.__setattr__(self, key, val)
+
+    def __setattr__(self, key: str, value: Any):
+        raise AttributeError(f'Unable to set attribute {key}={value!r} because {self.__class__.__name__} is frozen')
+
+    def __delattr__(self, key: str):
+        raise AttributeError(f'Unable to delete attribute {key} because {self.__class__.__name__} is frozen')
+
+    def __reduce__(self):
+        return self.__class__, ({key: getattr(self, key) for key in self.__slots__},)
+
+    def __repr__(self) -> str:
+        settings = ', '.join(f'{key}={getattr(self, key)!r}' for key in self.__slots__)
+        return f'<{self.__class__.__name__}({settings})>'
+
+    if TYPE_CHECKING:
+
+        def __getattr__(self, key: str) -> Any: ...
+
 
 DEFAULT_CONFIG: CommandConfig = CommandConfig(read_only=True)
@@ -9,8 +9,9 @@ from __future__ import annotations
 import sys
 from collections import defaultdict
 from collections.abc import Collection
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import AbstractContextManager
-from contextvars import ContextVar
+from contextvars import ContextVar, copy_context
 from enum import Enum
 from functools import cached_property
 from inspect import Parameter as _Parameter, Signature
@@ -25,6 +26,7 @@ if TYPE_CHECKING:
     from .command_parameters import CommandParameters
     from .commands import Command
     from .core import CommandMeta
+    from .inputs.utils import StatCache
     from .parameters import ActionFlag, BaseOption, Parameter
     from .typing import Bool, OptStr, ParamOrGroup, PathLike, StrSeq
 
@@ -35,6 +37,8 @@ if TYPE_CHECKING:
 __all__ = ['Context', 'ctx', 'get_current_context', 'get_or_create_context', 'get_context', 'get_parsed', 'get_raw_arg']
 
 _context_stack: ContextVar[list[Context]] = ContextVar('cli_command_parser.context.stack')
+#: Contexts that have pending prefetched conversions, so the active Context does not need to be looked up otherwise
+_prefetching: set[Context] = set()
 _TERMINAL = Terminal()
 
 
@@ -53,6 +57,8 @@ class Context(AbstractContextManager):  # Extending AbstractContextManager to ma
     _terminal_width: int | None
     _provided: dict[ParamOrGroup, int]
     _parsed: dict[ParamOrGroup, Any]
+    _prefetched: dict[tuple[Parameter, str], Future]
+    _executor: ThreadPoolExecutor | None = None
 
     def __init__(
         self,
@@ -71,6 +77,7 @@ class Context(AbstractContextManager):  # Extending AbstractContextManager to ma
         self.parent = parent
         self.actions_taken = 0
         self.config = _normalize_config(config, kwargs, parent, command_cls)
+        self._prefetched = {}
         if parent:
             self._set_argv(parent.prog, argv)
             self._parsed = parent._parsed.copy()
@@ -250,6 +257,48 @@ class Context(AbstractContextManager):  # Extending AbstractContextManager to ma
         """Not intended to be called by users.  Used by Parameters during parsing to handle nargs."""
         return self._provided[param]
 
+    def prefetch_conversions(self, param: Parameter, values: Sequence[str], max_workers: int):
+        """
+        Not intended to be called by users.  Used during parsing to concurrently convert upcoming values for Parameters
+        with I/O-bound input types.  Results are consumed (in order) by :meth:`.Parameter.prepare_value`.
+        """
+        if (executor := self._executor) is None:
+            self._executor = executor = ThreadPoolExecutor(max_workers, thread_name_prefix='cli_command_parser')
+
+        _prefetching.add(self)
+        prefetched, convert = self._prefetched, param.type
+        for value in values:
+            if (key := (param, value)) not in prefetched:
+                # The current context is propagated so the conversions can share this context's stat cache
+                prefetched[key] = executor.submit(copy_context().run, convert, value)  # type: ignore[arg-type]
+
+    def pop_prefetched(self, param: Parameter, value: str) -> Future | None:
+        """Not intended to be called by users.  Returns the pending conversion of the given value, if one exists."""
+        if self._prefetched:
+            return self._prefetched.pop((param, value), None)
+        return None
+
+    def discard_prefetched(self):
+        """Not intended to be called by users.  Used after parsing to discard any unused pending conversions."""
+        if (executor := self._executor) is not None:
+            _prefetching.discard(self)
+            self._prefetched.clear()
+            self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @cached_property
+    def stat_cache(self) -> StatCache:
+        """
+        Not intended to be accessed by users.  Cache for filesystem metadata that is shared by all file-based inputs
+        (and sub-contexts) during parsing.
+        """
+        if self.parent:
+            return self.parent.stat_cache
+
+        from .inputs.utils import StatCache
+
+        return StatCache()
+
     def get_missing(self) -> list[Parameter]:
         """Not intended to be called by users.  Used during parsing to determine if any Parameters are missing."""
         if self.params:
@@ -462,6 +511,13 @@ def get_current_context(silent: bool = False) -> Context | None:
         raise NoActiveContext('There is no active context') from None
 
 
+def _pop_prefetched(param: Parameter, value: str) -> Future | None:
+    """Returns the pending conversion of the given value in the active Context, if one exists."""
+    if _prefetching and (context := get_current_context(True)) is not None:
+        return context.pop_prefetched(param, value)
+    return None
+
+
 def get_or_create_context(
     command_cls: CommandCls, argv: Argv = None, *, command: Command | None = None, **kwargs
 ) -> Context:
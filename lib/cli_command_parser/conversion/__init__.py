@@ -9,4 +9,5 @@ from .argparse_ast import (
     SubParser,
     visit_func,
 )
+from .batch import BatchConverter, ConversionResult
 from .command_builder import Converter, convert_script
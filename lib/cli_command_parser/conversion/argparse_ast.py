@@ -132,6 +132,10 @@ class AddVisitedChild(Generic[AC]):
     def __set_name__(self, owner: Type[ArgCollection], name: str):
         owner._add_visit_func(name)
 
+    def visit(self, instance: ArgCollection, node: InitNode, tracked_refs: TrackedRefMap) -> AC:
+        """Add a child to the given instance.  Used by dispatch tables to avoid creating a partial for each call."""
+        return instance._add_child(self.child_cls, getattr(instance, self.list_attr), node, tracked_refs)
+
     @overload
     def __get__(self, instance: Literal[None], owner: Any) -> Self: ...
 
@@ -158,6 +162,8 @@ class AstCallable(ABC):
 
     represents: ClassVar[RepresentedCallable]
     visit_funcs: set[str] = set()
+    #: Mapping of {visit func name: unbound visit function} for this class, built once when the class is defined
+    visit_dispatch: ClassVar[dict[str, Callable[[Any, InitNode, TrackedRefMap], AstCallable]]] = {}
     _sig: Signature | None = None
 
     @classmethod
@@ -176,6 +182,8 @@ class AstCallable(ABC):
 
     def __init_subclass__(cls, represents: RepresentedCallable | None = None, **kwargs):
         super().__init_subclass__(**kwargs)
+        # Note: __init_subclass__ is called after __set_name__, so all visit funcs have been registered at this point
+        cls.visit_dispatch = {name: _unbound_visit_func(cls, name) for name in cls.visit_funcs}
         if represents:
             cls.represents = represents
             cls._sig = None
@@ -275,6 +283,17 @@ class AstCallable(ABC):
         print(f'{" " * indent} - {self!r}')
 
 
+def _unbound_visit_func(cls: Type[AstCallable], name: str) -> Callable[[Any, InitNode, TrackedRefMap], AstCallable]:
+    for klass in cls.__mro__:
+        try:
+            attr = klass.__dict__[name]
+        except KeyError:
+            continue
+        return attr.visit if isinstance(attr, AddVisitedChild) else attr
+
+    raise AttributeError(f'{cls.__name__} has no visit func named {name!r}')
+
+
 def _get_call(node: InitNode) -> Call | None:
     match node:
         case Call():
@@ -0,0 +1,220 @@
+"""
+Batch conversion of argparse-based scripts in a directory tree, with results cached by source content.
+
+:author: Doug Skrypa
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from hashlib import sha256
+from itertools import repeat
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from ..__version__ import __version__
+from .argparse_ast import Script
+from .command_builder import convert_script
+
+if TYPE_CHECKING:
+    from cli_command_parser.typing import OptStr, PathLike
+
+__all__ = ['BatchConverter', 'ConversionResult']
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class ConversionResult:
+    path: Path
+    #: The converted code, or None if conversion failed.  Empty if no ArgumentParsers were found in the script.
+    output: OptStr = None
+    #: The error that was encountered, if conversion failed
+    error: OptStr = None
+    #: Whether the output was loaded from the cache
+    cached: bool = False
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    @property
+    def skipped(self) -> bool:
+        return self.output == ''
+
+
+class BatchConverter:
+    """
+    Converts all of the argparse-based scripts in one or more directory trees, using a process pool so that each
+    script does not require a separate interpreter.
+
+    :param add_methods: Whether boilerplate methods should be included in Commands
+    :param smart_loop_handling: Whether "smart" for loop handling that attempts to dedupe common subparser params
+      should be used
+    :param workers: The maximum number of worker processes to use.  If 1, then scripts are converted in this process.
+      Defaults to the number of CPUs.
+    :param cache_dir: A directory in which converted output should be cached.  Cache entries are keyed on a hash of the
+      source code, the conversion options, and the cli_command_parser version, so unchanged scripts are not
+      re-converted.  Failures are not cached.
+    :param output_dir: A directory in which converted scripts should be written, using the same relative paths as the
+      source scripts.  Scripts that contained no ArgumentParsers and scripts that could not be converted are not
+      written.
+    """
+
+    def __init__(
+        self,
+        *,
+        add_methods: bool = False,
+        smart_loop_handling: bool = True,
+        workers: int | None = None,
+        cache_dir: PathLike | None = None,
+        output_dir: PathLike | None = None,
+    ):
+        self.add_methods = add_methods
+        self.smart_loop_handling = smart_loop_handling
+        self.workers = workers
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.output_dir = Path(output_dir) if output_dir else None
+
+    # region Discovery
+
+    @classmethod
+    def find_scripts(cls, root: PathLike, pattern: str = '*.py') -> list[Path]:
+        """
+        :param root: A directory that contains scripts to convert
+        :param pattern: A glob pattern that script file names must match
+        :return: Sorted paths for the files in the given directory tree that match the pattern and import argparse
+        """
+        return sorted(path for path in Path(root).rglob(pattern) if path.is_file() and _uses_argparse(path))
+
+    # endregion
+
+    # region Conversion
+
+    def convert_tree(self, root: PathLike, pattern: str = '*.py') -> list[ConversionResult]:
+        """Convert all of the scripts that are found via :meth:`.find_scripts` in the given directory tree"""
+        root = Path(root)
+        results = self.convert_all(self.find_scripts(root, pattern))
+        if self.output_dir:
+            self.write_outputs(results, root)
+        return results
+
+    def convert_all(self, paths: Iterable[PathLike]) -> list[ConversionResult]:
+        """
+        :param paths: Paths of scripts to convert
+        :return: A result for each script, in the same order as the given paths
+        """
+        results: list[ConversionResult] = []
+        pending: dict[int, tuple[str, str]] = {}  # {index: (cache key, source)}
+        for i, path in enumerate(map(Path, paths)):
+            try:
+                src_text = path.read_text('utf-8')
+            except (OSError, ValueError) as e:
+                results.append(ConversionResult(path, error=_error_str(e)))
+                continue
+
+            key = self._cache_key(src_text)
+            if (output := self._get_cached(key)) is not None:
+                log.debug(f'Using cached output for {path.as_posix()}')
+                results.append(ConversionResult(path, output, cached=True))
+            else:
+                results.append(ConversionResult(path))
+                pending[i] = (key, src_text)
+
+        for i, (output, error) in zip(pending, self._convert_pending(results, pending)):
+            result = results[i]
+            result.output, result.error = output, error
+            if output is not None:
+                self._store_cached(pending[i][0], output)
+
+        return results
+
+    def _convert_pending(
+        self, results: list[ConversionResult], pending: dict[int, tuple[str, str]]
+    ) -> Iterator[tuple[OptStr, OptStr]]:
+        paths = [results[i].path for i in pending]
+        sources = [src_text for _, src_text in pending.values()]
+        options = (repeat(self.add_methods), repeat(self.smart_loop_handling))
+        if self.workers == 1 or len(paths) < 2:
+            yield from map(_convert, paths, sources, *options)
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                yield from executor.map(_convert, paths, sources, *options, chunksize=4)
+
+    # endregion
+
+    # region Cache
+
+    def _cache_key(self, src_text: str) -> str:
+        options = f'{__version__}:{self.add_methods:d}:{self.smart_loop_handling:d}:'
+        return sha256((options + src_text).encode('utf-8')).hexdigest()
+
+    def _get_cached(self, key: str) -> OptStr:
+        if not self.cache_dir:
+            return None
+        try:
+            return self.cache_dir.joinpath(key + '.py').read_text('utf-8')
+        except OSError:
+            return None
+
+    def _store_cached(self, key: str, output: str):
+        if not self.cache_dir:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir.joinpath(key + '.py').write_text(output, 'utf-8')
+
+    # endregion
+
+    # region Output
+
+    def write_outputs(self, results: Iterable[ConversionResult], root: Path):
+        """Write the converted code for each successful result to :paramref:`.output_dir`, relative to ``root``"""
+        for result in results:
+            if result.output:
+                path = self.output_dir.joinpath(result.path.relative_to(root))  # type: ignore[union-attr]
+                path.parent.mkdir(parents=True, exist_ok=True)
+                log.debug(f'Writing {path.as_posix()}')
+                path.write_text(result.output + '\n', 'utf-8')
+
+    @classmethod
+    def summarize(cls, results: Iterable[ConversionResult]) -> str:
+        """
+        :param results: Results from :meth:`.convert_all` or :meth:`.convert_tree`
+        :return: A summary of the number of scripts that were converted, with the error for each script that failed
+        """
+        results = list(results)
+        failed = [result for result in results if result.failed]
+        skipped = sum(1 for result in results if result.skipped)
+        cached = sum(1 for result in results if result.cached and not result.skipped)
+        converted = len(results) - len(failed) - skipped - cached
+        lines = [
+            f'Scripts: {len(results)}, converted: {converted}, cached: {cached}, no parsers: {skipped},'
+            f' failed: {len(failed)}'
+        ]
+        lines.extend(f'  {result.path.as_posix()}: {result.error}' for result in failed)
+        return '\n'.join(lines)
+
+    # endregion
+
+
+def _convert(path: Path, src_text: str, add_methods: bool, smart_loop_handling: bool) -> tuple[OptStr, OptStr]:
+    """Convert the given source.  Defined at the module level so that it can be called in worker processes."""
+    try:
+        script = Script(src_text, smart_loop_handling, path=path)
+        if not script.parsers:
+            return '', None
+        return convert_script(script, add_methods), None
+    except Exception as e:  # noqa
+        return None, _error_str(e)
+
+
+def _uses_argparse(path: Path) -> bool:
+    try:
+        return b'argparse' in path.read_bytes()
+    except OSError:
+        return False
+
+
+def _error_str(exc: BaseException) -> str:
+    return f'{type(exc).__name__}: {exc}'
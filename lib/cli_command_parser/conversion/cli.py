@@ -4,7 +4,7 @@ import logging
 from functools import cached_property
 from pathlib import Path
 
-from cli_command_parser import Command, Counter, Flag, Param, ParamGroup, Positional, SubCommand, main
+from cli_command_parser import Command, Counter, Flag, Option, Param, ParamGroup, Positional, SubCommand, main
 from cli_command_parser.inputs import Path as IPath
 
 log = logging.getLogger(__name__)
@@ -57,5 +57,31 @@ class Pprint(ParserConverter):
             parser.pprint()
 
 
+class Batch(ParserConverter):
+    """Convert all of the scripts that use argparse in a directory tree, and print a summary of the results"""
+
+    input = Positional(type=IPath(type='dir', exists=True), help='A directory containing scripts to convert')
+    output_dir = Option('-o', type=IPath(), help='Directory in which converted scripts should be written')
+    cache_dir = Option('-c', type=IPath(), help='Directory in which converted output should be cached')
+    pattern = Option('-p', default='*.py', help='Glob pattern that script file names must match')
+    workers: int = Option('-w', help='Maximum number of worker processes to use (default: number of CPUs)')
+    add_methods = Flag('--no-methods', '-M', default=True, help='Do not include boilerplate methods in Commands')
+
+    def main(self):
+        from cli_command_parser.conversion import BatchConverter
+
+        converter = BatchConverter(
+            add_methods=self.add_methods,
+            smart_loop_handling=not self.no_smart_for,
+            workers=self.workers,
+            cache_dir=self.cache_dir,
+            output_dir=None if self.dry_run else self.output_dir,
+        )
+        results = converter.convert_tree(self.input, self.pattern)
+        print(converter.summarize(results))
+        if any(result.failed for result in results):
+            raise SystemExit(1)
+
+
 if __name__ == '__main__':
     main()
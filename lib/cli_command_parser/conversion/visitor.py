@@ -8,7 +8,7 @@ from enum import Enum
 from functools import partial, wraps
 from typing import TYPE_CHECKING, Collection, Iterator, Literal, Type, Union, overload
 
-from .argparse_ast import AstArgumentParser, AstCallable, VisitFunc
+from .argparse_ast import AstArgumentParser, AstCallable, InitNode, VisitFunc
 from .utils import get_name_repr
 
 if TYPE_CHECKING:
@@ -40,7 +40,7 @@ def scoped(func):
         try:
             func(self, *args, **kwargs)
         finally:
-            self.scopes = self.scopes.parents
+            self._pop_scope()
 
     return _scoped_method
 
@@ -67,6 +67,7 @@ class ScriptVisitor(NodeVisitor):
         self.scopes = ChainMap()  # ChainMap that tracks the var/class/func/etc names available in a given scope
         self._tracked_refs: set[TrackedRef] = set()  # References that are tracked, but not meant to be called
         self._mod_name_tracked_map: dict[str, NameTrackedMap] = defaultdict(dict)  # All tracked items by source module
+        self._tracked_ref_map: TrackedRefMap | None = None  # Cached result of get_tracked_refs for the current scopes
         for ref in track_refs:
             self.track_refs_to(ref)
 
@@ -79,14 +80,38 @@ class ScriptVisitor(NodeVisitor):
         self._mod_name_tracked_map[ref.module][ref.name] = ref
 
     def get_tracked_refs(self) -> TrackedRefMap:
+        """
+        The returned mapping is shared by all calls until a name that references a tracked item is (un)bound, so it
+        must not be modified.  Caching it avoids scanning every name in every scope for each tracked call, which would
+        otherwise result in quadratic scaling for scripts that store many parsers / groups / args in variables.
+        """
+        if (tracked_refs := self._tracked_ref_map) is not None:
+            return tracked_refs
+
         tracked_refs = defaultdict(set)
         for key, val in self.scopes.items():
             if val in self._tracked_refs:
                 tracked_refs[val].add(key)
 
         tracked_refs.default_factory = None  # disable creation of new sets on future key misses
+        self._tracked_ref_map = tracked_refs  # type: ignore[assignment]
         return tracked_refs  # type: ignore[return-value]
 
+    def _bind(self, name: str, value: TrackedValue):
+        """Bind the given name to the given value in the current scope"""
+        tracked_refs = self._tracked_refs
+        if value in tracked_refs or self.scopes.get(name) in tracked_refs:
+            self._tracked_ref_map = None
+        self.scopes[name] = value
+
+    def _pop_scope(self):
+        popped, self.scopes = self.scopes.maps[0], self.scopes.parents
+        tracked_refs = self._tracked_refs
+        for name, value in popped.items():
+            if value in tracked_refs or self.scopes.get(name) in tracked_refs:
+                self._tracked_ref_map = None
+                break
+
     # region Imports
 
     def visit_Import(self, node: Import):
@@ -100,7 +125,7 @@ class ScriptVisitor(NodeVisitor):
                 # One or more items in the specified module were registered to be tracked
                 log.debug(f'Found module import: {module_name} as {as_name}')
                 for name, tracked in name_tracked_map.items():
-                    self.scopes[f'{as_name}.{name}'] = tracked
+                    self._bind(f'{as_name}.{name}', tracked)
 
     def visit_ImportFrom(self, node: ImportFrom):
         """
@@ -141,7 +166,7 @@ class ScriptVisitor(NodeVisitor):
         for name, as_name in imp_names(node):
             if tracked := name_tracked_map.get(name):
                 log.debug(f'Found tracked import: {node.module}.{name} as {as_name}')
-                self.scopes[as_name] = tracked
+                self._bind(as_name, tracked)
 
     # endregion
 
@@ -198,7 +223,7 @@ class ScriptVisitor(NodeVisitor):
                     # other subparsers that are not in scope for this loop.
                     # Pretend the parent is the target - ignore the subparsers when evaluating the loop, and add the
                     # common items to the parent parser.
-                    self.scopes[loop_var] = parent  # type: ignore[assignment]
+                    self._bind(loop_var, parent)
                     self.generic_visit(node)
                     return
 
@@ -216,7 +241,7 @@ class ScriptVisitor(NodeVisitor):
         for name in ele_names:
             if ref := self.scopes.get(name):
                 visited_any = True
-                self.scopes[loop_var] = ref
+                self._bind(loop_var, ref)
                 self.generic_visit(node)
 
         if not visited_any:
@@ -254,10 +279,19 @@ class ScriptVisitor(NodeVisitor):
     def _resolve(self, name: RefName) -> tuple[TrackedValue | None, str | None]:
         """Resolves the given reference, but does not handle final attr lookup or type checking."""
         obj: TrackedRef | VisitFunc | AstCallable | None | _NoCallType
-        if isinstance(name, Attribute) and isinstance(name.value, Call):
-            if (obj := self.visit_Call(name.value)) is _NoCall:
-                return None, None
-            return obj, name.attr
+        if isinstance(name, Attribute):
+            if isinstance(name.value, Call):
+                if (obj := self.visit_Call(name.value)) is _NoCall:
+                    return None, None
+                return obj, name.attr
+            elif isinstance(name.value, Name):
+                # Fast path for the most common case (``parser.add_argument``) that avoids building / splitting strings
+                scopes = self.scopes
+                if obj := scopes.get(f'{name.value.id}.{name.attr}'):  # e.g., ``argparse.ArgumentParser``
+                    return obj, None
+                if (obj := scopes.get(name.value.id)) is None:
+                    return None, None
+                return obj, name.attr
 
         if not isinstance(name, str):
             name = get_name_repr(name)
@@ -273,6 +307,21 @@ class ScriptVisitor(NodeVisitor):
 
         return obj, attr
 
+    def _call_tracked(self, name: RefName, node: InitNode) -> AstCallable | _NoCallType:
+        """
+        Equivalent to calling the result of ``resolve_ref(name, True)`` with the given node, if a visit function was
+        found, but uses the precomputed :attr:`.AstCallable.visit_dispatch` tables instead of binding a new method or
+        partial for each call.
+        """
+        obj, attr = self._resolve(name)
+        if isinstance(obj, AstCallable):
+            if attr is None or (func := obj.visit_dispatch.get(attr)) is None:
+                return _NoCall
+            return func(obj, node, self.get_tracked_refs())
+        elif obj is None or attr is not None or obj in self._tracked_refs:
+            return _NoCall
+        return obj(node, self.get_tracked_refs())  # type: ignore[operator]
+
     # endregion
 
     def visit_withitem(self, item: withitem):
@@ -280,11 +329,10 @@ class ScriptVisitor(NodeVisitor):
         Visit a single ``withitem`` / context expression within a ``with ...:`` statement that may include one or more
         ``withitem``s / content expressions.
         """
-        if func := self.resolve_ref(item.context_expr, True):
+        if (result := self._call_tracked(item.context_expr, item)) is not _NoCall:
             # Found a `with foo(...):` statement where `foo` is being tracked or a `with bar:` where `bar = foo(...)`
-            result = func(item, self.get_tracked_refs())
             if as_name := item.optional_vars:
-                self.scopes[get_name_repr(as_name)] = result
+                self._bind(get_name_repr(as_name), result)
 
     def visit_Assign(self, node: Assign):
         """
@@ -298,24 +346,22 @@ class ScriptVisitor(NodeVisitor):
                 if ref := self.resolve_ref(node.value):
                     # The value was singular and referenced something being tracked
                     for target in node.targets:
-                        self.scopes[get_name_repr(target)] = ref
+                        self._bind(get_name_repr(target), ref)
                 # Not handled here: cases like `a = (1, 2); x, y = a` or `x, y = a, b`
             case Call():
                 # Storing the result of a function/similar call; e.g., `foo = bar()` or `foo = bar.baz()`
                 if (result := self.visit_Call(node.value)) is not _NoCall:
                     for target in node.targets:
-                        self.scopes[get_name_repr(target)] = result
+                        self._bind(get_name_repr(target), result)
             case List() | Tuple():
                 for target in node.targets:
                     if isinstance(target, (List, Tuple)) and len(target.elts) == len(node.value.elts):
                         for target_var, value in zip(target.elts, node.value.elts):
                             if ref := self.resolve_ref(value):
-                                self.scopes[get_name_repr(target_var)] = ref
+                                self._bind(get_name_repr(target_var), ref)
 
     def visit_Call(self, node: Call) -> AstCallable | _NoCallType:
-        if func := self.resolve_ref(node.func, True):
-            return func(node, self.get_tracked_refs())
-        return _NoCall
+        return self._call_tracked(node.func, node)
 
 
 class TrackedRef:
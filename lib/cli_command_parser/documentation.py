@@ -6,20 +6,29 @@ Utilities for generating documentation for Commands
 
 from __future__ import annotations
 
+import ast
+import enum
 import logging
+import os
+import re
 import sys
 from abc import ABC
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time, timedelta
 from fnmatch import fnmatch
+from importlib import import_module as _import_module
 from importlib.util import module_from_spec, spec_from_file_location
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterable, Mapping, Type
+from pathlib import Path, PurePath, PurePosixPath, PureWindowsPath
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Collection, Iterable, Iterator, Mapping, Type
 
 from .commands import Command
 from .context import Context
 from .core import CommandMeta, get_metadata, get_params, get_parent
 from .formatting.commands import NameFunc, get_formatter
 from .formatting.restructured_text import MODULE_TEMPLATE, rst_header, rst_toc_tree
+from .parameters import after_main, before_main
 
 if TYPE_CHECKING:
     from .typing import Bool, OptStr, PathLike, Strings
@@ -27,7 +36,7 @@ if TYPE_CHECKING:
     CommandCls = Type[Command]
     Commands = dict[str, CommandCls]
 
-__all__ = ['render_script_rst', 'render_command_rst', 'load_commands', 'RstWriter']
+__all__ = ['render_script_rst', 'render_command_rst', 'load_commands', 'discover_commands', 'RstWriter']
 log = logging.getLogger(__name__)
 
 
@@ -35,10 +44,19 @@ log = logging.getLogger(__name__)
 
 
 def render_script_rst(
-    path: PathLike, top_only: Bool = True, fix_name: Bool = True, fix_name_func: NameFunc | None = None
+    path: PathLike,
+    top_only: Bool = True,
+    fix_name: Bool = True,
+    fix_name_func: NameFunc | None = None,
+    static: Bool = False,
 ) -> str:
-    """Load all Commands from the file with the given path, and generate a single RST string based on those Commands"""
-    commands = load_commands(path, top_only)
+    """
+    Load all Commands from the file with the given path, and generate a single RST string based on those Commands.
+
+    If ``static`` is True, then Commands will be discovered via :func:`discover_commands` instead of importing the file,
+    when possible.
+    """
+    commands = load_commands(path, top_only, static=static)
     return _render_commands_rst(commands, fix_name, fix_name_func)
 
 
@@ -75,7 +93,7 @@ def _render_commands_rst(commands: Commands, fix_name: Bool = True, fix_name_fun
 # region Import and Load Commands
 
 
-def load_commands(path: PathLike, top_only: Bool = False, include_abc: Bool = False) -> Commands:
+def load_commands(path: PathLike, top_only: Bool = False, include_abc: Bool = False, static: Bool = False) -> Commands:
     """
     Load all of the commands from the file with the given path and return them as a dict of ``{name: Command}``.
 
@@ -86,11 +104,20 @@ def load_commands(path: PathLike, top_only: Bool = False, include_abc: Bool = Fa
     :param path: The path to a file containing one or more :class:`.Command` classes
     :param top_only: If True, then only top-level commands are returned (default: all)
     :param include_abc: Whether Command classes that extend :class:`python:abc.ABC` should be included in results.
+    :param static: If True, then Commands will be discovered via :func:`discover_commands`, which avoids importing the
+      file when possible.
     :return: Dict containing the Commands loaded from the given file
     """
+    if static:
+        return discover_commands(path, top_only, include_abc)[0]
+
     with Context(allow_argv_prog=False):
         module = import_module(path)
 
+    return _module_commands(module, top_only, include_abc)
+
+
+def _module_commands(module: ModuleType, top_only: Bool = False, include_abc: Bool = False) -> Commands:
     commands = filtered_commands(module.__dict__, top_only, include_abc)
 
     if doc_str := module.__doc__:
@@ -182,6 +209,516 @@ def _is_command(obj, include_abc: Bool = False) -> bool:
 # endregion
 
 
+# region Static Command Discovery
+
+
+def discover_commands(path: PathLike, top_only: Bool = False, include_abc: Bool = False) -> tuple[Commands, OptStr]:
+    """
+    Discover all of the commands in the file with the given path without importing it, when possible.
+
+    The file is parsed, and a module is built from only the statements that are needed to define its Command classes and
+    their Parameters: imports from ``cli_command_parser`` and the standard library, module-level constants that only
+    call classes that are known to have no side effects, and ``class`` definitions.  Method bodies are replaced with
+    stubs, and all other module-level code is skipped, so scripts with expensive or side-effect-laden module-level code
+    (or missing third-party dependencies) can still be documented.  If any part of a Command definition cannot be
+    resolved statically (such as a base class or a Parameter ``type`` that is imported from another package, or Commands
+    that are defined or modified by module-level code), then the file will be imported via :func:`load_commands`
+    instead.
+
+    :param path: The path to a file containing one or more :class:`.Command` classes
+    :param top_only: If True, then only top-level commands are returned (default: all)
+    :param include_abc: Whether Command classes that extend :class:`python:abc.ABC` should be included in results.
+    :return: Tuple of (dict containing the Commands loaded from the given file, the reason that the file needed to be
+      imported).  The reason will be None if the Commands were discovered without importing the file.
+    """
+    path = Path(path)
+    try:
+        module = _load_module_statically(path)
+    except _ImportRequired as e:
+        reason = str(e)
+        log.debug(f'Importing {path.as_posix()} to load Commands: {reason}')
+        return load_commands(path, top_only, include_abc), reason
+
+    return _module_commands(module, top_only, include_abc), None
+
+
+class _ImportRequired(Exception):
+    """Raised when Commands cannot be discovered statically"""
+
+
+def _load_module_statically(path: Path) -> ModuleType:
+    src_path = path.joinpath('__init__.py') if path.is_dir() else path
+    try:
+        tree = ast.parse(src_path.read_bytes(), src_path.as_posix())
+    except (SyntaxError, ValueError) as e:
+        raise _ImportRequired(f'unable to parse the file: {e}') from e
+
+    body = _StaticModuleBuilder().build(tree)
+    module = ModuleType(_module_name(path))
+    module.__file__ = str(src_path)
+    sys.modules[module.__name__] = module  # This is required for the program metadata introspection
+    try:
+        code = compile(ast.fix_missing_locations(ast.Module(body=body, type_ignores=[])), str(src_path), 'exec')
+        with Context(allow_argv_prog=False):
+            exec(code, module.__dict__)  # noqa: S102
+    except Exception as e:
+        del sys.modules[module.__name__]
+        raise _ImportRequired(f'unable to define Commands statically: {e!r}') from e
+
+    return module
+
+
+#: Standard library modules that should not be imported, even if they were imported by a script
+_UNSAFE_STDLIB_MODULES = frozenset({'__main__', 'antigravity', 'this'})
+#: Builtins that are referenced by Parameter declarations or method decorators often enough to support them
+_SAFE_BUILTINS = frozenset(
+    {
+        'bool', 'bytes', 'complex', 'dict', 'float', 'frozenset', 'int', 'list', 'object', 'range', 'set', 'str',
+        'tuple', 'classmethod', 'property', 'staticmethod', '__doc__', '__file__', '__name__',
+    }
+)  # fmt: skip
+#: Callables outside of cli_command_parser's own classes that can be called by constants or Command definitions without
+#: side effects.  Calls to anything else (including other standard library classes) cause the statement to be skipped.
+_PURE_CALLABLES = frozenset(
+    {
+        re.compile, Path, PurePath, PurePosixPath, PureWindowsPath, date, datetime, time, timedelta,
+        enum.Enum, enum.Flag, enum.IntEnum, enum.IntFlag, enum.auto, before_main, after_main,
+    }
+)  # fmt: skip
+
+
+class _StaticModuleBuilder:
+    """
+    Builds the body of a module that only contains the statements from the original module that are required to
+    define its Command classes.  Raises :class:`_ImportRequired` when those statements cannot be safely identified.
+    """
+
+    __slots__ = (
+        'safe_names',
+        'type_check_names',
+        'objects',
+        'cli_names',
+        'command_names',
+        'class_names',
+        'skipped_names',
+    )
+
+    def __init__(self):
+        self.safe_names = set(_SAFE_BUILTINS)  # Names that will be defined in the built module
+        self.type_check_names = set()  # Names that are only defined when TYPE_CHECKING is True
+        self.objects: dict[str, Any] = {}  # Objects that were imported from safe modules
+        self.cli_names: set[str] = set()  # Names of objects that were imported from cli_command_parser
+        self.command_names: set[str] = set()  # Names of Command classes defined in this module
+        # Names of classes that are safe to instantiate: builtins, and classes that were defined in this module
+        self.class_names = {name for name in _SAFE_BUILTINS if not name.startswith('__')}
+        self.skipped_names: set[str] = set()  # Names defined by skipped statements
+
+    def build(self, tree: ast.Module) -> list[ast.stmt]:
+        body = []
+        for node in tree.body:
+            if (kept := self._process_statement(node)) is not None:
+                body.append(kept)
+        return body
+
+    # region Module-Level Statements
+
+    def _process_statement(self, node: ast.stmt) -> ast.stmt | None:
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):  # A docstring
+            return node
+        elif isinstance(node, ast.Import):
+            return self._process_import(node)
+        elif isinstance(node, ast.ImportFrom):
+            return self._process_import_from(node)
+        elif isinstance(node, ast.ClassDef):
+            return self._process_class(node)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)) and self._is_constant(node):
+            self._define_local(_target_names(node))
+            return node
+        elif isinstance(node, ast.If) and _is_type_checking_check(node.test):
+            self.type_check_names.update(_bound_names(node))
+            return None
+        elif isinstance(node, ast.If) and _is_main_check(node.test):
+            return None
+
+        self._skip(node)
+        return None
+
+    def _process_import(self, node: ast.Import) -> ast.stmt | None:
+        aliases = []
+        for alias in node.names:
+            name = alias.asname or alias.name.partition('.')[0]
+            if _is_safe_module(alias.name):
+                self._define((name,))
+                self.objects[name] = _import_module(alias.name if alias.asname else name)
+                if name == 'cli_command_parser' or alias.name.startswith('cli_command_parser.'):
+                    self.cli_names.add(name)
+                aliases.append(alias)
+            else:  # A module can't be a Command, so it only matters if it's referenced by a Command definition
+                self._skip_names((name,))
+
+        return ast.Import(names=aliases) if aliases else None
+
+    def _process_import_from(self, node: ast.ImportFrom) -> ast.stmt | None:
+        mod_name = node.module or ''
+        if node.level or not _is_safe_module(mod_name):
+            for alias in node.names:
+                name = alias.asname or alias.name
+                if alias.name == '*' or _may_be_class(name):
+                    raise _ImportRequired(f'{alias.name!r} was imported from {"." * node.level}{mod_name}')
+                self._skip_names((name,))
+            return None
+
+        module = _import_module(mod_name)
+        names = []
+        for alias in node.names:
+            if alias.name == '*':
+                star_names = getattr(module, '__all__', None) or [key for key in vars(module) if key[0] != '_']
+                self.objects.update((name, getattr(module, name)) for name in star_names)
+                names.extend(star_names)
+            else:
+                names.append(name := alias.asname or alias.name)
+                try:
+                    self.objects[name] = getattr(module, alias.name)
+                except AttributeError:  # It may be a submodule
+                    self.objects[name] = _import_module(f'{mod_name}.{alias.name}')
+
+        self._define(names)
+        if mod_name.partition('.')[0] == 'cli_command_parser':
+            self.cli_names.update(names)
+
+        return node
+
+    def _skip(self, node: ast.stmt):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            # The function body is not evaluated, but decorators and default values are
+            exprs = [*node.decorator_list, *node.args.defaults, *filter(None, node.args.kw_defaults)]
+            names = (node.name,)
+        else:
+            exprs = [node]
+            names = _bound_names(node)
+            if any(isinstance(n, ast.ClassDef) for n in ast.walk(node)):
+                raise _ImportRequired(f'a class is conditionally defined on line {node.lineno}')
+
+        if command_names := self.command_names.union(self.cli_names).intersection(_referenced_names(exprs)):
+            name_str = ', '.join(sorted(command_names))
+            raise _ImportRequired(f'module-level code on line {node.lineno} uses {name_str}')
+
+        self._skip_names(names)
+
+    def _define(self, names: Iterable[str]):
+        self.safe_names.update(names)
+        self.skipped_names.difference_update(names)
+        self.command_names.difference_update(names)
+        self.class_names.difference_update(names)
+
+    def _define_local(self, names: Iterable[str]):
+        """Define names that are bound by a kept statement in the module itself, which may shadow imported names"""
+        self._define(names)
+        self.cli_names.difference_update(names)
+        for name in names:
+            self.objects.pop(name, None)
+
+    def _skip_names(self, names: Iterable[str]):
+        self.safe_names.difference_update(names)
+        self.command_names.difference_update(names)
+        self.class_names.difference_update(names)
+        self.cli_names.difference_update(names)
+        self.skipped_names.update(names)
+        for name in names:
+            self.objects.pop(name, None)
+
+    # endregion
+
+    # region Classes
+
+    def _process_class(self, node: ast.ClassDef) -> ast.ClassDef | None:
+        is_command = False
+        for base in node.bases:
+            if not self._is_safe(base):
+                raise _ImportRequired(f'unable to resolve a base class for {node.name} on line {node.lineno}')
+            is_command = is_command or self._is_command_base(base)
+
+        exprs = [*node.bases, *node.keywords, *node.decorator_list]
+        if not is_command:
+            # Other classes are only needed if they are referenced as a Parameter type, choices, etc.  They are only
+            # kept when they don't define any methods, such as an Enum.
+            try:
+                self._check_exprs(node, exprs, self.safe_names)
+                self._process_class_body(node, node.body, set(), set(), False)
+            except _ImportRequired:
+                self._skip_names((node.name,))
+                return None
+
+            self._define_local((node.name,))
+            if all(self._is_pure_call(base) for base in node.bases):
+                self.class_names.add(node.name)
+            return node
+
+        if any(isinstance(n, ast.FunctionDef) and n.name == '__init_subclass__' for n in node.body):
+            raise _ImportRequired(f'{node.name} defines __init_subclass__')
+
+        self._check_exprs(node, exprs, self.safe_names)
+        body = self._process_class_body(node, node.body, set(), set(), True)
+        self._define_local((node.name,))
+        self.command_names.add(node.name)
+        if all(self._is_pure_call(base) for base in node.bases):  # Its methods are replaced with stubs
+            self.class_names.add(node.name)
+        return ast.ClassDef(
+            name=node.name,
+            bases=node.bases,
+            keywords=node.keywords,
+            body=body,
+            decorator_list=node.decorator_list,
+            **_type_params(node),
+        )
+
+    def _process_class_body(
+        self, cls: ast.ClassDef, body: list[ast.stmt], names: set[str], callables: set[str], allow_methods: bool
+    ) -> list[ast.stmt]:
+        """
+        :param cls: The class that is being processed
+        :param body: The statements in the class body (or in a ``with`` block in the class body) to process
+        :param names: Names that were defined earlier in the class body
+        :param callables: Names that were defined earlier in the class body that can be called without side effects,
+          such as Parameters (e.g., ``@action(...)``) and stubbed methods
+        :param allow_methods: Whether methods may be defined in the class
+        :return: The statements that should be kept
+        """
+        processed = []
+        for node in body:
+            safe_names = self.safe_names.union(names)
+            if isinstance(node, ast.Pass) or (isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)):
+                processed.append(node)
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                if not all(isinstance(target, ast.Name) for target in targets):
+                    raise _ImportRequired(f'unsupported assignment in {cls.name} on line {node.lineno}')
+                if isinstance(node, ast.AnnAssign) and not self._is_safe_annotation(node.annotation, safe_names):
+                    raise _ImportRequired(f'unable to resolve an annotation in {cls.name} on line {node.lineno}')
+                self._check_exprs(cls, [node.value] if node.value else [], safe_names, callables)
+                target_names = {target.id for target in targets}  # type: ignore[attr-defined]
+                names.update(target_names)
+                if isinstance(node.value, ast.Call):  # Its value was created by a call that was checked above
+                    callables.update(target_names)
+                else:  # It may be an alias for something that is unsafe to call
+                    callables.difference_update(target_names)
+                processed.append(node)
+            elif isinstance(node, ast.With):
+                # A ParamGroup
+                self._check_exprs(cls, [item.context_expr for item in node.items], safe_names, callables)
+                for item in node.items:
+                    if item.optional_vars is not None:
+                        if not isinstance(item.optional_vars, ast.Name):
+                            raise _ImportRequired(f'unsupported with statement in {cls.name} on line {node.lineno}')
+                        names.add(item.optional_vars.id)
+                        callables.add(item.optional_vars.id)
+                with_body = self._process_class_body(cls, node.body, names, callables, allow_methods)
+                processed.append(ast.With(items=node.items, body=with_body, type_comment=None))
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and allow_methods:
+                # Decorators may register methods as actions or action flags, so they are preserved
+                self._check_exprs(cls, node.decorator_list, safe_names, callables)
+                names.add(node.name)
+                callables.add(node.name)
+                processed.append(_stub_function(node))
+            else:
+                raise _ImportRequired(f'unsupported statement in {cls.name} on line {node.lineno}')
+
+        return processed
+
+    def _is_command_base(self, base: ast.expr) -> bool:
+        if isinstance(base, ast.Name) and base.id in self.command_names:
+            return True
+        return isinstance(self._resolve(base), CommandMeta)
+
+    def _resolve(self, node: ast.expr) -> Any:
+        if isinstance(node, ast.Name):
+            return self.objects.get(node.id)
+        elif isinstance(node, ast.Attribute):
+            return getattr(self._resolve(node.value), node.attr, None)
+        return None
+
+    # endregion
+
+    # region Expressions
+
+    def _is_constant(self, node: ast.Assign | ast.AnnAssign) -> bool:
+        if node.value is None or not self._is_safe(node.value):
+            return False
+        elif not all(isinstance(target, ast.Name) for target in _targets(node)):
+            return False
+        return all(self._is_pure_call(call.func) for call in _calls(node.value))
+
+    def _is_pure_call(self, func: ast.expr, callables: Collection[str] = ()) -> bool:
+        """
+        Whether calling the given function is known to have no side effects.  Only classes defined in this module,
+        cli_command_parser classes, and an explicit allowlist of builtins and standard library callables are accepted
+        here - other callables (including standard library classes like :class:`python:subprocess.Popen`) are not.
+
+        :param func: The function that is being called
+        :param callables: Names defined in a Command's body that can be called without side effects
+        :return: True if the call is safe to evaluate, False otherwise
+        """
+        if isinstance(func, ast.Name) and func.id not in self.objects:
+            return func.id in self.class_names or func.id in callables
+
+        attrs = []
+        root = func
+        while isinstance(root, ast.Attribute):
+            attrs.append(root.attr)
+            root = root.value
+        if isinstance(root, ast.Name) and root.id not in self.objects:
+            # Methods of Parameters that were defined in a Command, such as ``@Foo.sub_cmd.register(...)``
+            if root.id in callables:
+                return True
+            attr = attrs[-1]
+            return root.id in self.command_names and len(attrs) > 1 and not hasattr(Command, attr)
+
+        return _is_pure_callable(self._resolve(func))
+
+    def _check_exprs(
+        self,
+        cls: ast.ClassDef,
+        exprs: Iterable[ast.expr | ast.keyword],
+        safe_names: set[str],
+        callables: Collection[str] = (),
+    ):
+        for expr in exprs:
+            if not self._is_safe(expr, safe_names):
+                if names := self.skipped_names.intersection(_referenced_names([expr])):
+                    name_str = ', '.join(sorted(names))
+                    raise _ImportRequired(f'{cls.name} on line {expr.lineno} references {name_str}')
+                raise _ImportRequired(f'unable to resolve an expression in {cls.name} on line {expr.lineno}')
+            for call in _calls(expr):
+                if not self._is_pure_call(call.func, callables):
+                    func = ast.unparse(call.func)
+                    raise _ImportRequired(f'{cls.name} on line {call.lineno} calls {func}, which may have side effects')
+
+    def _is_safe(self, node: ast.AST, safe_names: set[str] | None = None) -> bool:
+        """Whether the given expression only references names that will be defined in the built module"""
+        if safe_names is None:
+            safe_names = self.safe_names
+
+        if isinstance(node, ast.Name):
+            return node.id in safe_names
+        elif isinstance(node, (ast.Lambda, ast.NamedExpr, ast.Await, ast.Yield, ast.YieldFrom, _Comprehension)):
+            return False
+
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.keyword):
+                child = child.value
+            if isinstance(child, ast.expr) and not self._is_safe(child, safe_names):
+                return False
+
+        return True
+
+    def _is_safe_annotation(self, node: ast.expr, safe_names: set[str]) -> bool:
+        # Names that are only imported when TYPE_CHECKING is True would not be defined at runtime when imported either
+        safe_names = safe_names.union(self.type_check_names)
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):  # A forward reference
+            try:
+                node = ast.parse(node.value, mode='eval').body
+            except SyntaxError:
+                return False
+        return self._is_safe(node, safe_names)
+
+    # endregion
+
+
+_Comprehension = (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+
+
+def _calls(node: ast.AST) -> Iterator[ast.Call]:
+    return (child for child in ast.walk(node) if isinstance(child, ast.Call))
+
+
+def _is_pure_callable(obj: Any) -> bool:
+    if isinstance(obj, type) and obj.__module__.partition('.')[0] == 'cli_command_parser':
+        return True
+    try:
+        return obj in _PURE_CALLABLES
+    except TypeError:  # It is not hashable
+        return False
+
+
+def _is_safe_module(name: str) -> bool:
+    root = name.partition('.')[0]
+    if root == 'cli_command_parser':
+        return True
+    return root in sys.stdlib_module_names and root not in _UNSAFE_STDLIB_MODULES
+
+
+def _may_be_class(name: str) -> bool:
+    """Names that are not all lower case or all upper case may be classes, which may be Commands"""
+    return not (name.islower() or name.isupper())
+
+
+def _is_type_checking_check(node: ast.expr) -> bool:
+    if isinstance(node, ast.Attribute):
+        return node.attr == 'TYPE_CHECKING'
+    return isinstance(node, ast.Name) and node.id == 'TYPE_CHECKING'
+
+
+def _is_main_check(node: ast.expr) -> bool:
+    if not (isinstance(node, ast.Compare) and len(node.comparators) == 1 and isinstance(node.ops[0], ast.Eq)):
+        return False
+    values = {node.left, node.comparators[0]}
+    names = {n.id for n in values if isinstance(n, ast.Name)}
+    constants = {n.value for n in values if isinstance(n, ast.Constant)}
+    return names == {'__name__'} and constants == {'__main__'}
+
+
+def _targets(node: ast.Assign | ast.AnnAssign) -> list[ast.expr]:
+    return node.targets if isinstance(node, ast.Assign) else [node.target]
+
+
+def _target_names(node: ast.Assign | ast.AnnAssign) -> list[str]:
+    return [target.id for target in _targets(node)]  # type: ignore[attr-defined]
+
+
+def _bound_names(node: ast.stmt) -> set[str]:
+    names = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name) and isinstance(child.ctx, (ast.Store, ast.Del)):
+            names.add(child.id)
+        elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(child.name)
+        elif isinstance(child, (ast.Import, ast.ImportFrom)):
+            names.update(alias.asname or alias.name.partition('.')[0] for alias in child.names)
+    return names
+
+
+def _referenced_names(nodes: Iterable[ast.AST]) -> set[str]:
+    return {child.id for node in nodes for child in ast.walk(node) if isinstance(child, ast.Name)}
+
+
+def _stub_function(node: ast.FunctionDef | ast.AsyncFunctionDef) -> ast.FunctionDef | ast.AsyncFunctionDef:
+    """Replace the body of the given function with its docstring (if any) and replace its args with *args, **kwargs"""
+    body: list[ast.stmt] = [ast.Pass()]
+    if (doc_str := ast.get_docstring(node, clean=False)) is not None:
+        body.insert(0, ast.Expr(ast.Constant(doc_str)))
+
+    args = ast.arguments(
+        posonlyargs=[],
+        args=[],
+        vararg=ast.arg('args'),
+        kwonlyargs=[],
+        kw_defaults=[],
+        kwarg=ast.arg('kwargs'),
+        defaults=[],
+    )
+    return node.__class__(  # type: ignore[call-arg]
+        name=node.name, args=args, body=body, decorator_list=node.decorator_list, returns=None, **_type_params(node)
+    )
+
+
+def _type_params(node: ast.AST) -> dict[str, Any]:
+    # The type_params field was added in Python 3.12
+    return {'type_params': node.type_params} if hasattr(node, 'type_params') else {}
+
+
+# endregion
+
+
 class RstWriter:
     """
     A helper class for generating RST documentation for a Python package and/or scripts containing Commands.
@@ -194,6 +731,13 @@ class RstWriter:
     :param module_template: The format string to use when generating RST for Python modules.
     :param skip_modules: A collection of module names (using ``package.module`` notation) that should be skipped
       when documenting a Python package via :meth:`.document_package`.  Supports fnmatch / glob wildcards.
+    :param workers: If a value greater than 1 is provided, then scripts will be rendered in parallel by up to this
+      many worker processes when documenting multiple scripts via :meth:`.document_scripts`.  All keyword arguments
+      passed to that method must be picklable when this is enabled.
+    :param skip_unchanged: If True (the default), then files that already contain the exact content that would be
+      written to them are not re-written, so their modification times are preserved for incremental Sphinx builds.
+    :param static: If True, then Commands in scripts will be discovered via :func:`discover_commands`, which avoids
+      importing scripts when possible.  Scripts that needed to be imported are recorded in :attr:`.imported_scripts`.
     """
 
     def __init__(
@@ -206,6 +750,9 @@ class RstWriter:
         ext: str = '.rst',
         module_template: str = MODULE_TEMPLATE,
         skip_modules: Strings | None = None,
+        workers: int | None = None,
+        skip_unchanged: Bool = True,
+        static: Bool = False,
     ):
         self.output_dir = Path(output_dir)
         self.dry_run = dry_run
@@ -214,6 +761,11 @@ class RstWriter:
         self.ext = ext
         self.module_template = module_template
         self.skip_modules = set(skip_modules) if skip_modules else set()
+        self.workers = workers
+        self.skip_unchanged = skip_unchanged
+        self.static = static
+        #: When ``static`` is True, this maps the paths of scripts that needed to be imported to the reason why
+        self.imported_scripts: dict[Path, str] = {}
 
     def document_script(
         self,
@@ -242,17 +794,9 @@ class RstWriter:
         :param kwargs: Additional keyword arguments to pass to :func:`render_script_rst`
         :return: The stem of the file name that was used when saving the RST content for the given script.
         """
-        if name:
-            kwargs['fix_name_func'] = lambda n: name
-            rst_name = Path(name).stem
-        else:
-            rst_name = path.stem
-
-        rst_str = render_script_rst(path, top_only=top_only, **kwargs)
-        if replacements:
-            for key, val in replacements.items():
-                rst_str = rst_str.replace(key, val)
-
+        kwargs.setdefault('static', self.static)
+        rst_name, rst_str, import_reason = _render_script(path, name, replacements, top_only, **kwargs)
+        self._record_import(path, import_reason)
         self.write_rst(rst_name, rst_str, subdir)
         return rst_name
 
@@ -268,13 +812,38 @@ class RstWriter:
         caption: OptStr = None,
         **kwargs,
     ):
-        names = [self.document_script(path, subdir, top_only=top_only, **kwargs) for path in paths]
+        if self.workers and self.workers > 1:
+            names = self._document_scripts_in_parallel(paths, subdir, top_only, **kwargs)
+        else:
+            names = [self.document_script(path, subdir, top_only=top_only, **kwargs) for path in paths]
+
         if index_name or index_header or index_subdir:
             name: str = index_name or subdir or index_header or index_subdir  # type: ignore[assignment]
             self.write_index(
                 name, index_header or name.title(), names, content_subdir=subdir, caption=caption, subdir=index_subdir
             )
 
+    def _document_scripts_in_parallel(
+        self, paths: Iterable[Path], subdir: OptStr = None, top_only: Bool = True, **kwargs
+    ) -> list[str]:
+        # Each script is imported and rendered in a worker process, but files are written by this process, in order
+        kwargs.setdefault('static', self.static)
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [(path, executor.submit(_render_script, path, top_only=top_only, **kwargs)) for path in paths]
+            names = []
+            for path, future in futures:
+                rst_name, rst_str, import_reason = future.result()
+                self._record_import(path, import_reason)
+                self.write_rst(rst_name, rst_str, subdir)
+                names.append(rst_name)
+
+        return names
+
+    def _record_import(self, path: Path, import_reason: OptStr):
+        if import_reason:
+            log.info(f'Imported {path.as_posix()} to load Commands: {import_reason}')
+            self.imported_scripts[path] = import_reason
+
     def document_module(self, module: str, subdir: OptStr = None):
         """
         Generate an RST file to document a Python module.
@@ -392,10 +961,63 @@ class RstWriter:
         if not self.dry_run and not target_dir.exists():
             target_dir.mkdir(parents=True)
 
-        prefix = '[DRY RUN] Would write' if self.dry_run else 'Writing'
         path = target_dir.joinpath(name + self.ext)
+        data = self._encode(content)
+        if self.skip_unchanged and _has_content(path, data):
+            log.debug(f'Skipping unchanged {path.as_posix()}')
+            return
+
+        prefix = '[DRY RUN] Would write' if self.dry_run else 'Writing'
         log.debug(f'{prefix} {path.as_posix()}')
         if not self.dry_run:
-            # Path.write_text on 3.9 does not support `newline`
-            with path.open('w', encoding=self.encoding, newline=self.newline) as f:
-                f.write(content)
+            path.write_bytes(data)
+
+    def _encode(self, content: str) -> bytes:
+        """Encode the given content the same way that it would be if it were written to a file in text mode"""
+        newline = os.linesep if self.newline is None else self.newline
+        if newline and newline != '\n':
+            content = content.replace('\n', newline)
+        return content.encode(self.encoding)
+
+
+def _render_script(
+    path: Path,
+    name: OptStr = None,
+    replacements: Mapping[str, str] | None = None,
+    top_only: Bool = True,
+    static: Bool = False,
+    **kwargs,
+) -> tuple[str, str, OptStr]:
+    """
+    Render RST for the given script.  Defined at the module level so that it can be called in worker processes.
+
+    :return: Tuple of (rst_name, rst_str, import_reason), where ``import_reason`` is only populated if ``static`` was
+      True and the script needed to be imported.
+    """
+    if name:
+        kwargs['fix_name_func'] = lambda n: name
+        rst_name = Path(name).stem
+    else:
+        rst_name = path.stem
+
+    if static:
+        commands, import_reason = discover_commands(path, top_only)
+    else:
+        commands, import_reason = load_commands(path, top_only), None
+
+    rst_str = _render_commands_rst(commands, **kwargs)
+    if replacements:
+        for key, val in replacements.items():
+            rst_str = rst_str.replace(key, val)
+
+    return rst_name, rst_str, import_reason
+
+
+def _has_content(path: Path, data: bytes) -> bool:
+    """Whether the file with the given path already contains the given data"""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:  # The file does not exist, or it could not be read
+        return False
@@ -5,7 +5,6 @@ Platform-agnostic error handling framework / handlers.
 from __future__ import annotations
 
 import sys
-from collections import ChainMap
 from typing import TYPE_CHECKING, Callable, Iterator, Type, TypeVar
 
 from ..exceptions import CommandParserException
@@ -19,21 +18,37 @@ E = TypeVar('E', bound=BaseException)
 HandlerFunc = Callable[[E], bool | int | None]
 HandlerDecorator = Callable[[HandlerFunc], HandlerFunc]
 
+# Incremented when a class-level handler is registered, so that handler lists cached by every ErrorHandler are rebuilt
+_cls_handler_generation = 0
+
 
 class ErrorHandler:
-    __slots__ = ('exc_handler_map',)
+    __slots__ = ('exc_handler_map', '_handler_cache', '_cache_generation')
     _exc_handler_map: dict[Type[BaseException], Handler] = {}
     exc_handler_map: dict[Type[BaseException], Handler]
+    _handler_cache: dict[Type[BaseException], tuple[HandlerFunc, ...]]
 
     def __init__(self):
         self.exc_handler_map = {}
+        self._handler_cache = {}
+        self._cache_generation = _cls_handler_generation
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__}[handlers={len(self.exc_handler_map)}]>'
 
+    def __getstate__(self) -> dict[str, dict[Type[BaseException], Handler]]:
+        # The handler cache is excluded since it is only a cache
+        return {'exc_handler_map': self.exc_handler_map}
+
+    def __setstate__(self, state: dict[str, dict[Type[BaseException], Handler]]):
+        self.exc_handler_map = state['exc_handler_map']
+        self._handler_cache = {}
+        self._cache_generation = _cls_handler_generation
+
     def register(self, handler: HandlerFunc, *exceptions: Type[E]):
         for exc in exceptions:
             self.exc_handler_map[exc] = Handler(exc, handler)
+        self._handler_cache.clear()
 
     def unregister(self, *exceptions: Type[BaseException]):
         for exc in exceptions:
@@ -41,6 +56,7 @@ class ErrorHandler:
                 del self.exc_handler_map[exc]
             except KeyError:
                 pass
+        self._handler_cache.clear()
 
     def __call__(self, *exceptions: Type[BaseException]) -> HandlerDecorator:
         def _handler(handler: HandlerFunc) -> HandlerFunc:
@@ -52,23 +68,40 @@ class ErrorHandler:
     @classmethod
     def cls_handler(cls, *exceptions: Type[E]) -> HandlerDecorator:
         def _cls_handler(handler: HandlerFunc) -> HandlerFunc:
+            global _cls_handler_generation
             for exc in exceptions:
                 cls._exc_handler_map[exc] = Handler(exc, handler)
+            _cls_handler_generation += 1
             return handler
 
         return _cls_handler
 
     def iter_handlers(self, exc_type: Type[BaseException], exc: BaseException) -> Iterator[HandlerFunc]:
-        exc_handler_map = ChainMap(self.exc_handler_map, self._exc_handler_map)
+        """
+        :param exc_type: The type of the exception that was raised
+        :param exc: The exception that was raised
+        :return: An iterator that yields the registered handlers that may handle the given exception, from the most
+          specific to the least specific exception class.  Handlers registered on this ErrorHandler take precedence
+          over class-level handlers for the same exception class.
+        """
+        if self._cache_generation != _cls_handler_generation:
+            self._handler_cache.clear()
+            self._cache_generation = _cls_handler_generation
+
         try:
-            yield exc_handler_map[exc_type].handler
+            handlers = self._handler_cache[exc_type]
         except KeyError:
-            pass
-        candidates = sorted(
-            handler for ec, handler in exc_handler_map.items() if ec is not exc_type and isinstance(exc, ec)
-        )
-        for candidate in candidates:
-            yield candidate.handler
+            self._handler_cache[exc_type] = handlers = self._get_handlers(exc_type)
+
+        return iter(handlers)
+
+    def _get_handlers(self, exc_type: Type[BaseException]) -> tuple[HandlerFunc, ...]:
+        exc_handler_map = {**self._exc_handler_map, **self.exc_handler_map}
+        # Walking the MRO orders handlers from the most specific to the least specific exception class
+        handlers = [handler for ec in exc_type.__mro__ if (handler := exc_handler_map.pop(ec, None))]
+        # Handlers for classes that are not in the MRO may still match, such as for ABCs with registered subclasses
+        handlers.extend(sorted(handler for ec, handler in exc_handler_map.items() if issubclass(exc_type, ec)))
+        return tuple(handler.handler for handler in handlers)
 
     def __enter__(self) -> Self:
         return self
@@ -7,7 +7,8 @@ Exceptions for Command Parser
 from __future__ import annotations
 
 import sys
-from typing import TYPE_CHECKING, Any, Collection, Mapping
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, Collection, Mapping
 
 from .utils import _parse_tree_target_repr
 
@@ -37,6 +38,8 @@ __all__ = [
     'NoActiveContext',
 ]
 
+Suggester = Callable[[str], Collection[str]]
+
 
 class CommandParserException(Exception):
     """Base class for all other Command Parser exceptions"""
@@ -210,13 +213,30 @@ class BadArgument(ParamUsageError):
 class InvalidChoice(BadArgument):
     """Error raised when a value that does not match one of the pre-defined choices was provided for a Parameter"""
 
-    def __init__(self, param: Parameter | None, invalid: Any, choices: Collection[Any], env_var: str | None = None):
-        src = f' from env var={env_var!r}' if env_var else ''
-        if isinstance(invalid, Collection) and not isinstance(invalid, str):
-            bad_str = f'choices{src}: {", ".join(map(repr, invalid))}'
+    def __init__(
+        self,
+        param: Parameter | None,
+        invalid: Any,
+        choices: Collection[Any],
+        env_var: str | None = None,
+        suggest: Suggester | None = None,
+    ):
+        super().__init__(param)
+        self.invalid = invalid
+        self.choices = choices
+        self.env_var = env_var
+        self.suggest = suggest
+
+    @cached_property
+    def message(self) -> str:  # type: ignore[override]
+        # This is computed lazily since this exception is frequently raised and handled while parsing
+        src = f' from env var={self.env_var!r}' if self.env_var else ''
+        if isinstance(self.invalid, Collection) and not isinstance(self.invalid, str):
+            bad_str = f'choices{src}: {", ".join(map(repr, self.invalid))}'
         else:
-            bad_str = f'choice{src}: {invalid!r}'
-        super().__init__(param, f'invalid {bad_str} (choose from: {", ".join(map(repr, choices))})')
+            bad_str = f'choice{src}: {self.invalid!r}'
+        choices_str = ', '.join(map(repr, self.choices))
+        return f'invalid {bad_str} (choose from: {choices_str}){format_suggestions(self.suggest, self.invalid)}'
 
 
 class MissingArgument(BadArgument):
@@ -236,6 +256,16 @@ class TooManyArguments(BadArgument):
 class NoSuchOption(UsageError):
     """Error raised when an option that was not defined as a Parameter was provided"""
 
+    def __init__(self, message: str, invalid: Collection[str] = (), suggest: Suggester | None = None):
+        super().__init__(message)
+        self.message = message
+        self.invalid = invalid
+        self.suggest = suggest
+
+    def __str__(self) -> str:
+        options = (arg.split('=', 1)[0] for arg in self.invalid if arg.startswith('-'))
+        return self.message + format_suggestions(self.suggest, options)
+
 
 class NoActiveContext(CommandParserException, RuntimeError):
     """Raised when attempting to perform an action that requires an active context while no context is active."""
@@ -243,7 +273,7 @@ class NoActiveContext(CommandParserException, RuntimeError):
 
 # endregion
 
-# region Internal Exceptions
+# region Internal Exceptions / Helpers
 
 
 class Backtrack(CommandParserException):
@@ -254,4 +284,20 @@ class NextCommand(CommandParserException):
     """Raised by the parser to advance to the next Command in certain cases.  Only used internally."""
 
 
+def format_suggestions(suggest: Suggester | None, invalid: Any) -> str:
+    """
+    :param suggest: A callable that returns suggestions for a single invalid value
+    :param invalid: One or more invalid values
+    :return: A "did you mean" suffix for an error message, or an empty string if there were no suggestions
+    """
+    if suggest is None:
+        return ''
+    values = (invalid,) if isinstance(invalid, str) else invalid
+    try:
+        suggestions = dict.fromkeys(s for value in values for s in suggest(value))
+    except TypeError:  # The invalid value was not iterable
+        return ''
+    return f' - did you mean: {", ".join(map(repr, suggestions))}?' if suggestions else ''
+
+
 # endregion
@@ -6,9 +6,14 @@ Command usage / help text formatters
 
 from __future__ import annotations
 
+import os
+import shlex
+import sys
+from contextlib import contextmanager
 from functools import cached_property
+from subprocess import PIPE, Popen
 from textwrap import TextWrapper
-from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Type, TypeAlias
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, TextIO, Type, TypeAlias
 
 from ..context import NoActiveContext, ctx
 from ..core import get_metadata, get_params
@@ -16,7 +21,7 @@ from ..parameters.choice_map import ChoiceMap
 from ..parameters.groups import ParamGroup
 from ..utils import _NotSet, camel_to_snake_case
 from .restructured_text import spaced_rst_header
-from .utils import PartWrapper
+from .utils import PartWrapper, _bind_help_context, _help_context
 
 if TYPE_CHECKING:
     from ..command_parameters import CommandParameters
@@ -98,30 +103,66 @@ class CommandHelpFormatter:
         allow_sys_argv: Bool = True,
         cont_indent: int = 4,
     ) -> str:
-        if (wrap_usage_str := ctx.config.wrap_usage_str) is True:  # noqa
-            # `is True` is used because it supports True -> term width or an explicit width
-            wrap_usage_str = ctx.terminal_width
-
-        if usage := self._meta.usage:
+        with _bind_help_context():
+            context = _help_context()
+            if (wrap_usage_str := context.config.wrap_usage_str) is True:  # noqa
+                # `is True` is used because it supports True -> term width or an explicit width
+                wrap_usage_str = context.terminal_width
+
+            if usage := self._meta.usage:
+                if wrap_usage_str:
+                    wrapper = TextWrapper(width=wrap_usage_str, subsequent_indent=' ' * cont_indent)
+                    return '\n'.join(wrapper.wrap(usage))
+                return usage
+
+            parts = self._usage_parts(sub_cmd_choice, allow_sys_argv)
             if wrap_usage_str:
-                return '\n'.join(TextWrapper(width=wrap_usage_str, subsequent_indent=' ' * cont_indent).wrap(usage))
-            return usage
-
-        parts = self._usage_parts(sub_cmd_choice, allow_sys_argv)
-        if wrap_usage_str:
-            return PartWrapper(wrap_usage_str, cont_indent, delim).join('', parts)
-        return delim.join(parts)
+                return PartWrapper(wrap_usage_str, cont_indent, delim).join('', parts)
+            return delim.join(parts)
 
     def format_help(self, allow_sys_argv: Bool = True) -> str:
-        parts = [self.format_usage(allow_sys_argv=allow_sys_argv), '']
-        if description := self._meta.description:
-            parts += [description, '']
-
-        parts.extend(group.formatter.format_help() for group in self.groups if group.show_in_help)
-        if epilog := self._meta.format_epilog(ctx.config.extended_epilog, allow_sys_argv):
-            parts.append(epilog)
+        return '\n'.join(self.iter_help(allow_sys_argv))
+
+    def iter_help(self, allow_sys_argv: Bool = True) -> Iterator[str]:
+        """
+        Generate the help text for the Command associated with this formatter in chunks.  When joined with newlines,
+        the chunks are equivalent to the result of :meth:`.format_help`.
+        """
+        with _bind_help_context():
+            yield self.format_usage(allow_sys_argv=allow_sys_argv)
+            yield ''
+            if description := self._meta.description:
+                yield description
+                yield ''
 
-        return '\n'.join(parts)
+            for group in self.groups:
+                if group.show_in_help:
+                    yield from group.formatter.iter_help()
+
+            if epilog := self._meta.format_epilog(_help_context().config.extended_epilog, allow_sys_argv):
+                yield epilog
+
+    def write_help(self, file: TextIO | None = None, allow_sys_argv: Bool = True, pager: Bool | None = None):
+        """
+        Write the help text for the Command associated with this formatter to the given stream as it is generated,
+        instead of building the full help text in memory first.
+
+        :param file: The file-like object (stream) to write to; defaults to the current sys.stdout.
+        :param allow_sys_argv: Whether the program name may be determined based on ``sys.argv``
+        :param pager: Whether the help text should be written to a pager when the output stream is a terminal.  Defaults
+          to the configured :attr:`~.CommandConfig.help_pager` value.
+        """
+        if pager is None:
+            pager = ctx.config.help_pager
+
+        with _output_stream(file or sys.stdout, pager) as stream:
+            write = stream.write
+            chunks = self.iter_help(allow_sys_argv)
+            write(next(chunks))
+            for chunk in chunks:
+                write('\n')
+                write(chunk)
+            write('\n')
 
     # region RST Formatting
 
@@ -229,6 +270,41 @@ class CommandHelpFormatter:
     # endregion
 
 
+@contextmanager
+def _output_stream(file: TextIO, pager: Bool) -> Iterator[TextIO]:
+    """
+    If the pager is enabled and the given stream is a terminal, then this yields the stdin stream for a pager process,
+    otherwise it yields the given stream.  The pager command is read from the ``PAGER`` environment variable.
+    """
+    if not pager or not _is_tty(file) or not (cmd := os.environ.get('PAGER', 'more' if os.name == 'nt' else 'less')):
+        yield file
+        return
+
+    try:
+        proc = Popen(shlex.split(cmd), stdin=PIPE, text=True, encoding=getattr(file, 'encoding', None))
+    except (OSError, ValueError):  # The pager could not be found, or the command could not be parsed
+        yield file
+        return
+
+    try:
+        yield proc.stdin  # type: ignore[misc]
+    except BrokenPipeError:  # The pager was closed before all of the help text was written
+        pass
+    finally:
+        try:
+            proc.stdin.close()  # type: ignore[union-attr]
+        except BrokenPipeError:
+            pass
+        proc.wait()
+
+
+def _is_tty(file: TextIO) -> bool:
+    try:
+        return file.isatty()
+    except (AttributeError, ValueError):  # ValueError may be raised if the file was closed
+        return False
+
+
 def _fix_name(name: str) -> str:
     return camel_to_snake_case(name).replace('_', ' ').title()
 
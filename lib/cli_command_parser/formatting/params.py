@@ -17,7 +17,7 @@ from ..parameters import ParamGroup, PassThru, TriFlag
 from ..parameters.base import BaseOption, BasePositional, ParamBase, Parameter
 from ..parameters.choice_map import Choice, ChoiceMap
 from .restructured_text import Cell, Row, RstTable
-from .utils import _should_add_default, format_help_entry
+from .utils import _bind_help_context, _help_context, _should_add_default, format_help_entry
 
 if TYPE_CHECKING:
     from ..nargs import Nargs
@@ -97,6 +97,13 @@ class ParamHelpFormatter(ABC, Generic[BaseP]):
         usage_iter = self.iter_usage_parts(include_meta=True, full=True)
         return format_help_entry(usage_iter, self.format_description(), prefix)
 
+    def iter_help(self, prefix: str = '') -> Iterator[str]:
+        """
+        Generate the help text for the Parameter in chunks.  When joined with newlines, the chunks are equivalent to the
+        result of :meth:`.format_help`.
+        """
+        yield self.format_help(prefix)
+
     # region RST
 
     def rst_usage(self) -> str:
@@ -120,7 +127,7 @@ class ParameterHelpFormatter(ParamHelpFormatter[ParamP], param_cls=Parameter):
         if param.metavar and param.action.accepts_values:
             return param.metavar
 
-        config = ctx.config
+        config = _help_context().config.snapshot
         if (t := param.type) is not None:
             try:
                 metavar = t.format_metavar(  # type: ignore[union-attr]
@@ -195,7 +202,9 @@ class OptionHelpFormatter(ParameterHelpFormatter[OptP], param_cls=BaseOption):
     def format_description(self, rst: Bool = False, *, description: OptStr = None) -> str:
         description = super().format_description(rst, description=description)
         param: BaseOption = self.param
-        if param.env_var and (param.show_env_var or (param.show_env_var is None and ctx.config.show_env_vars)):
+        if param.env_var and (
+            param.show_env_var or (param.show_env_var is None and _help_context().config.snapshot.show_env_vars)
+        ):
             pad, quote = _pad_and_quote(description, rst)
             var_names = [f'{quote}{var_name}{quote}' for var_name in param.env_vars()]
             if len(var_names) == 1:
@@ -258,7 +267,7 @@ class ChoiceMapHelpFormatter(ParameterHelpFormatter[ChoiceMap], param_cls=Choice
 
     def format_metavar(self) -> str:
         if self.param.choices:
-            config = ctx.config
+            config = _help_context().config.snapshot
             choices = (str(c) for c in (c.choice for cg in self.choice_groups for c in cg.choices) if c is not None)
             if config.sort_choices:
                 choices = sorted(choices)  # type: ignore[assignment]
@@ -267,21 +276,20 @@ class ChoiceMapHelpFormatter(ParameterHelpFormatter[ChoiceMap], param_cls=Choice
             return self.param.metavar or self.param.name.upper()
 
     def format_help(self, prefix: str = '') -> str:
-        help_entry = format_help_entry(self.iter_usage_parts(), self.param.description, prefix, lpad=2)
+        return '\n'.join(self.iter_help(prefix))
+
+    def iter_help(self, prefix: str = '') -> Iterator[str]:
+        yield f'{prefix}{self.param.title or self.param._default_title}:'
+        yield format_help_entry(self.iter_usage_parts(), self.param.description, prefix, lpad=2)
         choices = self._format_choices(prefix)
-        if ctx.config.sort_choices:
+        if _help_context().config.snapshot.sort_choices:
             choices = sorted(choices)  # type: ignore[assignment]
 
-        parts = (
-            f'{prefix}{self.param.title or self.param._default_title}:',
-            help_entry,
-            *choices,
-            prefix.rstrip(),
-        )
-        return '\n'.join(parts)
+        yield from choices
+        yield prefix.rstrip()
 
     def _format_choices(self, prefix: str = '') -> Iterator[str]:
-        mode = ctx.config.cmd_alias_mode or SubcommandAliasHelpMode.ALIAS
+        mode = _help_context().config.snapshot.cmd_alias_mode or SubcommandAliasHelpMode.ALIAS
         for choice_group in self.choice_groups:
             yield from choice_group.format(mode, prefix)
 
@@ -460,26 +468,28 @@ class GroupHelpFormatter(ParamHelpFormatter[ParamGroup], param_cls=ParamGroup):
 
     def format_usage(self, include_meta: Bool = False, full: Bool = False, delim: str = ', ') -> str:
         # This is currently (as of 2024-05-18) only used for error messages
-        members = (mem.formatter.format_usage(include_meta, full, delim) for mem in self.param.members)
-        return self.maybe_wrap_usage(self._get_choice_delim().join(members))
+        with _bind_help_context():
+            members = (mem.formatter.format_usage(include_meta, full, delim) for mem in self.param.members)
+            return self.maybe_wrap_usage(self._get_choice_delim().join(members))
 
     def format_description(self, rst: Bool = False, description: OptStr = None) -> str:
         if description:
             return description
         group = self.param
+        show_group_type = _help_context().config.snapshot.show_group_type
         if group.description or group._name:
             description = group.description or f'{group.name} options'
-            if ctx.config.show_group_type and (group.mutually_exclusive or group.mutually_dependent):
+            if show_group_type and (group.mutually_exclusive or group.mutually_dependent):
                 description += f' (mutually {"exclusive" if group.mutually_exclusive else "dependent"})'
             return description
-        elif ctx.config.show_group_type and (group.mutually_exclusive or group.mutually_dependent):
+        elif show_group_type and (group.mutually_exclusive or group.mutually_dependent):
             return f'Mutually {"exclusive" if group.mutually_exclusive else "dependent"} options'
 
         adjective = 'Required' if group.required else 'Other' if group.contains_required else 'Optional'
         return f'{adjective} arguments'
 
     def _get_spacer(self) -> str:
-        spacers = ctx.config.group_tree_spacers
+        spacers = _help_context().config.snapshot.group_tree_spacers
         if self.param.mutually_exclusive:
             return spacers[0]  # default: \u00a6 (BROKEN BAR)
         elif self.param.mutually_dependent:
@@ -496,30 +506,42 @@ class GroupHelpFormatter(ParamHelpFormatter[ParamGroup], param_cls=ParamGroup):
           description.
         :return: The formatted help text.
         """
-        if ctx.config.show_group_tree:
-            spacer = prefix + self._get_spacer()
-        else:
-            spacer = prefix
+        return '\n'.join(self.iter_help(prefix, clean))
 
-        parts = [f'{prefix}{self.format_description()}:']
-        nested = params = 0
-        for member in self.param.members:
-            if not member.show_in_help:
-                continue
-            elif isinstance(member, (ChoiceMap, ParamGroup)):
-                nested += 1
-                parts.append(spacer.rstrip())  # Add space for readability
+    def iter_help(self, prefix: str = '', clean: Bool = True) -> Iterator[str]:
+        """
+        Generate the help text for this group in chunks, so that help text for groups with many members does not need
+        to be built in memory all at once.  Accepts the same arguments as :meth:`.format_help`.
+        """
+        with _bind_help_context():
+            if _help_context().config.snapshot.show_group_tree:
+                spacer = prefix + self._get_spacer()
             else:
-                params += 1
-            parts.append(member.formatter.format_help(prefix=spacer))
-
-        if clean and nested and not params:
-            parts = parts[2:]  # remove description and the first spacer
-
-        if not parts[-1].endswith('\n'):  # ensure a new line separates sections, but avoid extra lines
-            parts.append(spacer.rstrip())
-
-        return '\n'.join(parts)
+                spacer = prefix
+
+            members = [member for member in self.param.members if member.show_in_help]
+            nested = sum(1 for member in members if isinstance(member, (ChoiceMap, ParamGroup)))
+            # If clean, and all members are nested, then omit the description and the first spacer
+            skip = 2 if clean and nested and nested == len(members) else 0
+            if not skip:
+                yield f'{prefix}{self.format_description()}:'
+
+            ends_with_newline = False
+            for member in members:
+                if isinstance(member, (ChoiceMap, ParamGroup)):
+                    if skip:
+                        skip = 0
+                    else:
+                        yield spacer.rstrip()  # Add space for readability
+
+                chunk, count = '', 0
+                for count, chunk in enumerate(member.formatter.iter_help(prefix=spacer), 1):
+                    yield chunk
+                # An empty final chunk results in a trailing newline when chunks are joined
+                ends_with_newline = chunk.endswith('\n') or (not chunk and count > 1)
+
+            if not ends_with_newline:  # ensure a new line separates sections, but avoid extra lines
+                yield spacer.rstrip()
 
     def rst_table(self) -> RstTable:
         table = RstTable(self.format_description())
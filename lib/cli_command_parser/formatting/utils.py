@@ -6,18 +6,48 @@ Utils for usage / help text formatters
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Collection, Iterator, Sequence
 
 from ..compat import WCTextWrapper
 from ..config import ShowDefaults
-from ..context import ctx
+from ..context import ctx, get_current_context
 from ..utils import _NotSet, wcswidth
 
 if TYPE_CHECKING:
+    from ..context import Context
     from ..typing import Bool, IStrs, StrIter
 
 __all__ = ['format_help_entry', 'line_iter']
 
+_bound_context: ContextVar[Context | None] = ContextVar('cli_command_parser.formatting.bound_context', default=None)
+
+
+def _help_context() -> Context:
+    """The Context that was bound for the help text being rendered, or the :data:`.ctx` proxy if none is bound"""
+    if (context := _bound_context.get()) is None:
+        return ctx
+    return context
+
+
+@contextmanager
+def _bind_help_context():
+    """
+    Bind the active Context for the duration of a help / usage rendering operation, so that it only needs to be looked
+    up once instead of once per config value that is read via the :data:`.ctx` proxy.  If a Context was already bound
+    by an outer rendering operation, or if there is no active Context, then this does nothing.
+    """
+    if _bound_context.get() is not None or (context := get_current_context(True)) is None:
+        yield
+        return
+
+    _bound_context.set(context)
+    try:
+        yield
+    finally:
+        _bound_context.set(None)
+
 
 def format_help_entry(
     usage_parts: StrIter,
@@ -44,9 +74,10 @@ def format_help_entry(
     else:
         line_prefix = ' ' * lpad
 
-    config = ctx.config
+    context = _help_context()
+    config = context.config.snapshot
     usage_width = config.usage_column_width
-    term_width = ctx.terminal_width
+    term_width = context.terminal_width
 
     wrapper = PartWrapper(
         usage_width if config.strict_usage_column_width else term_width, usage_cont_indent, usage_delim
@@ -176,7 +207,7 @@ def _should_add_default(default: Any, help_text: str | None, param_show_default:
         return False
     elif param_show_default is not None:
         return param_show_default
-    sd = ctx.config.show_defaults
+    sd = _help_context().config.snapshot.show_defaults
     if sd._value_ < 2 or (sd & ShowDefaults.MISSING and help_text and 'default:' in help_text):  # noqa
         return False
     elif sd & ShowDefaults.ANY:
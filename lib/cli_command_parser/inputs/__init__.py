@@ -13,12 +13,12 @@ from re import Pattern as _Pattern
 from ..exceptions import ParameterDefinitionError as _ParamDefinitionError
 from .base import InputType
 from .choices import ChoiceMap, Choices, EnumChoices
-from .exceptions import InputValidationError, InvalidChoiceError
-from .files import File, Json, Path, Pickle, Serialized
+from .exceptions import InputValidationError, InvalidChoiceError, ValueConversionError
+from .files import File, GlobPaths, Json, JsonLines, MMap, Path, Pickle, Serialized
 from .numeric import Bytes, NumRange, Range
 from .patterns import Glob, Regex, RegexMode
 from .time import Date, DateTime, Day, DTFormatMode, Month, Time, TimeDelta
-from .utils import FileWrapper, StatMode
+from .utils import Compression, FileWrapper, StatMode, StreamMode
 
 if _t.TYPE_CHECKING:
     from ..typing import ChoicesType, InputTypeFunc, NormalizedType, T, TypeFunc
@@ -27,7 +27,8 @@ if _t.TYPE_CHECKING:
 
 # fmt: off
 __all__ = [
-    'StatMode', 'FileWrapper', 'Path', 'File', 'Serialized', 'Json', 'Pickle',
+    'StatMode', 'StreamMode', 'Compression', 'FileWrapper',
+    'Path', 'GlobPaths', 'File', 'MMap', 'Serialized', 'Json', 'JsonLines', 'Pickle',
     'Bytes', 'Range', 'NumRange',
     'Choices', 'ChoiceMap', 'EnumChoices',
     'Regex', 'RegexMode', 'Glob',
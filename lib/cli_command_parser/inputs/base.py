@@ -5,7 +5,7 @@ Custom input handlers for Parameters
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Generic
+from typing import Any, Generic, Sequence
 
 from ..typing import Bool, T
 
@@ -23,6 +23,18 @@ class InputType(Generic[T], ABC):
         """Process the parsed argument and convert it to the desired type"""
         raise NotImplementedError
 
+    def convert_many(self, values: Sequence[str]) -> list[T]:
+        """
+        Process multiple parsed arguments at once.  Equivalent to calling this input type for each value, but may be
+        overridden in subclasses to perform setup / lookups / validation once for all of the values instead of once
+        per value.  Overrides should raise a :class:`.ValueConversionError` that identifies the rejected value when a
+        value cannot be converted, rather than a bare ``TypeError`` / ``ValueError``.
+
+        :param values: The parsed arguments to process
+        :return: The converted values, in the same order as the provided values
+        """
+        return [self(value) for value in values]
+
     def is_valid_type(self, value: str) -> bool:  # pylint: disable=W0613
         """
         Called during parsing when :meth:`.ParamAction.would_accept` is called to determine if the value would be
@@ -7,15 +7,16 @@ Custom input handlers for Parameters to restrict allowed values to a set of choi
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Callable, Collection, Iterator, Mapping, Type, TypeVar
+from enum import Enum
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, Collection, Iterable, Mapping, Sequence, Type, TypeVar
 
 from ..typing import T
+from ..utils import SuggestionIndex, _NotSet
 from .base import InputType
 from .exceptions import InvalidChoiceError
 
 if TYPE_CHECKING:
-    from enum import Enum
-
     from ..typing import Bool
 
 __all__ = ['Choices', 'ChoiceMap', 'EnumChoices']
@@ -24,17 +25,45 @@ E = TypeVar('E', bound='Enum')
 
 
 class _ChoicesBase(InputType[T], ABC):
-    __slots__ = ('choices', 'type', 'case_sensitive')
+    __slots__ = ('choices', 'type', 'case_sensitive', '_folded', '_suggestions')
     choices: Collection
     type: Callable[[str], T] | None
     case_sensitive: bool
+    _folded: dict[str, Any] | None
+    _suggestions: SuggestionIndex | None
+
+    def __call__(self, value: str) -> T:
+        if (result := self._find(normalized := self._normalize(value))) is _NotSet:
+            raise InvalidChoiceError(normalized, self.choices, suggest=self.suggest)
+        return result
+
+    def convert_many(self, values: Sequence[str]) -> list[T]:
+        find, normalize = self._find, self._normalize
+        results, invalid = [], []
+        for value in values:
+            if (result := find(normalized := normalize(value))) is _NotSet:
+                invalid.append(normalized)
+            else:
+                results.append(result)
+
+        if invalid:  # All invalid values are reported together
+            raise InvalidChoiceError(invalid[0] if len(invalid) == 1 else invalid, self.choices, suggest=self.suggest)
+        return results
 
     def __contains__(self, value: str) -> bool:
         try:
-            self(value)
-        except InvalidChoiceError:
+            value = self._normalize(value)
+        except InvalidChoiceError:  # The value was rejected by the explicitly provided type
             return False
-        return True
+        return self._find(value) is not _NotSet
+
+    @abstractmethod
+    def _find(self, value: Any) -> T:
+        """
+        :param value: A normalized value
+        :return: The result for the given value if it matches one of the allowed choices, otherwise ``_NotSet``
+        """
+        raise NotImplementedError
 
     def _type_str(self) -> str:
         if self.type is not None:
@@ -60,21 +89,19 @@ class _ChoicesBase(InputType[T], ABC):
                 raise InvalidChoiceError(value, self.choices) from e
         return value  # type: ignore[return-value]
 
-    def _iter_normalized(self, value: str | T, choices: Collection | None = None) -> Iterator[str | T]:
-        yield value
-        if not self.case_sensitive and (choices is None or isinstance(choices, (set, Mapping))):
-            # Choices validates that all members of `choices` are strings when not case_sensitive
-            yield value.lower()
-            yield value.upper()
-
-    def _case_insensitive_map_choice(self, value: Any) -> T:
-        if not self.case_sensitive:
-            norm_value = value.casefold()
-            for choice, val in self.choices.items():  # type: ignore[attr-defined]
-                if norm_value == choice.casefold():
-                    return val
+    def suggest(self, value: Any) -> list[str]:
+        """
+        :param value: A value that did not match any of the allowed choices
+        :return: The allowed choices that are most similar to the given value, if any
+        """
+        if self._suggestions is None:  # The index is only built when it is needed, to keep initialization cheap
+            self._suggestions = SuggestionIndex(map(str, self.choices))
+        return self._suggestions.suggest(str(value))
 
-        raise InvalidChoiceError(value, self.choices)
+    def _find_folded(self, value: Any) -> Any:
+        if self._folded is None or not isinstance(value, str):
+            return _NotSet
+        return self._folded.get(value.casefold(), _NotSet)
 
     def format_metavar(self, choice_delim: str = ',', sort_choices: bool = False) -> str:
         choices = map(str, self.choices)
@@ -83,6 +110,23 @@ class _ChoicesBase(InputType[T], ABC):
         return f'{{{choice_delim.join(choices)}}}'
 
 
+def _hashable_members(choices: Collection) -> Collection | None:
+    if isinstance(choices, (set, frozenset, Mapping)):
+        return choices
+    try:
+        return frozenset(choices)
+    except TypeError:  # At least one choice is unhashable
+        return None
+
+
+def _casefold_index(pairs: Iterable[tuple[str, Any]]) -> dict[str, Any]:
+    """Build a mapping of casefolded keys to values.  When multiple keys fold to the same value, the first one wins."""
+    folded: dict[str, Any] = {}
+    for key, val in pairs:
+        folded.setdefault(key.casefold(), val)
+    return folded
+
+
 class Choices(_ChoicesBase[T]):
     """
     Validates that values are members of the collection of allowed values.
@@ -94,7 +138,7 @@ class Choices(_ChoicesBase[T]):
       all strings, then this cannot be set to False.
     """
 
-    __slots__ = ()
+    __slots__ = ('_members', '_return_input_variant')
     choices: Collection[T]
 
     def __init__(
@@ -111,6 +155,13 @@ class Choices(_ChoicesBase[T]):
         self.choices = choices
         self.type = type
         self.case_sensitive = case_sensitive
+        self._members = _hashable_members(choices)
+        # choices are confirmed to be str above when case_sensitive=False
+        self._folded = None if case_sensitive else _casefold_index((c, c) for c in choices)
+        # When a set/mapping is provided, a case-insensitive match that only differs by upper/lower case has always
+        # resulted in the provided value being returned instead of the matching choice
+        self._return_input_variant = isinstance(choices, (set, frozenset, Mapping))
+        self._suggestions = None
 
     def _choices_repr(self, delim: str = ',') -> str:
         try:
@@ -118,21 +169,20 @@ class Choices(_ChoicesBase[T]):
         except TypeError:  # The choice values are not sortable
             return delim.join(sorted(map(repr, self.choices)))
 
-    def __call__(self, value: str) -> T:
-        choices = self.choices
-        value = self._normalize(value)
-        for val in self._iter_normalized(value, choices):
-            if val in choices:
+    def _find(self, value: Any) -> T:
+        try:
+            if value in self._members:  # type: ignore[operator]
+                return value
+        except TypeError:  # Some choices or the value are unhashable
+            if value in self.choices:
                 return value
 
-        if not self.case_sensitive:
-            # choices/value are confirmed to be str in init when case_sensitive=False
-            norm_value = value.casefold()
-            for choice in choices:
-                if norm_value == choice.casefold():
-                    return choice
+        if (choice := self._find_folded(value)) is not _NotSet:
+            if self._return_input_variant and (choice == value.lower() or choice == value.upper()):
+                return value
+            return choice
 
-        raise InvalidChoiceError(value, choices)
+        return _NotSet  # type: ignore[return-value]
 
 
 class ChoiceMap(Choices[T]):
@@ -154,15 +204,16 @@ class ChoiceMap(Choices[T]):
         super().__init__(choices, *args, **kwargs)
         # TODO: Alternate ChoiceMap where values are used as help text, similar to SubCommand with local_choices
 
-    def __call__(self, value: str) -> T:
-        value = self._normalize(value)
-        for val in self._iter_normalized(value):
-            try:
-                return self.choices[val]
-            except KeyError:
-                pass
+    def _find(self, value: Any) -> T:
+        try:
+            if value in self.choices:
+                return self.choices[value]
+        except TypeError:  # The value is unhashable
+            pass
 
-        return self._case_insensitive_map_choice(value)
+        if (key := self._find_folded(value)) is not _NotSet:
+            return self.choices[key]
+        return _NotSet  # type: ignore[return-value]
 
     def fix_default(self, value: Any) -> T:
         if value in self.choices.values():
@@ -183,11 +234,23 @@ class EnumChoices(_ChoicesBase[E]):
     type: Type[E]
     choices: Mapping[str, E]
 
+    __slots__ = ('_has_missing',)
+
     def __init__(self, enum: Type[E], case_sensitive: Bool = False):
         super().__init__()  # fix_default is not implemented here, so it's not necessary to expose
         self.type = enum
         self.case_sensitive = case_sensitive
         self.choices = enum._member_map_  # type: ignore[assignment]
+        self._suggestions = None
+        if case_sensitive:
+            self._folded = None
+        else:
+            # Names take precedence over values
+            members = enum._member_map_.items()
+            str_values = ((m._value_, m) for m in enum._member_map_.values() if isinstance(m._value_, str))
+            self._folded = _casefold_index(chain(members, str_values))
+        # Only fall back to calling the enum (which raises an exception for unknown values) if it may handle them
+        self._has_missing = getattr(enum._missing_, '__func__', None) is not Enum._missing_.__func__  # noqa
 
     def _type_str(self) -> str:
         return f'type={self.type.__name__}, '
@@ -195,16 +258,25 @@ class EnumChoices(_ChoicesBase[E]):
     def _choices_repr(self, delim: str = ',') -> str:
         return delim.join(self.type._member_map_)
 
-    def __call__(self, value: str) -> E:
+    def _normalize(self, value: str) -> str:
+        return value
+
+    def _find(self, value: Any) -> E:
         enum = self.type
-        for val in self._iter_normalized(value):
-            try:
-                return enum[val]  # type: ignore[index]
-            except KeyError:
-                pass
+        if (member := enum._member_map_.get(value)) is not None:
+            return member  # type: ignore[return-value]
+        try:
+            if (member := enum._value2member_map_.get(value)) is not None:
+                return member  # type: ignore[return-value]
+        except TypeError:  # The value is unhashable
+            pass
+
+        if (member := self._find_folded(value)) is not _NotSet:
+            return member
+        elif self._has_missing:
             try:
-                return enum(val)
+                return enum(value)
             except ValueError:
                 pass
 
-        return self._case_insensitive_map_choice(value)
+        return _NotSet  # type: ignore[return-value]
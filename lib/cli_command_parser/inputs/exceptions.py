@@ -4,24 +4,47 @@ Exceptions for custom input types / validators.
 :author: Doug Skrypa
 """
 
-from typing import Any, Collection
+from __future__ import annotations
 
-from ..exceptions import CommandParserException
+from typing import TYPE_CHECKING, Any, Collection
 
-__all__ = ['InputValidationError', 'InvalidChoiceError']
+from ..exceptions import CommandParserException, format_suggestions
+
+if TYPE_CHECKING:
+    from ..exceptions import Suggester
+
+__all__ = ['InputValidationError', 'InvalidChoiceError', 'ValueConversionError']
 
 
 class InputValidationError(CommandParserException, ValueError):
     """Raised when a custom InputType's conversion/validation fails"""
 
 
+class ValueConversionError(ValueError):
+    """
+    Raised by :meth:`.InputType.convert_many` when one of the provided values could not be converted, so that the
+    value that was rejected can be reported without converting each value again.
+    """
+
+    def __init__(self, value: Any, error: Exception):
+        super().__init__(value, error)
+        self.value = value
+        self.error = error
+
+    def __str__(self) -> str:
+        return str(self.error)
+
+
 class InvalidChoiceError(InputValidationError):
     """Error raised when a value that does not match one of the pre-defined choices was provided"""
 
-    def __init__(self, invalid: Any, choices: Collection[Any], type_str: str = 'choice'):  # pylint: disable=W0231
+    def __init__(  # pylint: disable=W0231
+        self, invalid: Any, choices: Collection[Any], type_str: str = 'choice', suggest: Suggester | None = None
+    ):
         self.invalid = invalid
         self.choices = choices
         self.type_str = type_str
+        self.suggest = suggest
 
     def __str__(self) -> str:
         if isinstance(self.invalid, Collection) and not isinstance(self.invalid, str):
@@ -30,4 +53,4 @@ class InvalidChoiceError(InputValidationError):
             bad_str = f'{self.type_str}: {self.invalid!r}'
 
         choices_str = ', '.join(map(repr, self.choices))
-        return f'invalid {bad_str} (choose from: {choices_str})'
+        return f'invalid {bad_str} (choose from: {choices_str}){format_suggestions(self.suggest, self.invalid)}'
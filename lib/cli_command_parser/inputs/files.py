@@ -6,20 +6,34 @@ Custom file / path input handlers for Parameters
 
 from __future__ import annotations
 
+import json
 import os
+import re
 from abc import ABC
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from fnmatch import translate
+from functools import partial
+from itertools import chain
+from mmap import ACCESS_READ, mmap
 from pathlib import Path as _Path
-from typing import TYPE_CHECKING, Any, AnyStr, Literal, TypeVar, overload
+from typing import TYPE_CHECKING, Any, AnyStr, Iterator, Literal, TypeVar, overload
 
+from ..context import get_current_context
 from ..typing import T
 from .base import InputType
 from .exceptions import InputValidationError
 from .utils import (
+    DEFAULT_BUFFER_SIZE,
+    Compression,
     FileWrapper,
     InputParam,
     JsonSerializer,
+    SerializedCache,
     SerializedFileWrapper,
+    StatCache,
     StatMode,
+    StreamMode,
     allows_write,
     fix_windows_path,
 )
@@ -28,9 +42,12 @@ if TYPE_CHECKING:
     from ..typing import Bool, OptStr, PathLike
     from ._typing import AnySerializer, OpenAnyMode, OpenBinaryMode, OpenTextMode
 
-__all__ = ['Path', 'File', 'Serialized', 'Json', 'Pickle']
+__all__ = ['Path', 'GlobPaths', 'File', 'MMap', 'Serialized', 'Json', 'JsonLines', 'Pickle']
 
 T_co = TypeVar('T_co', covariant=True)
+_GlobTask = tuple[str, tuple[str, ...]]
+_GlobMatch = tuple[str, 'os.DirEntry | None']
+_MAGIC_CHECK = re.compile('[*?[]')
 
 
 class FileInput(InputType[T], ABC):
@@ -102,13 +119,14 @@ class FileInput(InputType[T], ABC):
         if self.resolve:
             path = path.resolve()
 
+        stat_cache = _get_stat_cache()
         if self.exists is not None:
-            if self.exists and not path.exists():
+            if self.exists and not stat_cache.exists(path):
                 raise InputValidationError('the provided path does not exist')
-            elif not self.exists and path.exists():
+            elif not self.exists and stat_cache.exists(path):
                 raise InputValidationError('the provided path already exists')
 
-        if self.type != StatMode.ANY and path.exists() and not self.type.matches(path.stat().st_mode):
+        if self.type != StatMode.ANY and (stat := stat_cache.stat(path)) and not self.type.matches(stat.st_mode):
             # TODO: Indicate what the discovered type was
             raise InputValidationError(f'expected a {self.type}')
 
@@ -121,6 +139,12 @@ class FileInput(InputType[T], ABC):
         return path
 
 
+def _get_stat_cache() -> StatCache:
+    if context := get_current_context(True):
+        return context.stat_cache
+    return StatCache()
+
+
 class Path(FileInput[_Path]):
     # noinspection PyUnresolvedReferences
     """
@@ -143,6 +167,161 @@ class Path(FileInput[_Path]):
         return self.validated_path(value)
 
 
+class GlobPaths(InputType[Iterator[_Path]]):
+    """
+    Expands a glob pattern (such as ``data/**/*.parquet``) into a lazy iterator of matching paths.  This allows patterns
+    that would match a very large number of files to be provided without relying on the shell to expand them into
+    individual arguments.  The filesystem is not traversed until iteration begins.
+
+    Similar to :func:`python:glob.glob`, names that begin with ``.`` are only matched by patterns that also begin with
+    ``.`` unless ``include_hidden`` is True, and a pattern without any special characters results in that path only if
+    it exists.  Matching paths are yielded in the order that they are discovered.
+
+    :param recursive: If True (the default), then ``**`` will match any files and zero or more directories /
+      subdirectories.  Symlinks to directories are not followed during recursion.
+    :param include_hidden: Whether names that begin with ``.`` should be matched by wildcards.
+    :param type: To restrict the types of files/directories that are yielded, specify the :class:`.StatMode` that
+      matches the desired type.  By default, any type is accepted.
+    :param expand: Whether tilde (``~``) should be expanded.
+    :param allow_empty: If False, then the first match will be found during parsing, and an error will be raised if
+      there were no matches.  Defaults to True (no traversal happens during parsing).
+    :param workers: If greater than 0, then directories will be scanned concurrently using up to this many threads.
+      This may be beneficial on network filesystems.  The order of results is not deterministic in this case.
+    """
+
+    recursive: InputParam[bool] = InputParam(True)
+    include_hidden: InputParam[bool] = InputParam(False)
+    type: InputParam[StatMode] = InputParam(StatMode.ANY)
+    expand: InputParam[bool] = InputParam(True)
+    allow_empty: InputParam[bool] = InputParam(True)
+    workers: InputParam[int] = InputParam(0)
+
+    def __init__(
+        self,
+        *,
+        recursive: Bool = True,
+        include_hidden: Bool = False,
+        type: StatMode | str = StatMode.ANY,  # noqa
+        expand: Bool = True,
+        allow_empty: Bool = True,
+        workers: int = 0,
+    ):
+        if workers < 0:
+            raise ValueError(f'Invalid {workers=} - must be a non-negative integer')
+        super().__init__(False)
+        self.recursive = recursive
+        self.include_hidden = include_hidden
+        self.type = StatMode(type)
+        self.expand = expand
+        self.allow_empty = allow_empty
+        self.workers = workers
+
+    def __repr__(self) -> str:
+        non_defaults = ', '.join(f'{k}={v!r}' for k, v in self.__dict__.items())
+        return f'<{self.__class__.__name__}({non_defaults})>'
+
+    def __call__(self, value: str) -> Iterator[_Path]:
+        if not (value := value.strip()):
+            raise InputValidationError('A valid glob pattern is required')
+
+        paths = self._iter_paths(os.path.expanduser(value) if self.expand else value)
+        if self.allow_empty:
+            return paths
+        elif (first := next(paths, None)) is None:
+            raise InputValidationError(f'no paths matched pattern={value!r}')
+        return chain((first,), paths)
+
+    def _iter_paths(self, pattern: str) -> Iterator[_Path]:
+        path = _Path(pattern)
+        if path.anchor:
+            base, parts = path.anchor, path.parts[1:]
+        else:
+            base, parts = '', path.parts
+
+        flags = re.IGNORECASE if os.name == 'nt' else 0
+        regexes = {part: re.compile(translate(part), flags).match for part in parts if _MAGIC_CHECK.search(part)}
+        expand = partial(self._expand, regexes)
+        matches = (
+            self._iter_parallel(expand, (base, parts)) if self.workers else self._iter_serial(expand, (base, parts))
+        )
+
+        type_filter = self.type != StatMode.ANY
+        for match_path, entry in matches:
+            if type_filter:
+                try:
+                    mode = entry.stat().st_mode if entry is not None else os.stat(match_path).st_mode
+                except OSError:
+                    continue
+                if not self.type.matches(mode):
+                    continue
+            yield _Path(match_path)
+
+    @classmethod
+    def _iter_serial(cls, expand, task: _GlobTask) -> Iterator[_GlobMatch]:
+        pending = deque([task])
+        while pending:
+            matches, tasks = expand(*pending.popleft())
+            yield from matches
+            pending.extendleft(reversed(tasks))  # Depth-first, like glob
+
+    def _iter_parallel(self, expand, task: _GlobTask) -> Iterator[_GlobMatch]:
+        executor = ThreadPoolExecutor(self.workers, thread_name_prefix='cli_command_parser_glob')
+        try:
+            futures: set[Future] = {executor.submit(expand, *task)}
+            while futures:
+                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    matches, tasks = future.result()
+                    futures.update(executor.submit(expand, *t) for t in tasks)
+                    yield from matches
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _expand(self, regexes, dir_path: str, parts: tuple[str, ...]) -> tuple[list[_GlobMatch], list[_GlobTask]]:
+        """
+        Process the first remaining pattern part for the given directory.
+
+        :return: A tuple containing matching paths + DirEntry objects (when available), and subsequent (directory,
+          remaining parts) tasks that should be processed.
+        """
+        part, rest = parts[0], parts[1:]
+        matches: list[_GlobMatch] = []
+        tasks: list[_GlobTask] = []
+        if part == '**' and self.recursive:
+            if rest:
+                tasks.append((dir_path, rest))  # `**` may match zero directories
+            for entry in self._scandir(dir_path, part):
+                if not rest:
+                    matches.append((entry.path, entry))
+                if entry.is_dir(follow_symlinks=False):
+                    tasks.append((entry.path, parts))
+        elif (match := regexes.get(part)) is None:  # A literal name
+            path = os.path.join(dir_path, part)
+            if rest:
+                tasks.append((path, rest))
+            elif os.path.lexists(path):
+                matches.append((path, None))
+        else:
+            for entry in self._scandir(dir_path, part):
+                if match(entry.name):
+                    if not rest:
+                        matches.append((entry.path, entry))
+                    elif entry.is_dir():
+                        tasks.append((entry.path, rest))
+
+        return matches, tasks
+
+    def _scandir(self, dir_path: str, part: str) -> Iterator[os.DirEntry]:
+        skip_hidden = not self.include_hidden and not part.startswith('.')
+        try:
+            with os.scandir(dir_path or '.') as entries:
+                for entry in entries:
+                    if not (skip_hidden and entry.name.startswith('.')):
+                        yield entry
+        except OSError:  # The path does not exist, is not a directory, or it is not readable
+            return
+
+
 class File(FileInput[T_co]):
     """
     :param mode: The mode in which the file should be opened.  For more info, see :func:`python:open`.
@@ -151,6 +330,16 @@ class File(FileInput[T_co]):
     :param lazy: If True, a :class:`FileWrapper` will be stored in the Parameter using this File, otherwise the
       file will be read immediately upon parsing of the path argument.
     :param parents: If True and ``mode`` implies writing, then create parent directories as needed.  Ignored otherwise.
+    :param stream: If specified, then instead of a :class:`FileWrapper` or the file's content, a generator that lazily
+      reads the file will be stored in the Parameter using this File.  Use ``lines`` (or :attr:`StreamMode.LINES`) to
+      iterate over lines, or ``chunks`` (or :attr:`StreamMode.CHUNKS`) to iterate over chunks of ``buffer_size``
+      bytes/characters.  The file is not opened until iteration begins, and it is closed when the end of the file is
+      reached or the generator is closed.  Not supported for write modes.
+    :param buffer_size: The chunk size to use when ``stream='chunks'``, or the buffer size to use when opening the file
+      when ``stream='lines'``.  Ignored if ``stream`` is not specified.
+    :param compression: The :class:`.Compression` format to use to transparently decompress the file when reading it,
+      or to compress it when writing it.  Use ``auto`` to detect the format based on the file's content when reading, or
+      based on its extension when writing.  Defaults to no compression.  Not supported for read+write (``+``) modes.
     :param kwargs: Additional keyword arguments to pass to :class:`.Path`.
     """
 
@@ -160,6 +349,9 @@ class File(FileInput[T_co]):
     errors: InputParam[str | None] = InputParam(None)
     lazy: InputParam[bool] = InputParam(True)
     parents: InputParam[bool] = InputParam(False)
+    stream: InputParam[StreamMode | None] = InputParam(None)
+    buffer_size: InputParam[int] = InputParam(DEFAULT_BUFFER_SIZE)
+    compression: InputParam[Compression | None] = InputParam(None)
 
     if TYPE_CHECKING:
 
@@ -181,6 +373,7 @@ class File(FileInput[T_co]):
             errors: OptStr = None,
             lazy: Literal[True] = True,
             parents: Bool = False,
+            compression: Compression | str | None = None,
         ): ...
 
         @overload
@@ -201,6 +394,7 @@ class File(FileInput[T_co]):
             errors: OptStr = None,
             lazy: Literal[True] = True,
             parents: Bool = False,
+            compression: Compression | str | None = None,
         ): ...
 
         @overload
@@ -221,6 +415,7 @@ class File(FileInput[T_co]):
             errors: OptStr = None,
             lazy: Literal[False],
             parents: Bool = False,
+            compression: Compression | str | None = None,
         ): ...
 
         @overload
@@ -241,6 +436,49 @@ class File(FileInput[T_co]):
             errors: OptStr = None,
             lazy: Literal[False],
             parents: Bool = False,
+            compression: Compression | str | None = None,
+        ): ...
+
+        @overload
+        def __init__(
+            self: File[Iterator[str]],
+            mode: OpenTextMode = 'r',
+            *,
+            exists: Bool = None,
+            expand: Bool = True,
+            resolve: Bool = False,
+            type: StatMode | str = StatMode.FILE,  # noqa
+            readable: Bool = False,
+            writable: Bool = False,
+            allow_dash: Bool = False,
+            use_windows_fix: Bool = True,
+            fix_default: Bool = True,
+            encoding: OptStr = None,
+            errors: OptStr = None,
+            stream: StreamMode | str,
+            buffer_size: int = DEFAULT_BUFFER_SIZE,
+            compression: Compression | str | None = None,
+        ): ...
+
+        @overload
+        def __init__(
+            self: File[Iterator[bytes]],
+            mode: OpenBinaryMode,
+            *,
+            exists: Bool = None,
+            expand: Bool = True,
+            resolve: Bool = False,
+            type: StatMode | str = StatMode.FILE,  # noqa
+            readable: Bool = False,
+            writable: Bool = False,
+            allow_dash: Bool = False,
+            use_windows_fix: Bool = True,
+            fix_default: Bool = True,
+            encoding: OptStr = None,
+            errors: OptStr = None,
+            stream: StreamMode | str,
+            buffer_size: int = DEFAULT_BUFFER_SIZE,
+            compression: Compression | str | None = None,
         ): ...
 
         @overload
@@ -261,6 +499,9 @@ class File(FileInput[T_co]):
             errors: OptStr = None,
             lazy: Bool = True,
             parents: Bool = False,
+            stream: StreamMode | str | None = None,
+            buffer_size: int = DEFAULT_BUFFER_SIZE,
+            compression: Compression | str | None = None,
         ): ...
 
     def __init__(
@@ -271,10 +512,22 @@ class File(FileInput[T_co]):
         errors: OptStr = None,
         lazy: Bool = True,
         parents: Bool = False,
+        stream: StreamMode | str | None = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        compression: Compression | str | None = None,
         **kwargs,
     ):
         if not lazy and allows_write(mode):
             raise ValueError(f'Cannot combine {mode=} with lazy=False for {self.__class__.__name__}')
+        if stream is not None:
+            if allows_write(mode):
+                raise ValueError(f'Cannot combine {mode=} with {stream=} for {self.__class__.__name__}')
+            elif not lazy:
+                raise ValueError(f'Cannot combine {stream=} with lazy=False for {self.__class__.__name__}')
+            elif buffer_size < 1:
+                raise ValueError(f'Invalid {buffer_size=} - must be a positive integer')
+        if compression is not None and '+' in mode:
+            raise ValueError(f'Cannot combine {mode=} with {compression=} for {self.__class__.__name__}')
         if not allows_write(mode):
             kwargs.setdefault('exists', True)
         kwargs.setdefault('type', StatMode.FILE)
@@ -284,26 +537,77 @@ class File(FileInput[T_co]):
         self.errors = errors
         self.lazy = lazy
         self.parents = parents
+        self.stream = None if stream is None else StreamMode(stream)
+        self.buffer_size = buffer_size
+        self.compression = None if compression is None else Compression(compression)
 
     def _prep_file_wrapper(self, path: _Path) -> FileWrapper:
-        return FileWrapper(path, self.mode, encoding=self.encoding, errors=self.errors, parents=self.parents)
+        return FileWrapper(
+            path,
+            self.mode,
+            encoding=self.encoding,
+            errors=self.errors,
+            parents=self.parents,
+            compression=self.compression,
+        )
 
     def __call__(self, value: PathLike) -> T_co:
         wrapper = self._prep_file_wrapper(self.validated_path(value))
-        if self.lazy:
+        if self.stream == StreamMode.LINES:
+            return wrapper.iter_lines(self.buffer_size)  # type: ignore[return-value]
+        elif self.stream == StreamMode.CHUNKS:
+            return wrapper.iter_chunks(self.buffer_size)  # type: ignore[return-value]
+        elif self.lazy:
             return wrapper  # type: ignore[return-value]
         return wrapper.read()
 
 
+class MMap(FileInput[mmap]):
+    """
+    A read-only memory-mapped file.  The file's content is not copied into memory - pages are only loaded by the OS as
+    they are accessed.  Empty files cannot be memory-mapped, so they are rejected.  Dash (``-``) is not supported.
+
+    :param kwargs: Additional keyword arguments to pass to :class:`.Path`.
+    """
+
+    type: InputParam[StatMode] = InputParam(StatMode.FILE)
+
+    def __init__(self, **kwargs):
+        if kwargs.get('allow_dash'):
+            raise ValueError(f'Cannot combine allow_dash=True with {self.__class__.__name__} - stdin cannot be mapped')
+        kwargs.setdefault('exists', True)
+        kwargs.setdefault('type', StatMode.FILE)
+        super().__init__(**kwargs)
+
+    def __call__(self, value: PathLike) -> mmap:
+        path = self.validated_path(value)
+        try:
+            with path.open('rb') as f:
+                # The mapping remains valid after the file is closed
+                return mmap(f.fileno(), 0, access=ACCESS_READ)
+        except ValueError as e:  # Raised for empty files
+            raise InputValidationError(f'Unable to memory-map {path} - {e}') from e
+        except OSError as e:
+            raise InputValidationError(f'Unable to open {path} - {e}') from e
+
+
 class Serialized(File[T_co]):
     """
     :param serializer: Class or module that provides ``load``/``dump`` and/or ``loads``/``dumps`` methods/functions for
       deserialization and serialization, respectively.  Expects them to follow the same interface as the *json* or
       *pickle* modules, with :func:`python:json.loads`, :func:`python:json.dumps`, :func:`python:pickle.load`, etc.
+    :param cache_size: If greater than 0, then up to this many deserialized objects will be cached (with LRU eviction)
+      and re-used for subsequent reads of the same file while its size and modification time remain unchanged.  Useful
+      when the same file is parsed repeatedly in a long-running process.  Ignored for write modes and ``-``.
+    :param cache_copy: If True, then a deep copy of the cached object will be returned for each read instead of the
+      cached object itself.  Ignored if ``cache_size`` is 0.
     :param kwargs: Additional keyword arguments to pass to :class:`.File`
     """
 
     serializer: AnySerializer
+    cache_size: InputParam[int] = InputParam(0)
+    cache_copy: InputParam[bool] = InputParam(False)
+    _cache: SerializedCache | None = None
 
     if TYPE_CHECKING:
 
@@ -326,6 +630,9 @@ class Serialized(File[T_co]):
             errors: OptStr = None,
             lazy: Literal[True] = True,
             parents: Bool = False,
+            compression: Compression | str | None = None,
+            cache_size: int = 0,
+            cache_copy: Bool = False,
         ): ...
 
         @overload
@@ -347,6 +654,9 @@ class Serialized(File[T_co]):
             errors: OptStr = None,
             lazy: Literal[False],
             parents: Bool = False,
+            compression: Compression | str | None = None,
+            cache_size: int = 0,
+            cache_copy: Bool = False,
         ): ...
 
         @overload
@@ -368,14 +678,23 @@ class Serialized(File[T_co]):
             errors: OptStr = None,
             lazy: Bool = True,
             parents: Bool = False,
+            compression: Compression | str | None = None,
+            cache_size: int = 0,
+            cache_copy: Bool = False,
         ): ...
 
-    def __init__(self, serializer: AnySerializer, **kwargs):
+    def __init__(self, serializer: AnySerializer, *, cache_size: int = 0, cache_copy: Bool = False, **kwargs):
+        if cache_size < 0:
+            raise ValueError(f'Invalid {cache_size=} - must be a non-negative integer')
         super().__init__(**kwargs)
         self.serializer = serializer
+        self.cache_size = cache_size
+        self.cache_copy = cache_copy
+        if cache_size and not allows_write(self.mode):
+            self._cache = SerializedCache(cache_size, cache_copy)
 
     def __repr__(self) -> str:
-        non_defaults = ', '.join(f'{k}={v!r}' for k, v in self.__dict__.items() if k != 'serializer')
+        non_defaults = ', '.join(f'{k}={v!r}' for k, v in self.__dict__.items() if k not in ('serializer', '_cache'))
         # `serializer` must be excluded to prevent infinite recursion when an instance method is stored in that attr
         return f'<{self.__class__.__name__}({non_defaults})>'
 
@@ -387,6 +706,8 @@ class Serialized(File[T_co]):
             encoding=self.encoding,
             errors=self.errors,
             parents=self.parents,
+            compression=self.compression,
+            cache=self._cache,
         )
 
 
@@ -416,6 +737,9 @@ class Json(Serialized[T_co]):
             errors: OptStr = None,
             lazy: Literal[True] = True,
             parents: Bool = False,
+            compression: Compression | str | None = None,
+            cache_size: int = 0,
+            cache_copy: Bool = False,
         ): ...
 
         @overload
@@ -437,6 +761,9 @@ class Json(Serialized[T_co]):
             errors: OptStr = None,
             lazy: Literal[False],
             parents: Bool = False,
+            compression: Compression | str | None = None,
+            cache_size: int = 0,
+            cache_copy: Bool = False,
         ): ...
 
         @overload
@@ -458,12 +785,57 @@ class Json(Serialized[T_co]):
             errors: OptStr = None,
             lazy: Bool = True,
             parents: Bool = False,
+            compression: Compression | str | None = None,
+            cache_size: int = 0,
+            cache_copy: Bool = False,
         ): ...
 
     def __init__(self, *, mode: OpenTextMode = 'r', wrap_errors: Bool = True, **kwargs):
         super().__init__(JsonSerializer(wrap_errors), mode=mode, **kwargs)
 
 
+class JsonLines(File[Iterator[Any]]):
+    """
+    A `JSON Lines <https://jsonlines.org/>`__ (NDJSON) file, where each line contains a separate JSON document.  A
+    generator that lazily yields decoded records, one line at a time, will be stored in the Parameter using this input.
+    The file is not opened until iteration begins, and it is closed when the end of the file is reached or the
+    generator is closed.  Blank lines are ignored.
+
+    Since records are decoded during iteration, invalid lines will result in an :class:`.InputValidationError` being
+    raised during iteration instead of during parsing.
+
+    :param mode: The mode in which the file should be opened.  Only read modes are supported.
+    :param skip_errors: If True, lines that do not contain valid JSON will be skipped instead of raising an exception.
+    :param kwargs: Additional keyword arguments to pass to :class:`.File`
+    """
+
+    stream: InputParam[StreamMode | None] = InputParam(StreamMode.LINES)
+    skip_errors: InputParam[bool] = InputParam(False)
+
+    def __init__(self, *, mode: OpenAnyMode = 'r', skip_errors: Bool = False, **kwargs):
+        super().__init__(mode, stream=StreamMode.LINES, **kwargs)
+        self.skip_errors = skip_errors
+
+    def __call__(self, value: PathLike) -> Iterator[Any]:
+        path = self.validated_path(value)
+        return self._iter_records(self._prep_file_wrapper(path).iter_lines(self.buffer_size), path)
+
+    def _iter_records(self, lines: Iterator[AnyStr], path: _Path) -> Iterator[Any]:
+        try:
+            for line_num, line in enumerate(lines, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    if self.skip_errors:
+                        continue
+                    src = 'stdin' if path.parts == ('-',) else f'file={path.as_posix()!r}'
+                    raise InputValidationError(f'Unable to load json from {src} on line {line_num} - error: {e}') from e
+        finally:
+            lines.close()  # type: ignore[attr-defined]
+
+
 class Pickle(Serialized[T_co]):
     """
     :param kwargs: Additional keyword arguments to pass to :class:`.File`
@@ -489,6 +861,9 @@ class Pickle(Serialized[T_co]):
             errors: OptStr = None,
             lazy: Literal[True] = True,
             parents: Bool = False,
+            compression: Compression | str | None = None,
+            cache_size: int = 0,
+            cache_copy: Bool = False,
         ): ...
 
         @overload
@@ -509,6 +884,9 @@ class Pickle(Serialized[T_co]):
             errors: OptStr = None,
             lazy: Literal[False],
             parents: Bool = False,
+            compression: Compression | str | None = None,
+            cache_size: int = 0,
+            cache_copy: Bool = False,
         ): ...
 
         @overload
@@ -529,6 +907,9 @@ class Pickle(Serialized[T_co]):
             errors: OptStr = None,
             lazy: Bool = True,
             parents: Bool = False,
+            compression: Compression | str | None = None,
+            cache_size: int = 0,
+            cache_copy: Bool = False,
         ): ...
 
     def __init__(self, *, mode: OpenBinaryMode = 'rb', **kwargs):
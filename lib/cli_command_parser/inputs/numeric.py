@@ -8,11 +8,11 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Callable, Literal, Sequence
 
 from ._typing import N, Number, NumType, RngType
 from .base import _FixedInputType
-from .exceptions import InputValidationError
+from .exceptions import InputValidationError, ValueConversionError
 from .utils import RangeMixin, range_str
 
 if TYPE_CHECKING:
@@ -110,6 +110,19 @@ class Range(_RangeInput[N]):
 
         raise InputValidationError(f'expected a value in the range {self._range_str()}')
 
+    def convert_many(self, values: Sequence[str]) -> list[N]:
+        type_func, rng = self.type, self.range
+        results = _convert_all(type_func, values)
+        if all(num_val in rng for num_val in results):
+            return results
+        elif not self.snap:
+            raise InputValidationError(f'expected a value in the range {self._range_str()}')
+
+        rng_min, rng_max = min(rng), max(rng)
+        if type_func is not int:
+            rng_min, rng_max = type_func(rng_min), type_func(rng_max)
+        return [val if val in rng else (rng_min if val < rng_min else rng_max) for val in results]
+
 
 class NumRange(RangeMixin, _RangeInput[N]):
     """
@@ -195,7 +208,15 @@ class NumRange(RangeMixin, _RangeInput[N]):
         raise InputValidationError(f'expected a value in the range {self._range_str()}')
 
     def __call__(self, value: str) -> N:
-        num_val = self.type(value)
+        return self._check_bounds(self.type(value))
+
+    def convert_many(self, values: Sequence[str]) -> list[N]:
+        results = _convert_all(self.type, values)
+        if not results or self.values_in_range(results):
+            return results
+        return [self._check_bounds(num_val) for num_val in results]
+
+    def _check_bounds(self, num_val: N) -> N:
         # Note: if snap is enabled, it is applied by `handle_invalid`
         if self.value_lt_min(num_val):
             return self.handle_invalid(self.min, self.include_min, 1)
@@ -283,6 +304,22 @@ class Bytes(NumericInput[int | float]):
         return ' '.join(parts)
 
     def __call__(self, value: str) -> int | float:
+        num, unit = self._parse(value)
+        return num * self._get_multiplier(unit)
+
+    def convert_many(self, values: Sequence[str]) -> list[int | float]:
+        multipliers: dict[str | None, int] = {}  # Values typically share a small number of units
+        results = []
+        for value in values:
+            num, unit = self._parse(value)
+            try:
+                multiplier = multipliers[unit]
+            except KeyError:
+                multipliers[unit] = multiplier = self._get_multiplier(unit)
+            results.append(num * multiplier)
+        return results
+
+    def _parse(self, value: str) -> tuple[int | float, str | None]:
         try:
             num, unit = self._pattern.match(value.strip()).groups()  # type: ignore[union-attr]
         except (TypeError, AttributeError):
@@ -296,7 +333,7 @@ class Bytes(NumericInput[int | float]):
         if not self.negative and num < 0:
             raise InputValidationError(f'expected {self._type_desc()}, but found {num!r}')
 
-        return num * self._get_multiplier(unit)
+        return num, unit
 
     def _get_multiplier(self, unit: str | None) -> int:
         if not unit:
@@ -318,3 +355,15 @@ class Bytes(NumericInput[int | float]):
             return 1024**exp
         else:
             return 1000**exp
+
+
+def _convert_all(type_func: Callable[[str], N], values: Sequence[str]) -> list[N]:
+    results = []
+    for value in values:
+        try:
+            results.append(type_func(value))
+        except InputValidationError:
+            raise
+        except (TypeError, ValueError) as e:
+            raise ValueConversionError(value, e) from e
+    return results
@@ -24,10 +24,15 @@ GroupsResult = tuple[str, ...]
 DictResult = dict[str, str]
 RegexResult = TypeVar('RegexResult', str, Match, GroupsResult, DictResult)
 
+_SCOPED_FLAGS = {re.ASCII: 'a', re.IGNORECASE: 'i', re.MULTILINE: 'm', re.DOTALL: 's', re.VERBOSE: 'x'}
+_SCOPABLE = sum(_SCOPED_FLAGS) | re.UNICODE
+_NUMBERED_REF_MATCH = re.compile(r'\\[1-9]|\(\?\(\d').search
+
 
 class PatternInput(InputType[T], ABC):
-    __slots__ = ('patterns',)
+    __slots__ = ('patterns', '_combined')
     patterns: tuple[Pattern, ...]
+    _combined: Pattern | None
 
     def _pattern_strings(self, sort: bool = False) -> Sequence[str]:
         patterns = [p.pattern for p in self.patterns]
@@ -45,6 +50,33 @@ class PatternInput(InputType[T], ABC):
         return 'any of the following patterns:\n' + '\n'.join(f'  - {p}' for p in patterns)
 
 
+def _combine_patterns(patterns: Sequence[Pattern]) -> Pattern | None:
+    """
+    Combine the given patterns into a single alternation that, when used with ``search``, finds a match if and only if
+    any of the given patterns would find a match.  The alternation does not identify which pattern matched, so it is
+    only suitable when a yes/no result is needed.
+
+    :param patterns: The patterns to combine
+    :return: The combined pattern, or None if the patterns could not be combined.
+    """
+    if len(patterns) < 2:
+        return None
+
+    parts = []
+    for pattern in patterns:
+        if not isinstance(pattern.pattern, str) or pattern.flags & ~_SCOPABLE or _NUMBERED_REF_MATCH(pattern.pattern):
+            return None  # Flags that can't be scoped or numbered back-references that would be shifted
+        flags = ''.join(char for flag, char in _SCOPED_FLAGS.items() if pattern.flags & flag)
+        # A newline is necessary to terminate any trailing comment in a verbose pattern
+        end = '\n' if pattern.flags & re.VERBOSE else ''
+        parts.append(f'(?{flags}:{pattern.pattern}{end})')
+
+    try:
+        return re.compile('|'.join(parts))
+    except re.error:  # Most likely due to duplicate group names or global inline flags
+        return None
+
+
 class RegexMode(MissingMixin, Enum):
     """The RegexMode for a given Regex input governs the type of value it returns during parsing."""
 
@@ -164,13 +196,20 @@ class Regex(PatternInput[RegexResult]):
         self.patterns = tuple(re.compile(p) if isinstance(p, str) else p for p in patterns)
         self.group = 0 if group is None and mode == RegexMode.GROUP else group
         self.groups = groups
+        # Only STRING mode can use a combined pattern, since other modes need the Match from the pattern that matched
+        self._combined = _combine_patterns(self.patterns) if mode == RegexMode.STRING else None
 
     def __repr__(self) -> str:
         mode, group, groups, patterns = self.mode, self.group, self.groups, self.patterns
         return f'<{self.__class__.__name__}({mode=}, {group=}, {groups=}, {patterns=})>'
 
     def __call__(self, value: str) -> RegexResult:
-        if not (m := next((pm for p in self.patterns if (pm := p.search(value))), None)):
+        if (combined := self._combined) is not None:
+            m = combined.search(value)
+        else:
+            m = next((pm for p in self.patterns if (pm := p.search(value))), None)
+
+        if not m:
             raise InputValidationError(f'expected a value matching {self._describe_patterns()}')
 
         match self.mode:
@@ -206,11 +245,17 @@ class Glob(PatternInput[str]):
         if normcase:
             patterns = tuple(os.path.normcase(p) for p in patterns)
         self._original_patterns = patterns
-        if match_case:
-            self.patterns = tuple(re.compile(translate(p)) for p in patterns)
-        else:
-            self.patterns = tuple(re.compile(translate(p), re.IGNORECASE) for p in patterns)
+        flags = 0 if match_case else re.IGNORECASE
+        self.patterns = tuple(re.compile(translate(p), flags) for p in patterns)
         self.normcase = normcase
+        self._combined = self._combine(flags) if len(patterns) > 1 else None
+
+    def _combine(self, flags: int) -> Pattern | None:
+        # Only a boolean result is necessary here, so a simple alternation is sufficient (unlike for Regex)
+        try:
+            return re.compile('|'.join(f'(?:{p.pattern})' for p in self.patterns), flags)
+        except re.error:
+            return None
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__}(patterns={self.patterns})>'
@@ -221,6 +266,9 @@ class Glob(PatternInput[str]):
     def __call__(self, value: str) -> str:
         if self.normcase:
             value = os.path.normcase(value)
-        if any(p.match(value) for p in self.patterns):
+        if (combined := self._combined) is not None:
+            if combined.match(value):
+                return value
+        elif any(p.match(value) for p in self.patterns):
             return value
         raise InputValidationError(f'expected a value matching {self._describe_patterns()}')
@@ -3,9 +3,10 @@ Custom date/time input handlers for Parameters.
 
 .. warning::
 
-    Uses :func:`python:locale.setlocale` if alternate locales are specified, which may cause problems on some systems.
-    Using alternate locales in this manner should not be used in a multi-threaded application, as it will lead to
-    unexpected output from other parts of the program.
+    If alternate locales are specified, :func:`python:locale.setlocale` is used once per locale to collect that
+    locale's day / month names and date / time formats, which may cause problems on some systems.  Parsing and
+    formatting values after that point uses the collected :class:`LocaleTables` and does not modify the process-wide
+    locale.
 
     If you need to handle multiple locales and this is a problem for your application, then you should leave the
     ``locale`` parameters empty / ``None`` and use a proper i18n library like `babel <https://babel.pocoo.org/>`__
@@ -16,12 +17,14 @@ Custom date/time input handlers for Parameters.
 
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
 from calendar import day_abbr, day_name, month_abbr, month_name
 from datetime import date, datetime, time, timedelta
 from enum import Enum
+from functools import lru_cache
 from locale import LC_ALL, setlocale
-from threading import RLock
+from threading import Lock, RLock
 from typing import TYPE_CHECKING, ClassVar, Collection, Iterator, Literal, NoReturn, Sequence, Type, TypeVar, overload
 
 from ..typing import T
@@ -30,6 +33,11 @@ from .base import InputType, _FixedInputType
 from .exceptions import InputValidationError, InvalidChoiceError
 from .utils import RangeMixin, range_str
 
+try:
+    from locale import D_FMT, D_T_FMT, T_FMT, T_FMT_AMPM, nl_langinfo
+except ImportError:  # Not available on Windows
+    nl_langinfo = None
+
 if TYPE_CHECKING:
     from ..typing import Bool, OptStr
     from ._typing import Locale, Number, TimeBound
@@ -43,6 +51,41 @@ DEFAULT_DATE_FMT = '%Y-%m-%d'
 DEFAULT_TIME_FMT = '%H:%M:%S'
 DEFAULT_DT_FMT = '%Y-%m-%d %H:%M:%S'
 
+_DIRECTIVE_PATTERN = re.compile('%(.)')
+_LOCALE_DIRECTIVES = frozenset('aAbBcpxX')
+_NUMERIC_DIRECTIVES = frozenset('dmyYHIMSfjUWwuVG%')
+_ISO_DATE = '[0-9]{4}-[0-9]{2}-[0-9]{2}'
+_ISO_TIME = '(?:[01][0-9]|2[0-3]):[0-9]{2}:[0-9]{2}'  # Newer versions of fromisoformat accept 24:00
+# Formats for which values with exactly this shape are parsed identically by `fromisoformat` and `strptime`
+_ISO_FORMAT_PATTERNS = {
+    DEFAULT_DATE_FMT: _ISO_DATE,
+    DEFAULT_TIME_FMT: _ISO_TIME,
+    DEFAULT_DT_FMT: f'{_ISO_DATE} {_ISO_TIME}',
+    '%Y-%m-%dT%H:%M:%S': f'{_ISO_DATE}T{_ISO_TIME}',
+}
+_STRPTIME_DEFAULT_DATE = date(1900, 1, 1)
+_NAMED_DIRECTIVES = {'a': day_abbr, 'A': day_name, 'b': month_abbr, 'B': month_name, 'p': None}
+# These match the patterns used by strptime for these directives
+_NUMERIC_DIRECTIVE_PATTERNS = {
+    'd': r'3[01]|[12]\d|0[1-9]|[1-9]| [1-9]',
+    'f': r'[0-9]{1,6}',
+    'H': r'2[0-3]|[0-1]\d|\d',
+    'I': r'1[0-2]|0[1-9]|[1-9]| [1-9]',
+    'G': r'\d\d\d\d',
+    'j': r'36[0-6]|3[0-5]\d|[12]\d\d|0[1-9]\d|00[1-9]|[1-9]\d|0[1-9]|[1-9]',
+    'm': r'1[0-2]|0[1-9]|[1-9]',
+    'M': r'[0-5]\d|\d',
+    'S': r'6[0-1]|[0-5]\d|\d',
+    'U': r'5[0-3]|[0-4]\d|\d',
+    'w': r'[0-6]',
+    'u': r'[1-7]',
+    'V': r'5[0-3]|0[1-9]|[1-4]\d|\d',
+    'W': r'5[0-3]|[0-4]\d|\d',
+    'y': r'\d\d',
+    'Y': r'\d\d\d\d',
+    'z': r'[+-]\d\d:?[0-5]\d(?::?[0-5]\d(?:\.\d{1,6})?)?|(?-i:Z)',
+}
+
 
 class different_locale:
     """
@@ -77,6 +120,228 @@ class different_locale:
         self._lock.release()
 
 
+# region Locale Tables
+
+
+class LocaleTables:
+    """
+    Day / month names and date / time formats for a given locale, collected once so that values can be parsed and
+    formatted for that locale without (repeatedly) modifying the process-wide locale.  Instances are immutable after
+    initialization, so they may safely be used by multiple threads concurrently.
+
+    Use :meth:`.for_locale` to obtain the tables for a given locale.
+    """
+
+    __slots__ = ('locale', 'names', 'am_pm', 'date_time_fmt', 'date_fmt', 'time_fmt', '_lookups', '_parsers')
+    _cache: ClassVar[dict[Locale, LocaleTables]] = {}
+    _lock = Lock()
+
+    def __init__(
+        self,
+        locale: Locale,
+        names: dict[Sequence[str], Sequence[str]],
+        am_pm: Sequence[str] = ('AM', 'PM'),
+        date_time_fmt: str = '%a %b %d %H:%M:%S %Y',
+        date_fmt: str = '%m/%d/%y',
+        time_fmt: str = DEFAULT_TIME_FMT,
+    ):
+        self.locale = locale
+        #: Mapping of {calendar sequence (such as :data:`python:calendar.day_name`): localized names}
+        self.names = {key: tuple(values) for key, values in names.items()}
+        self.am_pm = tuple(am_pm)
+        self.date_time_fmt = date_time_fmt  # Equivalent to %c
+        self.date_fmt = date_fmt  # Equivalent to %x
+        self.time_fmt = time_fmt  # Equivalent to %X
+        self._lookups = {
+            key: {name.casefold(): i for i, name in enumerate(values) if name} for key, values in self.names.items()
+        }
+        self._lookups[self.am_pm] = {name.casefold(): i for i, name in enumerate(self.am_pm) if name}
+        self._parsers: dict[str, _LocalizedFormat | None] = {}
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}[{self.locale!r}]>'
+
+    @classmethod
+    def for_locale(cls, locale: Locale) -> LocaleTables:
+        """
+        :param locale: The locale for which tables should be returned.  The tables for a given locale are only
+          collected the first time that they are requested.
+        :return: The tables for the given locale
+        """
+        try:
+            return cls._cache[locale]
+        except KeyError:
+            pass
+        with cls._lock:
+            try:
+                return cls._cache[locale]
+            except KeyError:
+                cls._cache[locale] = tables = cls._load(locale)
+                return tables
+
+    @classmethod
+    def _load(cls, locale: Locale) -> LocaleTables:
+        with different_locale(locale):
+            names = {seq: tuple(seq) for seq in (day_name, day_abbr, month_name, month_abbr)}
+            am_pm = tuple(time(h).strftime('%p') for h in (1, 13))
+            if nl_langinfo is None:
+                formats = [_derive_format(directive, am_pm) for directive in ('%c', '%x', '%X')]
+            else:
+                formats = [_langinfo_format(item) for item in (D_T_FMT, D_FMT, T_FMT)]
+            return cls(locale, names, am_pm, *formats)
+
+    def index(self, names: Sequence[str], value: str) -> int | None:
+        """
+        :param names: A calendar sequence, such as :data:`python:calendar.day_name`, or ``am_pm``
+        :param value: A localized name
+        :return: The index of the given name in the localized version of the given sequence, or None if not found
+        """
+        return self._lookups[names].get(value.casefold())
+
+    def strptime(self, value: str, fmt: str) -> datetime:
+        """
+        Equivalent to :meth:`python:datetime.datetime.strptime`, using the names and formats for this locale.
+
+        Locale-dependent parts of the value are converted to their numeric equivalents before parsing the result
+        with a numeric format, which does not depend on the current locale.
+
+        :raises ValueError: if the value does not match the given format
+        """
+        try:
+            parser = self._parsers[fmt]
+        except KeyError:
+            self._parsers[fmt] = parser = _LocalizedFormat.compile(fmt, self)
+
+        if parser is None:  # The format contains a directive that is not supported here
+            with different_locale(self.locale):
+                return datetime.strptime(value, fmt)
+        return parser.parse(value)
+
+
+class _LocalizedFormat:
+    """A datetime format that contains locale-dependent directives, compiled for a given locale."""
+
+    __slots__ = ('tables', '_match', '_directives')
+
+    def __init__(self, fmt: str, tables: LocaleTables):
+        self.tables = tables
+        fmt = _DIRECTIVE_PATTERN.sub(lambda m: self._expand(m.group(1)), fmt)
+        directives = []
+        parts = []
+        pos = 0
+        for i, m in enumerate(_DIRECTIVE_PATTERN.finditer(fmt)):
+            parts.append(_literal_pattern(fmt[pos : m.start()]))
+            pos = m.end()
+            if (directive := m.group(1)) == '%':
+                parts.append('%')
+                continue
+            elif directive in _NAMED_DIRECTIVES:
+                names = tables.names[_NAMED_DIRECTIVES[directive]] if directive != 'p' else tables.am_pm
+                pattern = '|'.join(re.escape(name) for name in sorted(filter(None, names), key=len, reverse=True))
+            else:
+                pattern = _NUMERIC_DIRECTIVE_PATTERNS[directive]  # KeyError is handled in compile
+            parts.append(f'(?P<_{i}>{pattern})')
+            directives.append((f'_{i}', directive))
+
+        parts.append(_literal_pattern(fmt[pos:]))
+        self._match = re.compile(''.join(parts), re.IGNORECASE).fullmatch
+        self._directives = directives
+
+    @classmethod
+    def compile(cls, fmt: str, tables: LocaleTables) -> _LocalizedFormat | None:
+        try:
+            return cls(fmt, tables)
+        except KeyError:
+            return None
+
+    def _expand(self, directive: str) -> str:
+        if directive == 'c':
+            return self.tables.date_time_fmt
+        elif directive == 'x':
+            return self.tables.date_fmt
+        elif directive == 'X':
+            return self.tables.time_fmt
+        return '%' + directive
+
+    def parse(self, value: str) -> datetime:
+        if not (m := self._match(value)):
+            raise ValueError(f'time data {value!r} does not match the localized format')
+
+        tables = self.tables
+        values, directives = [], []
+        hour_index = pm = None
+        for group, directive in self._directives:
+            found = m.group(group).strip()
+            if directive in _NAMED_DIRECTIVES:
+                names = tables.am_pm if directive == 'p' else _NAMED_DIRECTIVES[directive]
+                if (index := tables.index(names, found)) is None:
+                    raise ValueError(f'Invalid value={found!r} for %{directive} in time data {value!r}')
+                elif directive == 'p':
+                    pm = index == 1
+                    continue
+                elif directive in 'aA':  # Convert to %w, where Sunday is 0 (Monday is 0 in the calendar module)
+                    found, directive = str((index + 1) % 7), 'w'
+                else:
+                    found, directive = str(index), 'm'
+            elif directive == 'I':
+                hour_index = len(values)
+            values.append(found)
+            directives.append('%' + directive)
+
+        if pm is not None and hour_index is not None:
+            values[hour_index] = str(int(values[hour_index]) % 12 + (12 if pm else 0))
+            directives[hour_index] = '%H'
+
+        return datetime.strptime(' '.join(values), ' '.join(directives))
+
+
+#: Equivalents for directives that may be used in nl_langinfo formats, but that are not supported by strptime
+_LANGINFO_DIRECTIVES = {
+    'e': '%d', 'k': '%H', 'l': '%I', 'h': '%b', 'D': '%m/%d/%y', 'R': '%H:%M', 'T': '%H:%M:%S', 'n': ' ', 't': ' '
+}  # fmt: skip
+#: The datetime that is formatted to derive a locale's formats when nl_langinfo is not available (a Wednesday in March)
+_KNOWN_DT = datetime(1999, 3, 17, 22, 44, 55)
+
+
+def _langinfo_format(item: int) -> str:
+    """
+    :param item: An :func:`python:locale.nl_langinfo` format item, such as ``D_T_FMT``
+    :return: The format for the current locale, with ``E`` / ``O`` modifiers removed and directives that are not
+      supported by strptime replaced with their equivalents
+    """
+
+    def replace(m):
+        if (directive := m.group(1)) == 'r':
+            return _langinfo_format(T_FMT_AMPM) or '%I:%M:%S %p'
+        return _LANGINFO_DIRECTIVES.get(directive, '%' + directive)
+
+    return re.sub('%[EO]?(.)', replace, nl_langinfo(item))
+
+
+def _derive_format(directive: str, am_pm: Sequence[str]) -> str:
+    """
+    Derive the format that the current locale uses for the given directive (``%c``, ``%x``, or ``%X``) by formatting a
+    known datetime and replacing its components with the directives that produce them.
+    """
+    components = [
+        ('%', '%%'), (day_name[2], '%A'), (month_name[3], '%B'), (day_abbr[2], '%a'), (month_abbr[3], '%b'),
+        (am_pm[1], '%p'), ('1999', '%Y'), ('99', '%y'), ('22', '%H'), ('44', '%M'), ('55', '%S'), ('17', '%d'),
+        ('03', '%m'), ('3', '%m'), ('10', '%I'),
+    ]  # fmt: skip
+    components = [(value, replacement) for value, replacement in components if value]
+    lookup = dict(components)
+    pattern = '|'.join(re.escape(value) for value, _ in components)  # Earlier components take precedence
+    return re.sub(pattern, lambda m: lookup[m.group()], _KNOWN_DT.strftime(directive))
+
+
+def _literal_pattern(literal: str) -> str:
+    # Like strptime, any amount of whitespace is accepted where the format contains whitespace
+    return r'\s+'.join(map(re.escape, re.split(r'\s+', literal)))
+
+
+# endregion
+
+
 class DTInput(_FixedInputType[T], ABC):
     __slots__ = ('locale',)
     dt_type: str
@@ -99,6 +364,42 @@ class DTInput(_FixedInputType[T], ABC):
         raise NotImplementedError
 
 
+class _DTFormat:
+    """A datetime format string, with information about it that is used to optimize parsing.  Only used internally."""
+
+    __slots__ = ('format', 'localized', 'signature', '_iso_match')
+
+    def __init__(self, fmt: str):
+        self.format = fmt
+        directives = _DIRECTIVE_PATTERN.findall(fmt)
+        #: Whether parsing with this format depends on the current locale
+        self.localized = not _LOCALE_DIRECTIVES.isdisjoint(directives)
+        #: If all directives in this format only match digits, then any value it matches must contain exactly these
+        #: literal (non-whitespace) characters in this order (strptime is case-insensitive).  None if not numeric.
+        if _NUMERIC_DIRECTIVES.issuperset(directives):
+            literals = _DIRECTIVE_PATTERN.sub(lambda m: '%' if m.group(1) == '%' else '', fmt)
+            self.signature = ''.join(literals.split()).casefold()
+        else:
+            self.signature = None
+        iso_pattern = _ISO_FORMAT_PATTERNS.get(fmt)
+        self._iso_match = re.compile(iso_pattern).fullmatch if iso_pattern else None
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}({self.format!r})>'
+
+    def parse(self, value: str) -> datetime:
+        if self._iso_match is not None and self._iso_match(value):
+            if self.format == DEFAULT_TIME_FMT:  # strptime uses 1900-01-01 as the date for time-only formats
+                return datetime.combine(_STRPTIME_DEFAULT_DATE, time.fromisoformat(value))
+            return datetime.fromisoformat(value)
+        return datetime.strptime(value, self.format)
+
+
+@lru_cache(256)
+def _compile_format(fmt: str) -> _DTFormat:
+    return _DTFormat(fmt)
+
+
 # region Calendar Unit Inputs
 
 
@@ -154,15 +455,18 @@ class CalendarUnitInput(DTInput[str | int], ABC):
         if self.out_format not in self._formats:
             raise ValueError(f'Unsupported out_format={self.out_format} for {self.__class__.__name__} inputs')
 
+    def _names(self, mode: DTFormatMode, locale: Locale | None) -> Sequence[str]:
+        names = self._formats[mode]
+        if locale:
+            return LocaleTables.for_locale(locale).names[names]  # type: ignore[index]
+        return names  # type: ignore[return-value]
+
     def _values(self) -> Iterator[tuple[int, str]]:
-        if not self.full and not self.abbreviation:
-            return
         min_index = self._min_index
-        with different_locale(self.locale):
-            if self.full:
-                yield from enumerate(self._formats[DTFormatMode.FULL][min_index:], min_index)
-            if self.abbreviation:
-                yield from enumerate(self._formats[DTFormatMode.ABBREVIATION][min_index:], min_index)
+        if self.full:
+            yield from enumerate(self._names(DTFormatMode.FULL, self.locale)[min_index:], min_index)
+        if self.abbreviation:
+            yield from enumerate(self._names(DTFormatMode.ABBREVIATION, self.locale)[min_index:], min_index)
 
     def choices(self, sort: bool = False) -> Sequence[str]:
         choices = [dow for _, dow in self._values()]
@@ -217,9 +521,8 @@ class CalendarUnitInput(DTInput[str | int], ABC):
             raise InvalidChoiceError(value, self.choices(), self.dt_type)
         elif self.out_format in (DTFormatMode.NUMERIC, DTFormatMode.NUMERIC_ISO):
             return self._formats[self.out_format][normalized]
-        elif (names_or_abbreviations := self._formats.get(self.out_format)) is not None:
-            with different_locale(self.out_locale):
-                return names_or_abbreviations[normalized]
+        elif self.out_format in self._formats:
+            return self._names(self.out_format, self.out_locale)[normalized]
 
         raise ValueError(f'Unexpected output format={self.out_format!r} for {self.dt_type}={normalized}')
 
@@ -279,11 +582,10 @@ class Day(CalendarUnitInput, dt_type='day of the week'):
         if start <= dow_num <= stop:
             return (dow_num - 1) if self.iso else dow_num
 
-        with different_locale(self.locale):
-            raise InputValidationError(
-                f'Invalid weekday={dow_num} - expected a value'
-                f' between {start} ({day_name[0]}) and {stop} ({day_name[6]})'
-            )
+        names = self._names(DTFormatMode.FULL, self.locale)
+        raise InputValidationError(
+            f'Invalid weekday={dow_num} - expected a value between {start} ({names[0]}) and {stop} ({names[6]})'
+        )
 
 
 class Month(CalendarUnitInput, dt_type='month', min_index=1):
@@ -335,10 +637,8 @@ class Month(CalendarUnitInput, dt_type='month', min_index=1):
         if 1 <= month <= 12:
             return month
 
-        with different_locale(self.locale):
-            raise InputValidationError(
-                f'Invalid {month=} - expected a value between 1 ({month_name[1]}) and 12 ({month_name[12]})'
-            )
+        names = self._names(DTFormatMode.FULL, self.locale)
+        raise InputValidationError(f'Invalid {month=} - expected a value between 1 ({names[1]}) and 12 ({names[12]})')
 
 
 # endregion
@@ -373,19 +673,41 @@ class TimeDelta(RangeMixin, InputType[timedelta]):
         self.int_only = int_only
 
     def __call__(self, value: str | int | float) -> timedelta:
-        if isinstance(value, str):
-            try:
-                value = float(value.replace(',', '').replace('_', ''))  # allow comma or _ between thousands
-            except ValueError as e:
-                exp_type = 'integer' if self.int_only else 'integer or float'
-                raise self._invalid(value, f'expected an {exp_type}') from e
+        return self._timedelta(self._validate(self._to_num(value)))
 
+    def convert_many(self, values: Sequence[str | int | float]) -> list[timedelta]:
+        if not values:
+            return []
+        try:
+            nums = [self._to_num(value) for value in values]
+        except InputValidationError:
+            nums = None
+        if nums is None or not self.values_in_range(nums) or (self.int_only and any(int(n) != n for n in nums)):
+            # Raise the same error that converting each value individually would raise first
+            nums = [self._validate(self._to_num(value)) for value in values]
+
+        one = self._timedelta(1)
+        # Multiplying by a whole number is exact; other values use the constructor to preserve its rounding behavior
+        return [one * int(num) if isinstance(num, int) or num.is_integer() else self._timedelta(num) for num in nums]
+
+    def _timedelta(self, num: int | float) -> timedelta:
+        return timedelta(**{self.unit: num})  # type: ignore[misc]
+
+    def _validate(self, value: int | float) -> int | float:
         if self.value_lt_min(value) or self.value_gt_max(value):
             raise self._invalid(value, f'expected a value in the range {self._range_str()}')
         elif self.int_only and int(value) != value:
             raise self._invalid(value, f'expected an integer, not a {value.__class__.__name__}')
+        return value
 
-        return timedelta(**{self.unit: value})  # type: ignore[misc]
+    def _to_num(self, value: str | int | float) -> int | float:
+        if not isinstance(value, str):
+            return value
+        try:
+            return float(value.replace(',', '').replace('_', ''))  # allow comma or _ between thousands
+        except ValueError as e:
+            exp_type = 'integer' if self.int_only else 'integer or float'
+            raise self._invalid(value, f'expected an {exp_type}') from e
 
     def _invalid(self, value: Number, message: str) -> InputValidationError:
         return InputValidationError(f'Invalid numeric {self.unit}={value!r} - {message}')
@@ -406,10 +728,13 @@ class TimeDelta(RangeMixin, InputType[timedelta]):
 
 
 class DateTimeInput(DTInput[DT], ABC):
-    formats: Collection[str]
+    _formats: Collection[str]
     _type: ClassVar[Type[DT]]
     _earliest: TimeBound = None
     _latest: TimeBound = None
+    _parse_order: list[_DTFormat]
+    _localized: bool
+    _reorder: bool
     # TODO: Add usage examples to the more user-friendly docs
 
     def __init_subclass__(cls, type: Type[DT], **kwargs):  # noqa
@@ -429,6 +754,20 @@ class DateTimeInput(DTInput[DT], ABC):
         self.earliest = earliest
         self.latest = latest
 
+    @property
+    def formats(self) -> Collection[str]:
+        return self._formats
+
+    @formats.setter
+    def formats(self, formats: Collection[str]):
+        self._formats = formats
+        self._parse_order = compiled = [_compile_format(fmt) for fmt in formats]
+        self._localized = any(fmt.localized for fmt in compiled)
+        # Trying the most recently successful format first can only be done when no value could match more than one
+        # format - otherwise, the result of parsing a given value could depend on values that were parsed before it.
+        signatures = [fmt.signature for fmt in compiled]
+        self._reorder = None not in signatures and len(set(signatures)) == len(signatures)
+
     @classmethod
     def _fix_type(cls, dt: datetime | None) -> DT | None:
         try:
@@ -465,12 +804,17 @@ class DateTimeInput(DTInput[DT], ABC):
             )
 
     def parse_dt(self, value: str) -> datetime:
-        with different_locale(self.locale):
-            for fmt in self.formats:
-                try:
-                    return datetime.strptime(value, fmt)
-                except ValueError:
-                    pass
+        # Tables are only needed if at least one format contains a locale-dependent directive
+        tables = LocaleTables.for_locale(self.locale) if self.locale and self._localized else None
+        order = self._parse_order
+        for i, fmt in enumerate(order):
+            try:
+                dt = tables.strptime(value, fmt.format) if tables and fmt.localized else fmt.parse(value)
+            except ValueError:
+                continue
+            if i and self._reorder:  # Values parsed in bulk typically share a format, so try this one first next time
+                self._parse_order = [fmt, *order[:i], *order[i + 1 :]]
+            return dt
 
         raise InputValidationError(
             f'Expected a {self.dt_type} matching one of the following formats: {self.choice_str()}'
@@ -7,27 +7,36 @@ Utils for input types
 from __future__ import annotations
 
 import json
+import os
 import sys
 import warnings
+from collections import OrderedDict
 from contextlib import contextmanager
+from copy import deepcopy
+from enum import Enum
 from pathlib import Path
 from stat import S_IFBLK, S_IFCHR, S_IFDIR, S_IFIFO, S_IFLNK, S_IFMT, S_IFREG, S_IFSOCK
-from typing import IO, TYPE_CHECKING, Any, AnyStr, Generic, Iterator, Literal, TypeVar, overload
+from threading import Lock
+from typing import IO, TYPE_CHECKING, Any, AnyStr, Callable, Generic, Iterator, Literal, Sequence, TypeVar, overload
 from weakref import finalize
 
-from ..utils import FixedFlag
+from ..utils import FixedFlag, MissingMixin
 from ._typing import FileSerializer
 from .exceptions import InputValidationError
 
 if TYPE_CHECKING:
-    from ..typing import Bool, OptStr, Self
+    from ..typing import Bool, OptStr, PathLike, Self
     from ._typing import AnySerializer, Number, OpenAnyMode, OpenBinaryMode, OpenTextMode, SupportsRead, SupportsRW
 
 __all__ = [
     'InputParam',
     'StatMode',
+    'StreamMode',
+    'Compression',
     'FileWrapper',
     'SerializedFileWrapper',
+    'SerializedCache',
+    'StatCache',
     'JsonSerializer',
     'fix_windows_path',
     'range_str',
@@ -36,6 +45,8 @@ __all__ = [
 
 T = TypeVar('T')
 
+DEFAULT_BUFFER_SIZE = 65536
+
 
 class InputParam(Generic[T]):
     __slots__ = ('default', 'name')
@@ -114,6 +125,80 @@ class StatMode(FixedFlag):
         return ', '.join(names)
 
 
+class StreamMode(MissingMixin, Enum):
+    """The StreamMode for a given File input governs the type of iterator it returns during parsing."""
+
+    # fmt: off
+    LINES = 'lines'     #: Yield one line at a time
+    CHUNKS = 'chunks'   #: Yield fixed-size chunks
+    # fmt: on
+
+
+class Compression(MissingMixin, Enum):
+    """
+    The compression format to use when reading or writing a file.  Only formats supported by the stdlib are supported.
+
+    When :attr:`Compression.AUTO` is used, the format is detected based on the file's content when reading (if the
+    content does not match a known format, then it is treated as uncompressed), or based on the file extension when
+    writing.
+    """
+
+    # fmt: off
+    AUTO = 'auto'   #: Detect the compression format automatically
+    GZIP = 'gzip'   #: gzip (``.gz``)
+    BZ2 = 'bz2'     #: bzip2 (``.bz2``)
+    LZMA = 'lzma'   #: xz / lzma (``.xz`` / ``.lzma``)
+    # fmt: on
+
+    @classmethod
+    def detect(cls, path: Path, mode: str) -> Compression | None:
+        if allows_write(mode, True):
+            return _SUFFIX_COMPRESSION_MAP.get(path.suffix.lower())
+
+        try:
+            if path.parts == ('-',):
+                head = sys.stdin.buffer.peek(6)[:6]  # Only supported if stdin is a buffered reader
+            else:
+                with path.open('rb') as f:
+                    head = f.read(6)
+        except (AttributeError, OSError):
+            return None
+
+        return next((comp for magic, comp in _MAGIC_COMPRESSION_MAP if head.startswith(magic)), None)
+
+    def open(self, file: Path | IO[bytes], mode: str, encoding: OptStr = None, errors: OptStr = None) -> IO:
+        if 'b' not in mode and 't' not in mode:
+            mode += 't'  # The compression modules default to binary mode
+
+        if self == Compression.GZIP:
+            import gzip
+
+            return gzip.open(file, mode, encoding=encoding, errors=errors)
+        elif self == Compression.BZ2:
+            import bz2
+
+            return bz2.open(file, mode, encoding=encoding, errors=errors)
+        elif self == Compression.LZMA:
+            import lzma
+
+            return lzma.open(file, mode, encoding=encoding, errors=errors)
+        raise ValueError(f'Unable to open a file with compression={self}')  # AUTO should be resolved before this
+
+
+_SUFFIX_COMPRESSION_MAP = {
+    '.gz': Compression.GZIP,
+    '.bz2': Compression.BZ2,
+    '.xz': Compression.LZMA,
+    '.lzma': Compression.LZMA,
+}
+_MAGIC_COMPRESSION_MAP = (
+    (b'\x1f\x8b', Compression.GZIP),
+    (b'BZh', Compression.BZ2),
+    (b'\xfd7zXZ\x00', Compression.LZMA),
+    (b']\x00\x00', Compression.LZMA),
+)
+
+
 class FileWrapper(Generic[AnyStr]):
     if TYPE_CHECKING:
 
@@ -126,6 +211,7 @@ class FileWrapper(Generic[AnyStr]):
             encoding: OptStr = None,
             errors: OptStr = None,
             parents: Bool = False,
+            compression: Compression | None = None,
         ): ...
 
         @overload
@@ -137,6 +223,7 @@ class FileWrapper(Generic[AnyStr]):
             encoding: OptStr = None,
             errors: OptStr = None,
             parents: Bool = False,
+            compression: Compression | None = None,
         ): ...
 
         @overload
@@ -148,6 +235,7 @@ class FileWrapper(Generic[AnyStr]):
             encoding: OptStr = None,
             errors: OptStr = None,
             parents: Bool = False,
+            compression: Compression | None = None,
         ): ...
 
     def __init__(
@@ -158,6 +246,7 @@ class FileWrapper(Generic[AnyStr]):
         encoding: OptStr = None,
         errors: OptStr = None,
         parents: Bool = False,
+        compression: Compression | None = None,
     ):
         self.path = path
         self.mode = mode
@@ -165,11 +254,12 @@ class FileWrapper(Generic[AnyStr]):
         self.encoding = encoding
         self.errors = errors
         self.parents = parents
+        self.compression = compression
         self._fp: IO | None = None
         self._finalizer: finalize | None = None
 
     def __eq__(self, other) -> bool:
-        attrs = ('path', 'mode', 'binary', 'encoding', 'errors', 'parents')
+        attrs = ('path', 'mode', 'binary', 'encoding', 'errors', 'parents', 'compression')
         try:
             return all(getattr(self, a) == getattr(other, a) for a in attrs)
         except AttributeError:  # not a FileWrapper
@@ -183,21 +273,65 @@ class FileWrapper(Generic[AnyStr]):
         with self as f:
             f.write(data)
 
-    def _open(self) -> SupportsRW[AnyStr]:
+    def iter_lines(self, buffer_size: int = -1) -> Iterator[AnyStr]:
+        """
+        Lazily open the file and yield its lines, one at a time.  The file is closed when the end of the file is reached
+        or when the returned generator is closed.
+
+        :param buffer_size: The buffer size to use when opening the file (see :func:`python:open`).  Ignored if the
+          path is ``-``.  Values less than 2 (which would request unbuffered or line buffered I/O) result in the default
+          buffer size being used.
+        """
+        try:
+            yield from self._open(buffer_size if buffer_size > 1 else -1)
+        finally:
+            self.close()
+
+    def iter_chunks(self, size: int = DEFAULT_BUFFER_SIZE) -> Iterator[AnyStr]:
+        """
+        Lazily open the file and yield chunks of (up to) the specified size.  The file is closed when the end of the
+        file is reached or when the returned generator is closed.
+
+        :param size: The number of bytes (or characters, in text mode) to read at a time.
+        """
+        try:
+            read = self._open(size if size > 1 else -1).read
+            while chunk := read(size):
+                yield chunk
+        finally:
+            self.close()
+
+    def _open(self, buffering: int = -1) -> SupportsRW[AnyStr]:
+        compression = self._get_compression()
         if self.path == Path('-'):
             stream = sys.stdin if 'r' in self.mode else sys.stdout
-            return stream.buffer if self.binary else stream  # type: ignore[return-value]
+            if compression is None:
+                return stream.buffer if self.binary else stream  # type: ignore[return-value]
+            # Closing the (de)compressor is necessary to flush it, but it will not close the underlying stream
+            return self._track(compression.open(stream.buffer, self.mode, self.encoding, self.errors))
 
         if self.parents and allows_write(self.mode):
             self.path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            self._fp = fp = self.path.open(self.mode, encoding=self.encoding, errors=self.errors)
+            if compression is None:
+                fp = self.path.open(self.mode, buffering, encoding=self.encoding, errors=self.errors)
+            else:
+                fp = compression.open(self.path, self.mode, self.encoding, self.errors)
         except OSError as e:
             raise InputValidationError(f'Unable to open {self.path} - {e}') from e
         else:
-            self._finalizer = finalize(self, self._cleanup, fp, f'Implicitly cleaning up {self.path}')
-            return fp
+            return self._track(fp)
+
+    def _get_compression(self) -> Compression | None:
+        if self.compression == Compression.AUTO:
+            return Compression.detect(self.path, self.mode)
+        return self.compression
+
+    def _track(self, fp: IO) -> IO:
+        self._fp = fp
+        self._finalizer = finalize(self, self._cleanup, fp, f'Implicitly cleaning up {self.path}')
+        return fp
 
     @classmethod
     def _cleanup(cls, fp: IO, warn_msg: str):
@@ -240,12 +374,15 @@ class SerializedFileWrapper(FileWrapper[AnyStr]):
         encoding: OptStr = None,
         errors: OptStr = None,
         parents: Bool = False,
+        compression: Compression | None = None,
+        cache: SerializedCache | None = None,
     ):
-        super().__init__(path, mode, encoding=encoding, errors=errors, parents=parents)
+        super().__init__(path, mode, encoding=encoding, errors=errors, parents=parents, compression=compression)
         self.serializer = serializer
+        self.cache = cache
 
     def __eq__(self, other) -> bool:
-        attrs = ('__class__', 'path', 'mode', 'binary', 'encoding', 'errors', 'serializer', 'parents')
+        attrs = ('__class__', 'path', 'mode', 'binary', 'encoding', 'errors', 'serializer', 'parents', 'compression')
         return all(getattr(self, a) == getattr(other, a) for a in attrs)
 
     def __enter__(self) -> Self:  # type: ignore[override]
@@ -259,6 +396,11 @@ class SerializedFileWrapper(FileWrapper[AnyStr]):
             self.close()
 
     def read(self) -> Any:
+        if self.cache is not None and self.path != Path('-'):
+            return self.cache.get(self, self._read)
+        return self._read()
+
+    def _read(self) -> Any:
         with self._file() as f:
             if hasattr(self.serializer, 'load'):
                 return self.serializer.load(f)
@@ -272,6 +414,135 @@ class SerializedFileWrapper(FileWrapper[AnyStr]):
                 f.write(self.serializer.dumps(data))
 
 
+class SerializedCache:
+    """
+    A thread-safe LRU cache of deserialized file contents.  Entries are keyed by resolved path and serializer, and they
+    are only used while the file's size and modification time remain unchanged.
+
+    :param max_size: The maximum number of files for which deserialized content should be stored
+    :param copy: Whether a deep copy of the cached object should be returned instead of the cached object itself.
+      This prevents modifications made by one caller from being visible to subsequent callers.
+    """
+
+    __slots__ = ('max_size', 'copy', 'hits', 'misses', '_data', '_lock')
+
+    def __init__(self, max_size: int, copy: Bool = False):
+        self.max_size = max_size
+        self.copy = copy
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[tuple[Path, Any], tuple[int, int, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, wrapper: SerializedFileWrapper, load: Callable[[], Any]) -> Any:
+        try:
+            path = wrapper.path.resolve()
+            stat = path.stat()
+        except OSError:
+            return load()  # Allow the normal open/read error handling to occur
+
+        key, version = (path, wrapper.serializer), (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            try:
+                size, mtime_ns, obj = self._data[key]
+            except KeyError:
+                pass
+            else:
+                if (size, mtime_ns) == version:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return deepcopy(obj) if self.copy else obj
+
+        obj = load()
+        with self._lock:
+            self.misses += 1
+            self._data[key] = (*version, obj)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+        return deepcopy(obj) if self.copy else obj
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class StatCache:
+    """
+    Caches the results of ``stat`` calls and directory listings so that repeated or sibling paths do not trigger
+    redundant syscalls.  A new cache is used for each parsing :class:`.Context`, so results are never retained between
+    parses.  The ``hits`` and ``misses`` counters may be used for instrumentation.
+    """
+
+    __slots__ = ('hits', 'misses', '_stats', '_listings')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._stats: dict[str, os.stat_result | None] = {}
+        self._listings: dict[str, dict[str, os.DirEntry]] = {}
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}(hits={self.hits}, misses={self.misses})>'
+
+    def stat(self, path: PathLike) -> os.stat_result | None:
+        """
+        :param path: The path to stat.  Symlinks are followed, like :func:`python:os.stat`.
+        :return: The stat result for the given path, or None if it does not exist or could not be accessed.
+        """
+        key = os.fspath(path)
+        try:
+            result = self._stats[key]
+        except KeyError:
+            self.misses += 1
+            self._stats[key] = result = self._stat(key)
+        else:
+            self.hits += 1
+        return result
+
+    def _stat(self, key: str) -> os.stat_result | None:
+        parent, name = os.path.split(key)
+        # A missing entry is not treated as authoritative, since names may differ in case on some filesystems
+        if (listing := self._listings.get(parent or '.')) and (entry := listing.get(name)):
+            try:
+                return entry.stat()  # Free on Windows; cached on the entry on other platforms
+            except OSError:
+                return None
+
+        try:
+            return os.stat(key)
+        except (OSError, ValueError):
+            return None
+
+    def exists(self, path: PathLike) -> bool:
+        return self.stat(path) is not None
+
+    def scandir(self, path: PathLike) -> dict[str, os.DirEntry]:
+        """
+        :param path: The path of a directory
+        :return: A mapping of ``{name: DirEntry}`` for the contents of the given directory.  If the directory does not
+          exist or could not be read, then the mapping will be empty.
+        """
+        key = os.fspath(path) or '.'
+        try:
+            listing = self._listings[key]
+        except KeyError:
+            self.misses += 1
+            try:
+                with os.scandir(key) as entries:
+                    listing = {entry.name: entry for entry in entries}
+            except OSError:
+                listing = {}
+            self._listings[key] = listing
+        else:
+            self.hits += 1
+        return listing
+
+
 class JsonSerializer(FileSerializer[str]):
     __slots__ = ('wrap_errors',)
     dump = staticmethod(json.dump)  # noqa
@@ -356,3 +627,14 @@ class RangeMixin:
         if self.max is not None:
             return (value > self.max) if self.include_max else (value >= self.max)
         return False
+
+    def values_in_range(self, values: Sequence[Number]) -> bool:
+        """
+        :param values: A non-empty sequence of numeric values
+        :return: True if all of the given values are within this range's bounds, False otherwise
+        """
+        lo, hi = min(values), max(values)  # type: ignore[type-var]
+        if lo != lo or hi != hi:  # NaN - min / max are not reliable
+            return not any(self.value_lt_min(value) or self.value_gt_max(value) for value in values)
+        # Only the smallest and largest values need to be compared to the bounds
+        return not self.value_lt_min(lo) and not self.value_gt_max(hi)
@@ -0,0 +1,325 @@
+"""
+Utilities for exporting Commands to a versioned, JSON-serializable manifest, and for answering usage / help / completion
+queries from a previously exported manifest without importing the modules that define the Commands.
+
+:author: Doug Skrypa
+"""
+
+from __future__ import annotations
+
+import json
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Sequence
+
+from .__version__ import __version__
+from .context import Context
+from .core import get_metadata, get_params
+from .inputs.choices import _ChoicesBase
+from .nargs import REMAINDER
+from .parameters import BaseOption, ParamGroup
+from .parameters.choice_map import ChoiceMap
+from .utils import _NotSet, camel_to_snake_case
+
+if TYPE_CHECKING:
+    from .parameters import Parameter
+    from .typing import CommandCls, OptStr, PathLike
+
+__all__ = ['MANIFEST_VERSION', 'build_manifest', 'dump_manifest', 'CommandManifest', 'ManifestCommand']
+
+#: The version of the manifest format.  Incremented when the format changes in a way that is not backwards compatible.
+MANIFEST_VERSION = 1
+
+Entry = dict[str, Any]
+
+
+# region Export
+
+
+def build_manifest(command: CommandCls, terminal_width: int = 80) -> Entry:
+    """
+    Build a manifest for the given Command and all of its subcommands.  The manifest contains the structure of each
+    Command's Parameters (option strings, nargs, choices, env vars, defaults, groups, etc.), and the pre-rendered usage
+    and help text for each Command.
+
+    :param command: The top-level :class:`.Command` to export
+    :param terminal_width: The terminal width to use when rendering usage and help text
+    :return: A dict that can be serialized as JSON
+    """
+    commands: dict[CommandCls, str] = {}
+    entries: dict[str, Entry] = {}
+    _add_command(command, '', commands, entries, terminal_width)
+    with Context([], command, terminal_width=terminal_width, allow_argv_prog=False):
+        rst = get_params(command).formatter.format_rst()
+
+    return {
+        'manifest_version': MANIFEST_VERSION,
+        'generator': f'cli_command_parser {__version__}',
+        'root': '',
+        'rst': rst,
+        'commands': entries,
+    }
+
+
+def dump_manifest(command: CommandCls, path: PathLike | None = None, terminal_width: int = 80) -> str:
+    """
+    Build a manifest for the given Command via :func:`build_manifest`, and serialize it as JSON.
+
+    :param command: The top-level :class:`.Command` to export
+    :param path: If specified, the JSON manifest will be written to a file with this path
+    :param terminal_width: The terminal width to use when rendering usage and help text
+    :return: The serialized JSON manifest
+    """
+    serialized = json.dumps(build_manifest(command, terminal_width), indent=2, ensure_ascii=False)
+    if path is not None:
+        Path(path).write_text(serialized, encoding='utf-8')
+    return serialized
+
+
+def _add_command(
+    command: CommandCls, key: str, commands: dict[CommandCls, str], entries: dict[str, Entry], terminal_width: int
+) -> str:
+    """Add an entry for the given Command (and, recursively, its subcommands) if one was not already added"""
+    try:
+        return commands[command]  # An alias for a subcommand that was already processed
+    except KeyError:
+        commands[command] = key
+
+    params = get_params(command)
+    with Context([], command, terminal_width=terminal_width, allow_argv_prog=False):
+        formatter = params.formatter
+        entry = {
+            'name': command.__qualname__,
+            'prog': get_metadata(command).get_prog(False),
+            'usage': formatter.format_usage(allow_sys_argv=False),
+            'help': formatter.format_help(allow_sys_argv=False),
+            'params': [_param_entry(param) for param in params.iter_params()],
+            'groups': [_group_entry(group) for group in params.groups],
+        }
+
+    entries[key] = entry
+    entry['subcommands'] = subcommands = {}
+    if sub_command := params.sub_command:
+        for choice, choice_obj in sub_command.choices.items():
+            if not choice:
+                continue
+            elif (target := choice_obj.target) is None:  # The default choice, pointing back to the same Command
+                subcommands[choice] = key
+            else:
+                subcommands[choice] = _add_command(target, f'{key} {choice}'.strip(), commands, entries, terminal_width)
+
+    return key
+
+
+def _param_entry(param: Parameter) -> Entry:
+    nargs = param.nargs
+    entry = {
+        'name': param.name,
+        'kind': camel_to_snake_case(param.__class__.__name__),
+        'option_strs': list(param.option_strs.all_option_strs()) if isinstance(param, BaseOption) else [],
+        'nargs': {'min': nargs.min, 'max': nargs.max if isinstance(nargs.max, int) else None},
+        'remainder': nargs.max is REMAINDER,
+        'required': bool(param.required),
+        'hidden': not param.show_in_help,
+        'choices': _choice_strs(param),
+        'env_vars': list(param.env_vars()) if isinstance(param, BaseOption) else [],
+        'help': param.help,
+        'usage': param.formatter.format_usage(include_meta=True, full=True),
+        'group': param.group.name if param.group else None,
+    }
+    if (default := param.default) is not _NotSet:
+        entry['default'] = _json_value(default)
+    return entry
+
+
+def _group_entry(group: ParamGroup) -> Entry:
+    return {
+        'name': group.name,
+        'description': group.description,
+        'mutually_exclusive': group.mutually_exclusive,
+        'mutually_dependent': group.mutually_dependent,
+        'required': bool(group.required),
+        'members': [member.name for member in group.members],
+    }
+
+
+def _choice_strs(param: Parameter) -> list[str] | None:
+    if isinstance(param, ChoiceMap):
+        return [choice for choice in param.choices if choice]
+    elif isinstance(param.type, _ChoicesBase):
+        return list(map(str, param.type.choices))
+    return None
+
+
+def _json_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    elif isinstance(value, Enum):
+        return value.name
+    elif isinstance(value, Mapping):
+        return {str(k): _json_value(v) for k, v in value.items()}
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        return [_json_value(v) for v in value]
+    return str(value)
+
+
+# endregion
+
+
+# region Load
+
+
+class CommandManifest:
+    """
+    A manifest that was exported via :func:`build_manifest` or :func:`dump_manifest`.  Answers usage, help, and
+    completion queries without importing the Commands that it describes.
+
+    :param data: The deserialized manifest
+    """
+
+    __slots__ = ('version', 'generator', 'rst', 'commands', 'root')
+
+    def __init__(self, data: Mapping[str, Any]):
+        if (version := data.get('manifest_version')) != MANIFEST_VERSION:
+            raise ValueError(f'Unsupported manifest_version={version!r} - expected {MANIFEST_VERSION}')
+
+        self.version: int = version
+        self.generator: str = data.get('generator', '')
+        self.rst: str = data.get('rst', '')
+        self.commands = {key: ManifestCommand(key, entry) for key, entry in data['commands'].items()}
+        self.root = self.commands[data['root']]
+
+    @classmethod
+    def load(cls, path: PathLike) -> CommandManifest:
+        """Load a manifest from the JSON file with the given path"""
+        return cls(json.loads(Path(path).read_text(encoding='utf-8')))
+
+    @classmethod
+    def loads(cls, serialized: str) -> CommandManifest:
+        """Load a manifest from the given JSON string"""
+        return cls(json.loads(serialized))
+
+    def get_command(self, args: Sequence[str] = ()) -> ManifestCommand:
+        """
+        :param args: Command line arguments that may include subcommand choices
+        :return: The entry for the (sub)command that would be selected by the given arguments
+        """
+        return self._resolve(args)[0]
+
+    def format_usage(self, args: Sequence[str] = ()) -> str:
+        return self.get_command(args).usage
+
+    def format_help(self, args: Sequence[str] = ()) -> str:
+        return self.get_command(args).help
+
+    def complete(self, args: Sequence[str], incomplete: str = '') -> list[str]:
+        """
+        :param args: The complete arguments that were already provided
+        :param incomplete: The (potentially empty) argument that is currently being typed
+        :return: The sorted values that could be used to complete the current argument
+        """
+        command, words, option = self._resolve(args)
+        if option is not None:
+            candidates: Iterator[str] = iter(option['choices'] or ())
+        elif words is None:  # Everything after ``--`` is passed through
+            return []
+        elif incomplete.startswith('-'):
+            candidates = command.iter_option_strs()
+        else:
+            candidates = command.iter_next_words(words)
+
+        return sorted({value for value in candidates if value.startswith(incomplete)})
+
+    def _resolve(self, args: Sequence[str]) -> tuple[ManifestCommand, list[str] | None, Entry | None]:
+        command = self.root
+        words: list[str] = []
+        option, remaining = None, 0
+        for arg in args:
+            if remaining:
+                remaining -= 1
+                continue
+
+            option = None
+            if arg == '--':
+                return command, None, None
+            elif arg.startswith('-') and len(arg) > 1:
+                opt, eq, _ = arg.partition('=')
+                if not eq and (option := command.option_map.get(opt)):
+                    remaining = option['nargs']['min']
+                    if not remaining and option['nargs']['max'] != 0 and option['choices']:
+                        remaining = 1
+                    option = option if remaining else None
+                continue
+
+            words.append(arg)
+            if sub_cmd_key := command.find_subcommand(words):
+                command = self.commands[sub_cmd_key]
+                words = []
+
+        return command, words, option if remaining else None
+
+
+class ManifestCommand:
+    """The manifest entry for a single Command or subcommand"""
+
+    __slots__ = ('key', 'name', 'prog', 'usage', 'help', 'params', 'groups', 'subcommands', 'option_map')
+
+    def __init__(self, key: str, entry: Mapping[str, Any]):
+        self.key = key
+        self.name: str = entry['name']
+        self.prog: str = entry['prog']
+        self.usage: str = entry['usage']
+        self.help: str = entry['help']
+        self.params: list[Entry] = entry['params']
+        self.groups: list[Entry] = entry['groups']
+        self.subcommands: dict[str, str] = entry['subcommands']
+        self.option_map = {opt: param for param in self.params for opt in param['option_strs']}
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}[{self.name}, key={self.key!r}]>'
+
+    def get_param(self, name: str) -> Entry:
+        try:
+            return next(param for param in self.params if param['name'] == name)
+        except StopIteration:
+            raise KeyError(name) from None
+
+    def find_subcommand(self, words: Sequence[str]) -> OptStr:
+        """
+        :param words: The positional arguments that were provided since the last subcommand choice.  Values for other
+          positional parameters may precede the subcommand choice.
+        :return: The key for the selected subcommand, if the words end with a subcommand choice, otherwise None
+        """
+        subcommands = self.subcommands
+        for i in range(len(words)):
+            if (key := subcommands.get(' '.join(words[i:]))) is not None:
+                return key
+        return None
+
+    def iter_option_strs(self) -> Iterator[str]:
+        for param in self.params:
+            if not param['hidden']:
+                yield from param['option_strs']
+
+    def iter_next_words(self, words: Sequence[str]) -> Iterator[str]:
+        """
+        :param words: The positional arguments that were provided since the last subcommand choice
+        :return: The values that may be provided as the next positional argument
+        """
+        choices = [*self.subcommands]
+        for param in self.params:
+            if not param['option_strs'] and param['choices'] and param['kind'] != 'sub_command':
+                choices.extend(param['choices'])
+
+        # Choices may contain multiple words, which may have been partially provided already.  The longest partially
+        # provided choices take precedence.
+        split_choices = [choice.split() for choice in choices]
+        for i in range(len(words) + 1):
+            provided = words[i:]
+            n = len(provided)
+            if matches := [parts[n] for parts in split_choices if len(parts) > n and parts[:n] == provided]:
+                yield from matches
+                return
+
+
+# endregion
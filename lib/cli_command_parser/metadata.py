@@ -12,6 +12,7 @@ from collections import defaultdict
 from functools import cached_property
 from importlib.metadata import Distribution, EntryPoint, entry_points
 from inspect import getmodule
+from os.path import normcase
 from pathlib import Path
 from sys import modules
 from textwrap import dedent
@@ -390,14 +391,18 @@ class ProgFinder:
     @classmethod
     def _from_sys_argv(cls) -> OptStr:
         try:
-            ctx_prog = get_current_context().prog
+            context = get_current_context()
         except NoActiveContext:
             return None
 
-        if ctx_prog:
+        if ctx_prog := context.prog:
             path = Path(ctx_prog)
+            stat_cache = context.stat_cache
             # Windows allows invocation without .exe - assume a file with an extension is a match
-            if path.exists() or next(path.parent.glob(f'{path.name}.???'), None) is not None:
+            prefix, ext_len = normcase(f'{path.name}.'), len(path.name) + 4
+            if stat_cache.exists(path) or any(
+                len(name) == ext_len and normcase(name).startswith(prefix) for name in stat_cache.scandir(path.parent)
+            ):
                 return path.name
 
         return None
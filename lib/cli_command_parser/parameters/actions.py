@@ -7,15 +7,17 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import TYPE_CHECKING, ClassVar, Generic, NoReturn, TypeVar, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, NoReturn, TypeVar, Union
 
 from ..context import ctx
 from ..exceptions import BadArgument, InvalidChoice, MissingArgument, ParamConflict, ParamUsageError, TooManyArguments
 from ..inputs import InputType
-from ..nargs import Nargs
+from ..nargs import REMAINDER, Nargs
 from ..utils import _NotSet, camel_to_snake_case
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from ..commands import Command
     from ..typing import Bool, OptStr
     from .base import BaseFlag, Parameter
@@ -104,12 +106,18 @@ class ParamAction(ABC, Generic[P]):
     def add_env_value(self, value: str, env_var: str) -> Found:
         return self.add_value(value, env_var=env_var)
 
-    # Note: Not used yet
-    # def add_values(self, values: Sequence[str], *, combo: bool = False) -> Found:
-    #     added = 0
-    #     for value in values:
-    #         added += self.add_value(value, combo=combo)
-    #     return added
+    def add_values(self, values: Sequence[str], *, combo: bool = False) -> Found:
+        """
+        Execute this action for the given Parameter and multiple values that were provided at the same time.
+
+        :param values: The values that were provided.
+        :param combo: Only True when a short option was provided, where the option string was combined with a value.
+        :return: The number of new values discovered
+        """
+        added = 0
+        for value in values:
+            added += self.add_value(value, combo=combo)
+        return added
 
     def add_const(self, *, opt: OptStr = None, combo: bool = False) -> Found:  # noqa
         ctx.record_action(self.param)
@@ -205,14 +213,16 @@ class _ValueAction(ParamAction[P], ABC):
 
         parsed.append(value)
 
-    # Note: Not used yet
-    # def extend_values(self, values: Iterable[T_co]):
-    #     parsed = ctx.get_parsed_value(self.param)
-    #     if parsed is _NotSet:
-    #         parsed = self.get_default()
-    #         ctx.set_parsed_value(self.param, parsed)
-    #
-    #     parsed.extend(values)
+    def extend_values(self, values: Sequence[Any]):
+        parsed = ctx.get_parsed_value(self.param)
+        if parsed is _NotSet:
+            parsed = self.get_default()
+            ctx.set_parsed_value(self.param, parsed)
+
+        if (max_count := self.param.nargs.max) not in (None, REMAINDER) and len(parsed) + len(values) > max_count:
+            raise TooManyArguments(self.param, f'already found {len(parsed)} values')
+
+        parsed.extend(values)
 
 
 class _ConstAction(ParamAction[F], ABC):
@@ -316,16 +326,14 @@ class Append(_ValueAction, accepts_values=True):
         self.append_value(value)
         return 1
 
-    # Note: Not used yet
-    # def add_values(self, values: Sequence[str], *, combo: bool = False) -> Found:
-    #     ctx.record_action(self.param)
-    #     if not values:
-    #         raise MissingArgument(self.param)
-    #     elif (val_count := len(values)) not in (nargs := self.param.nargs):
-    #         raise BadArgument(self.param, f'expected {nargs=} values but found {val_count}')
-    #
-    #     self.extend_values(value for value in self._prep_and_validate(values, combo))
-    #     return val_count
+    def add_values(self, values: Sequence[str], *, combo: bool = False) -> Found:
+        param = self.param
+        ctx.record_action(param)
+        values = param.prepare_values(values, combo)
+        for value in values:
+            param.validate(value)
+        self.extend_values(values)
+        return len(values)
 
     # endregion
 
@@ -513,7 +521,7 @@ class Concatenate(Append):
         values = value.split()
         if not param.is_valid_arg(' '.join(values)):
             ctx.record_action(param)
-            raise InvalidChoice(param, value, param.choices)
+            raise InvalidChoice(param, value, param.choices, suggest=param.suggest)
 
         parsed = ctx.get_parsed_value(param)
         if parsed is _NotSet:
@@ -525,6 +533,9 @@ class Concatenate(Append):
         ctx.record_action(param, n_values)
         return n_values
 
+    def add_values(self, values: Sequence[str], *, combo: bool = False) -> Found:
+        return self.add_value(' '.join(values), combo=combo)
+
     # endregion
 
     # region Parsing
@@ -542,7 +553,7 @@ class Concatenate(Append):
     def finalize_value(self, value):
         choice = ' '.join(super().finalize_value(value))
         if choice not in self.param.choices:
-            raise InvalidChoice(self.param, choice, self.param.choices)
+            raise InvalidChoice(self.param, choice, self.param.choices, suggest=self.param.suggest)
         return choice
 
     # endregion
@@ -554,7 +565,7 @@ class StoreAll(Store):
 
     # region Add Parsed Value / Constant Methods
 
-    def add_values(self, values: list[str], *, combo: bool = False) -> Found:
+    def add_values(self, values: Sequence[str], *, combo: bool = False) -> Found:
         param = self.param
         ctx.record_action(param)
 
@@ -563,7 +574,7 @@ class StoreAll(Store):
                 param, f'can only be specified once - found {values=} but a stored {value=} already exists'
             )
 
-        values = [param.prepare_value(v) for v in values]
+        values = param.prepare_values(values, combo)
         ctx.set_parsed_value(param, values)
         return len(values)
 
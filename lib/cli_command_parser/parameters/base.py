@@ -15,11 +15,11 @@ from typing import TYPE_CHECKING, Any, ClassVar, Generic, Iterator, Type, TypeVa
 
 from ..annotations import get_descriptor_value_type
 from ..config import DEFAULT_CONFIG, AllowLeadingDash, CommandConfig, OptionNameMode
-from ..context import get_current_context
+from ..context import _pop_prefetched, get_current_context
 from ..exceptions import BadArgument, InvalidChoice, MissingArgument, ParameterDefinitionError
 from ..inputs import InputType, normalize_input_type
 from ..inputs.choices import _ChoicesBase
-from ..inputs.exceptions import InputValidationError, InvalidChoiceError
+from ..inputs.exceptions import InputValidationError, InvalidChoiceError, ValueConversionError
 from ..inputs.numeric import NumericInput
 from ..nargs import REMAINDER, Nargs
 from ..typing import D, T
@@ -27,7 +27,7 @@ from ..utils import _NotSet, _NotSetType
 from .option_strings import OptionStrings
 
 if TYPE_CHECKING:
-    from collections.abc import Collection
+    from collections.abc import Collection, Sequence
     from typing import Literal, NoReturn, TypeAlias
 
     from ..commands import Command
@@ -432,9 +432,12 @@ class Parameter(ParamBase, Param[T | D], ABC):
             return value
 
         try:
+            # Values may have been converted concurrently if `file_input_workers` was configured
+            if (prefetched := _pop_prefetched(self, value)) is not None:
+                return prefetched.result()
             return self.type(value)
         except InvalidChoiceError as e:
-            raise InvalidChoice(self, e.invalid, e.choices, env_var) from e
+            raise InvalidChoice(self, e.invalid, e.choices, env_var, e.suggest) from e
         except InputValidationError as e:
             suffix = f' from env var={env_var!r}' if env_var else ''
             raise BadArgument(self, f'invalid input{suffix} - {e}') from e
@@ -445,6 +448,31 @@ class Parameter(ParamBase, Param[T | D], ABC):
             suffix = f' from env var={env_var!r}' if env_var else ''
             raise BadArgument(self, f'unable to cast {value=} to type={self.type!r}{suffix}') from e
 
+    def prepare_values(self, values: Sequence[str], short_combo: Bool = False) -> list[T | str]:
+        """
+        Prepare multiple values that were provided at the same time.  When this Parameter's type is an
+        :class:`~.inputs.InputType` that overrides :meth:`~.inputs.InputType.convert_many`, the values are converted in
+        a single ``convert_many`` call.
+        """
+        if self.type is None:
+            return list(values)
+        elif not isinstance(self.type, InputType) or type(self.type).convert_many is InputType.convert_many:
+            # Converting each value here is equivalent, and allows errors to identify the value that was rejected
+            return [self.prepare_value(value, short_combo) for value in values]
+
+        try:
+            return self.type.convert_many(values)
+        except InvalidChoiceError as e:
+            raise InvalidChoice(self, e.invalid, e.choices, suggest=e.suggest) from e
+        except InputValidationError as e:
+            raise BadArgument(self, f'invalid input - {e}') from e
+        except ValueConversionError as e:
+            raise BadArgument(self, f'bad value={e.value!r} for type={self.type!r}: {e}') from e.error
+        except (TypeError, ValueError) as e:
+            raise BadArgument(self, f'bad values={list(values)!r} for type={self.type!r}: {e}') from e
+        except Exception as e:
+            raise BadArgument(self, f'unable to cast values={list(values)!r} to type={self.type!r}') from e
+
     def prepare_validation_value(self, value: str, short_combo: Bool = False) -> T | str:
         if self.type is None or (isinstance(self.type, InputType) and self.type.is_valid_type(value)):
             return value
@@ -495,8 +523,13 @@ class Parameter(ParamBase, Param[T | D], ABC):
         if command is None:
             return self
 
-        with self._ctx(command, True):
+        if get_current_context(True):
+            # An already-active Context does not need to be entered again
             value = self.result(command)
+        else:
+            # Equivalent to `self._ctx(command, True)`, without checking for an active Context again
+            with getattr(command, '_Command__ctx', None) or get_current_context():
+                value = self.result(command)
 
         # If `_attr_name` is set, it indicates that this parameter was present when the Command was initially defined.
         # If it was not set, it means this parameter was added to the class late.  Such cases are supported, but they
@@ -8,14 +8,26 @@ from __future__ import annotations
 
 from functools import partial
 from string import printable, whitespace
-from typing import TYPE_CHECKING, Callable, Collection, Generic, Mapping, NoReturn, ParamSpec, Sequence, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Collection,
+    Generic,
+    Iterator,
+    Mapping,
+    NoReturn,
+    ParamSpec,
+    Sequence,
+    Type,
+    TypeVar,
+)
 
 from ..context import ctx
 from ..exceptions import BadArgument, CommandDefinitionError, InvalidChoice, ParameterDefinitionError
 from ..formatting.utils import format_help_entry
 from ..nargs import Nargs
 from ..typing import CommandCls
-from ..utils import _NotSet, _NotSetType, camel_to_snake_case, short_repr
+from ..utils import SuggestionIndex, _NotSet, _NotSetType, camel_to_snake_case, short_repr
 from .actions import Concatenate
 from .base import BasePositional
 
@@ -109,6 +121,7 @@ class ChoiceMap(BasePositional[str, None], Generic[T], actions=(Concatenate,)):
         self.title = title
         self.description = description
         self.choices = {}
+        self._suggestions: SuggestionIndex | None = None
 
     def register_default_cb(self, method):
         raise ParameterDefinitionError(f'{self.__class__.__name__}s do not support default callback methods')
@@ -148,6 +161,7 @@ class ChoiceMap(BasePositional[str, None], Generic[T], actions=(Concatenate,)):
 
         self.choices[choice] = Choice(choice, target, help, local)
         self._update_nargs()
+        self._suggestions = None
 
     @classmethod
     def _handle_duplicate_choice(cls, choice: OptStr, target: T, existing: Choice):
@@ -178,7 +192,22 @@ class ChoiceMap(BasePositional[str, None], Generic[T], actions=(Concatenate,)):
 
         prefix = choice + ' '
         if not any(c.startswith(prefix) for c in self.choices if c):
-            raise InvalidChoice(self, prefix[:-1], self.choices)
+            raise InvalidChoice(self, prefix[:-1], self.choices, suggest=self.suggest)
+
+    def suggest(self, value: str) -> list[str]:
+        """
+        :param value: A value (or space-separated partial choice) that did not match any of the registered choices
+        :return: The registered choices (or partial choices with the same number of words) most similar to the value
+        """
+        if self._suggestions is None:
+            self._suggestions = SuggestionIndex(self._iter_choice_prefixes())
+        return self._suggestions.suggest(value)
+
+    def _iter_choice_prefixes(self) -> Iterator[str]:
+        for choice in self.choices:
+            if choice:
+                words = choice.split()
+                yield from (' '.join(words[:i]) for i in range(1, len(words) + 1))
 
     def result(self, command: Command | None = None, missing_default: TD | _NotSetType = _NotSet) -> OptStr | TD:
         if not self.choices:
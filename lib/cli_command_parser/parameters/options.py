@@ -588,7 +588,7 @@ def after_main(*option_strs: str, order: int | float = 1, func: Callable | None
 def help_action(self):
     """The ``--help`` / ``-h`` action.  Prints help text, then exits."""
     cls = self.__class__
-    print(cls.__class__.params(cls).formatter.format_help())
+    cls.__class__.params(cls).formatter.write_help()
     raise ParserExit
 
 
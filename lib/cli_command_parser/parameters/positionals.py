@@ -6,7 +6,8 @@ Positional Parameters
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+import sys
+from typing import TYPE_CHECKING, Any, Iterator, Literal
 
 from ..exceptions import ParameterDefinitionError
 from ..inputs import normalize_input_type
@@ -17,7 +18,8 @@ from .actions import Append, Store
 from .base import AllowLeadingDashProperty, BasePositional
 
 if TYPE_CHECKING:
-    from ..typing import ChoicesType, InputTypeFunc
+    from ..commands import Command
+    from ..typing import Bool, ChoicesType, InputTypeFunc, OptStr
     from ._typing import DefaultFunc, LeadingDash
 
 __all__ = ['Positional']
@@ -49,10 +51,16 @@ class Positional(BasePositional[T, D], default_ok=True, actions=(Store, Append))
       ``AllowLeadingDash.ALWAYS`` to allow any value that begins with a dash (as long as it is not an option string for
       an Option/Flag/etc).  To reject all values beginning with a dash, including numbers, use ``False`` / ``never`` /
       ``AllowLeadingDash.NEVER``.
+    :param stdin: Whether values may be read from stdin.  Only supported when ``action='append'``.  When enabled, if
+      ``-`` is provided as a value, or if no values were provided and stdin is not a TTY, then the parsed value will
+      be a generator that lazily yields values from stdin, one per non-empty line.  Values read from stdin are
+      converted using ``type`` as they are consumed, so invalid values will result in an exception being raised during
+      iteration instead of during parsing.  Defaults to ``False``.
     :param kwargs: Additional keyword arguments to pass to :class:`.BasePositional`.
     """
 
     allow_leading_dash = AllowLeadingDashProperty()
+    stdin: Bool = False
 
     def __init__(
         self,
@@ -64,6 +72,7 @@ class Positional(BasePositional[T, D], default_ok=True, actions=(Store, Append))
         default_cb: DefaultFunc[D] | None = None,
         choices: ChoicesType[T] = None,
         allow_leading_dash: LeadingDash | None = None,
+        stdin: Bool = False,
         **kwargs,
     ):
         if nargs_provided := nargs is not None:
@@ -87,7 +96,44 @@ class Positional(BasePositional[T, D], default_ok=True, actions=(Store, Append))
             raise ParameterDefinitionError(
                 f'Invalid {default=} or {default_cb=} - only allowed for Positional parameters when nargs=? or nargs=*'
             )
+        if stdin and action != 'append':
+            raise ParameterDefinitionError(f'Invalid {action=} with stdin=True - only append is supported')
+
         kwargs.setdefault('required', required)
         super().__init__(action=action, default=default, default_cb=default_cb, **kwargs)
         self.type = normalize_input_type(type, choices)  # type: ignore[assignment]
         self.allow_leading_dash = allow_leading_dash
+        if stdin:
+            self.stdin = stdin
+
+    # region Stdin Handling
+
+    def prepare_value(self, value: str, short_combo: Bool = False, env_var: OptStr = None) -> T | str:
+        if self.stdin and value == '-':
+            return value  # Values read from stdin are converted lazily, as they are consumed
+        return super().prepare_value(value, short_combo, env_var)
+
+    def validate(self, value: Any, joined: Bool = False):
+        if not (self.stdin and value == '-'):
+            super().validate(value, joined)
+
+    def result(self, command: Command | Any = None, missing_default: Any = _NotSet) -> Any:
+        value = super().result(command, missing_default)
+        if self.stdin and isinstance(value, list) and '-' in value:
+            return self._iter_values(value)
+        return value
+
+    def _iter_values(self, values: list[T | str]) -> Iterator[T | str]:
+        for value in values:
+            if value == '-':
+                yield from self._iter_stdin_values()
+            else:
+                yield value
+
+    def _iter_stdin_values(self) -> Iterator[T | str]:
+        prepare_value = super().prepare_value
+        for line in sys.stdin:
+            if line := line.rstrip('\r\n'):
+                yield prepare_value(line)
+
+    # endregion
@@ -7,6 +7,7 @@ The class that handles parsing input.
 from __future__ import annotations
 
 import logging
+import sys
 from collections import deque
 from os import environ
 from typing import TYPE_CHECKING, Deque, Sequence, Type, TypeAlias
@@ -22,6 +23,7 @@ from .exceptions import (
     ParamUsageError,
     UsageError,
 )
+from .inputs.files import FileInput
 from .nargs import REMAINDER
 from .parameters.base import BaseOption, BasePositional, Parameter
 from .parse_tree import PosNode
@@ -85,7 +87,8 @@ class CommandParser:
             if not ctx.categorized_action_flags[_PRE_INIT]:  # No pre-init action was triggered
                 raise ParamsMissing(missing)
         elif ctx.remaining and not ctx.config.ignore_unknown:  # Note: ctx.remaining is self.deferred at this point
-            raise NoSuchOption(f'unrecognized arguments: {" ".join(ctx.remaining)}') from None
+            remaining = tuple(ctx.remaining)
+            raise NoSuchOption(f'unrecognized arguments: {" ".join(remaining)}', remaining, self.params.suggest_option)
         return None
 
     def _validate_groups(self):
@@ -104,17 +107,32 @@ class CommandParser:
         self.arg_deque = arg_deque = self.handle_pass_thru(ctx)
         self.deferred = ctx.remaining = []
 
-        while arg_deque:
-            arg = arg_deque.popleft()
-            try:
-                if self._handle_arg(arg):
+        try:
+            while arg_deque:
+                arg = arg_deque.popleft()
+                try:
+                    if self._handle_arg(arg):
+                        break
+                except NextCommand:
+                    self.deferred.append(arg)
+                    self.deferred.extend(arg_deque)
                     break
-            except NextCommand:
-                self.deferred.append(arg)
-                self.deferred.extend(arg_deque)
-                break
+        finally:
+            ctx.discard_prefetched()
 
         self._parse_env_vars(ctx)
+        self._parse_stdin(ctx)
+
+    def _parse_stdin(self, ctx: Context):
+        """
+        If a Positional that accepts values from stdin did not receive any values and stdin is not a TTY, then mark it
+        to read its values from stdin.
+        """
+        for param in self.positionals:
+            if getattr(param, 'stdin', False) and not ctx.num_provided(param):
+                if sys.stdin is not None and not sys.stdin.isatty():
+                    param.action.add_value('-')
+                return
 
     @classmethod
     def _parse_env_vars(cls, ctx: Context):
@@ -134,7 +152,7 @@ class CommandParser:
                     break
 
     def _handle_arg(self, arg: str):
-        if not arg or arg[0] != '-':
+        if not arg or arg[0] != '-' or arg == '-':  # A lone dash typically indicates stdin/stdout, not an option
             return self.handle_positional(arg)
         n = len(arg)
         if n > 1 and arg[1] != '-':  # arg starts with 1 dash followed by a non-dash
@@ -142,7 +160,6 @@ class CommandParser:
         elif n > 2:  # arg starts with at least 1 dash, and may be a long option or invalid
             return self.handle_long(arg) if arg[2] != '-' else self._handle_many_dashes(arg)
         else:  # arg == '--'
-            # TODO: Maybe bug?  `arg` could technically be `'-'` here...
             return self._handle_double_dash(arg)
 
     def _handle_double_dash(self, arg: str):
@@ -182,11 +199,9 @@ class CommandParser:
         return False
 
     def handle_remainder(self, param: Parameter, value: str) -> int:
-        found = param.action.add_value(value)
-        arg_deque = self.arg_deque
-        while arg_deque:
-            found += param.action.add_value(arg_deque.popleft())
-        return found
+        values = [value, *self.arg_deque]
+        self.arg_deque.clear()
+        return param.action.add_values(values)
 
     # endregion
 
@@ -197,6 +212,7 @@ class CommandParser:
             if param.nargs.max is REMAINDER:
                 self.handle_remainder(param, arg)
             else:
+                self._maybe_prefetch(param, arg)
                 try:
                     found = param.action.add_value(arg)
                 except UsageError:
@@ -229,10 +245,12 @@ class CommandParser:
             param.action.add_value(value, combo=combo, joined=joined)
         elif param.action.accepts_consts and not param.action.accepts_values:
             param.action.add_const(opt=opt, combo=combo)
-        elif not self.consume_values(param) and param.action.accepts_consts:
-            # The order of conditions here is important - consume_values has an intended side effect even when
-            # the action does not accept constants
-            param.action.add_const(opt=opt, combo=combo)
+        else:
+            self._maybe_prefetch(param)
+            if not self.consume_values(param) and param.action.accepts_consts:
+                # The order of conditions here is important - consume_values has an intended side effect even when
+                # the action does not accept constants
+                param.action.add_const(opt=opt, combo=combo)
 
         self._last = param
         # No need to raise MissingArgument if values were not consumed - consume_values handles checking nargs
@@ -377,7 +395,12 @@ class CommandParser:
 
                 if not param.action.would_accept(value):
                     # log.debug(f'{value=} will not be used with {param=} - it would not be accepted')
-                    return self._finalize_consume(param, value, found, NoSuchOption(f'invalid argument: {value}'))
+                    return self._finalize_consume(
+                        param,
+                        value,
+                        found,
+                        NoSuchOption(f'invalid argument: {value}', (value,), self.params.suggest_option),
+                    )
                 # log.debug(f'{value=} may be used with {param=} as a value')
 
             try:
@@ -391,6 +414,26 @@ class CommandParser:
             found = self._maybe_backtrack(param, found)
         return self._finalize_consume(param, None, found)
 
+    def _maybe_prefetch(self, param: Parameter, first: OptStr = None):
+        """
+        If enabled, begin concurrently converting the values that are likely to be consumed by the given multi-value
+        Parameter with a file input type.  Values are still added (and any errors are raised) in order by the normal
+        consumption process.
+        """
+        if not (workers := self.config.file_input_workers) or not isinstance(param.type, FileInput):
+            return
+        elif (max_count := param.nargs.max) is REMAINDER or (max_count is not None and max_count < 2):
+            return
+
+        values = [first] if first is not None else []
+        for value in self.arg_deque:
+            if (max_count is not None and len(values) >= max_count) or (value.startswith('-') and value != '-'):
+                break
+            values.append(value)
+
+        if len(values) > 1:
+            self.ctx.prefetch_conversions(param, values, workers)
+
     def _finalize_consume(self, param: Parameter, value: OptStr, found: int, exc: Exception | None = None) -> int:
         # log.debug(f'Finalizing arg consumption for {param=}, {value=}, {found=}, {exc=}')
         nargs = param.nargs
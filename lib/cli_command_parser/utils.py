@@ -6,11 +6,14 @@ Utilities for working with terminals, strings, and Enums.
 
 from __future__ import annotations
 
+from collections import Counter
 from enum import Enum, EnumMeta, Flag
+from functools import lru_cache
 from inspect import isawaitable
+from itertools import chain
 from shutil import get_terminal_size
 from time import monotonic
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, TypeVar
 
 try:
     from enum import CONFORM
@@ -54,6 +57,13 @@ else:
 
     def wcswidth(text: str, unicode_version: str = 'auto') -> int:  # type: ignore[misc]
         """A version of wcswidth from the wcwidth library, optimized for how it is used in this repo."""
+        if text.isascii() and text.isprintable():  # Every printable ASCII character has a width of 1
+            return len(text)
+        return _wcswidth(text, unicode_version)
+
+    @lru_cache(2048)
+    def _wcswidth(text: str, unicode_version: str) -> int:
+        # Help text tends to contain many repetitions of the same non-ASCII tokens, so widths are memoized
         width = 0
         for c in text:
             if (char_width := wcwidth(c, unicode_version)) < 0:
@@ -62,6 +72,129 @@ else:
         return width
 
 
+# endregion
+
+# region Suggestions
+
+
+class SuggestionIndex:
+    """
+    Finds the closest matches for an unrecognized value among a collection of known values, to be used for "did you
+    mean" hints in error messages.
+
+    The index is built lazily on the first lookup.  Known values are indexed by their (casefolded) character bigrams and
+    their length so that only the values that share the most bigrams with the provided value, and whose lengths are
+    close enough for them to be a potential match, need to be compared via edit distance, instead of comparing the
+    provided value to every known value.
+
+    :param candidates: The known values.  Non-str and empty values are ignored.  May be a lazy iterable - it will not
+      be consumed until the first lookup.
+    :param limit: The maximum number of suggestions to return
+    """
+
+    __slots__ = ('_candidates', '_limit', '_words', '_folded', '_postings')
+
+    def __init__(self, candidates: Iterable[Any], limit: int = 3):
+        self._candidates = candidates
+        self._limit = limit
+        self._words: list[str] | None = None
+        self._folded: list[str] = []
+        self._postings: dict[str, dict[int, list[int]]] = {}  # {bigram: {length: [word index]}}
+
+    def _build(self) -> list[str]:
+        words = self._words = list(dict.fromkeys(c for c in self._candidates if c and isinstance(c, str)))
+        self._candidates = ()
+        self._folded = [word.casefold() for word in words]
+        postings = self._postings
+        for i, word in enumerate(self._folded):
+            n = len(word)
+            for gram in _bigrams(word):
+                postings.setdefault(gram, {}).setdefault(n, []).append(i)
+        return words
+
+    def suggest(self, value: str) -> list[str]:
+        """
+        :param value: An unrecognized value
+        :return: Up to ``limit`` known values that are similar to the given value, ordered from closest to furthest
+        """
+        if (words := self._words) is None:
+            words = self._build()
+        if not words or not value or not isinstance(value, str):
+            return []
+
+        folded = value.casefold()
+        n = len(folded)
+        max_dist = min(max(1, n // 3), 3)
+        lengths = range(n - max_dist, n + max_dist + 1)  # The length difference is a lower bound for the distance
+        # Bigrams that almost every value contains (such as ``--`` for long options) would make nearly every value a
+        # candidate without helping to rank them, so they are skipped for larger indexes.
+        max_postings = max(len(words) // 2, 16)
+        posting_lists = []
+        for gram in _bigrams(folded):
+            if by_length := self._postings.get(gram):
+                if sum(map(len, by_length.values())) <= max_postings:
+                    posting_lists.extend(indexes for length, indexes in by_length.items() if length in lengths)
+
+        if not posting_lists:
+            return []
+
+        shared = Counter(chain.from_iterable(posting_lists))
+        # Values that share as many bigrams as the last value in the pool are equally likely to be the closest match,
+        # so every value that ties with it is compared, rather than an arbitrary subset of them.
+        pool = self._limit * 4
+        if len(shared) > pool:
+            min_shared = shared.most_common(pool)[-1][1]
+            candidates = [i for i, count in shared.items() if count >= min_shared]
+        else:
+            candidates = shared
+        matches = []
+        for i in candidates:
+            if (dist := _edit_distance(folded, self._folded[i], max_dist)) <= max_dist:
+                matches.append((dist, i))
+
+        matches.sort()
+        return [words[i] for _, i in matches[: self._limit]]
+
+
+def _bigrams(text: str) -> set[str]:
+    text = f'\0{text}\0'
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+def _edit_distance(a: str, b: str, max_dist: int) -> int:
+    """
+    Computes the optimal string alignment distance (Levenshtein distance that also allows adjacent transpositions)
+    between the given strings.  Only cells within ``max_dist`` of the diagonal are computed, and ``max_dist + 1`` is
+    returned as soon as the distance is known to exceed max_dist.
+    """
+    if a == b:
+        return 0
+    too_far = max_dist + 1
+    len_b = len(b)
+    prev2: list[int] = []
+    prev = [j if j <= max_dist else too_far for j in range(len_b + 1)]
+    for i, ca in enumerate(a, 1):
+        row = [too_far] * (len_b + 1)
+        row[0] = i if i <= max_dist else too_far
+        row_min = row[0]
+        for j in range(max(1, i - max_dist), min(len_b, i + max_dist) + 1):
+            cb = b[j - 1]
+            dist = prev[j - 1] if ca == cb else prev[j - 1] + 1
+            if (other := prev[j] + 1) < dist:
+                dist = other
+            if (other := row[j - 1] + 1) < dist:
+                dist = other
+            if prev2 and j > 1 and ca == b[j - 2] and a[i - 2] == cb and (other := prev2[j - 2] + 1) < dist:
+                dist = other
+            row[j] = dist = dist if dist < too_far else too_far
+            if dist < row_min:
+                row_min = dist
+        if row_min > max_dist:
+            return too_far
+        prev2, prev = prev, row
+    return prev[-1]
+
+
 # endregion
 
 
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+
+from unittest import main
+from unittest.mock import patch
+
+from cli_command_parser.conversion import BatchConverter, Script, convert_script
+from cli_command_parser.conversion.batch import _convert
+from cli_command_parser.conversion.cli import ParserConverter
+from cli_command_parser.testing import ParserTest, RedirectStreams, TemporaryDir
+
+PACKAGE = 'cli_command_parser.conversion'
+SCRIPTS = {
+    'a.py': "from argparse import ArgumentParser\np = ArgumentParser()\np.add_argument('--foo')\n",
+    'sub/b.py': "import argparse\np = argparse.ArgumentParser()\np.add_argument('bar', nargs='+')\n",
+    'sub/c.py': 'import argparse\n',
+    'sub/d.py': 'import argparse\np = argparse.ArgumentParser(\n',
+    'e.py': 'print("not a parser")\n',
+    'f.txt': 'import argparse\n',
+}
+
+
+def _write_scripts(root):
+    for name, code in SCRIPTS.items():
+        path = root.joinpath(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(code)
+
+
+class BatchConversionTest(ParserTest):
+    def test_find_scripts(self):
+        with TemporaryDir() as tmp_path:
+            _write_scripts(tmp_path)
+            found = [path.relative_to(tmp_path).as_posix() for path in BatchConverter.find_scripts(tmp_path)]
+            self.assertEqual(['a.py', 'sub/b.py', 'sub/c.py', 'sub/d.py'], found)
+
+    def test_convert_tree(self):
+        with TemporaryDir() as tmp_path:
+            src_dir, out_dir = tmp_path.joinpath('src'), tmp_path.joinpath('out')
+            _write_scripts(src_dir)
+            results = BatchConverter(workers=2, output_dir=out_dir).convert_tree(src_dir)
+
+            self.assertEqual([False, False, False, True], [result.failed for result in results])
+            self.assertEqual([False, False, True, False], [result.skipped for result in results])
+            self.assert_str_contains('SyntaxError', results[3].error)
+            expected = convert_script(Script(SCRIPTS['a.py']))
+            self.assertEqual(expected, results[0].output)
+            self.assertEqual(expected + '\n', out_dir.joinpath('a.py').read_text())
+            self.assertTrue(out_dir.joinpath('sub', 'b.py').is_file())
+            self.assertFalse(out_dir.joinpath('sub', 'c.py').exists())
+            self.assertFalse(out_dir.joinpath('sub', 'd.py').exists())
+
+    def test_serial_matches_parallel(self):
+        with TemporaryDir() as tmp_path:
+            _write_scripts(tmp_path)
+            paths = BatchConverter.find_scripts(tmp_path)
+            serial = BatchConverter(workers=1, add_methods=True).convert_all(paths)
+            self.assertEqual(serial, BatchConverter(workers=2, add_methods=True).convert_all(paths))
+
+    def test_cached_results_reused(self):
+        with TemporaryDir() as tmp_path:
+            src_dir, cache_dir = tmp_path.joinpath('src'), tmp_path.joinpath('cache')
+            _write_scripts(src_dir)
+            converter = BatchConverter(workers=1, cache_dir=cache_dir)
+            first = converter.convert_tree(src_dir)
+            self.assertFalse(any(result.cached for result in first))
+            self.assertEqual(3, len(list(cache_dir.iterdir())))  # Failures are not cached
+
+            with patch(f'{PACKAGE}.batch._convert', wraps=_convert) as convert_mock:
+                second = converter.convert_tree(src_dir)
+
+            convert_mock.assert_called_once()  # Only the failure needed to be converted again
+            self.assertEqual([True, True, True, False], [result.cached for result in second])
+            self.assertEqual([r.output for r in first[:3]], [r.output for r in second[:3]])
+
+            src_dir.joinpath('a.py').write_text(SCRIPTS['a.py'] + "p.add_argument('--baz')\n")
+            self.assertFalse(converter.convert_tree(src_dir)[0].cached)
+            self.assertFalse(BatchConverter(cache_dir=cache_dir, add_methods=True).convert_tree(src_dir)[1].cached)
+
+    def test_summary(self):
+        with TemporaryDir() as tmp_path:
+            _write_scripts(tmp_path)
+            results = BatchConverter(workers=1).convert_tree(tmp_path)
+            summary = BatchConverter.summarize(results).splitlines()
+            self.assertEqual('Scripts: 4, converted: 2, cached: 0, no parsers: 1, failed: 1', summary[0])
+            self.assertEqual(2, len(summary))
+            self.assertTrue(summary[1].startswith(f'  {tmp_path.joinpath("sub", "d.py").as_posix()}: SyntaxError'))
+
+    def test_batch_cli(self):
+        with TemporaryDir() as tmp_path:
+            src_dir, out_dir = tmp_path.joinpath('src'), tmp_path.joinpath('out')
+            _write_scripts(src_dir)
+            src_dir.joinpath('sub', 'd.py').unlink()
+            with RedirectStreams() as streams:
+                ParserConverter.parse_and_run(['batch', src_dir.as_posix(), '-o', out_dir.as_posix(), '-w', '1'])
+
+            self.assertEqual('Scripts: 3, converted: 2, cached: 0, no parsers: 1, failed: 0', streams.stdout.strip())
+            self.assertTrue(out_dir.joinpath('a.py').is_file())
+
+    def test_batch_cli_failure_exit_code(self):
+        with TemporaryDir() as tmp_path:
+            _write_scripts(tmp_path)
+            with RedirectStreams(), self.assertRaises(SystemExit) as exc_ctx:
+                ParserConverter.parse_and_run(['batch', tmp_path.as_posix(), '-w', '1'])
+
+            self.assertEqual(1, exc_ctx.exception.code)
+
+
+if __name__ == '__main__':
+    try:
+        main(verbosity=2, exit=False)
+    except KeyboardInterrupt:
+        print()
@@ -14,6 +14,7 @@ from cli_command_parser.conversion.argparse_ast import (
     AstArgumentParser,
     AstCallable,
     Script,
+    SubparsersAction,
     visit_func,
 )
 from cli_command_parser.conversion.argparse_utils import ArgumentParser, SubParsersAction
@@ -545,6 +546,32 @@ p = AP()
         code = 'from argparse import ArgumentParser as AP\np1 = AP()\np2 = AP()\nfor p in (p1, p2):\n    pass'
         self.assertEqual(2, len(Script(code).parsers))
 
+    def test_tracked_refs_cached_until_rebound(self):
+        remainder = TrackedRef('argparse.REMAINDER')
+        visitor = ScriptVisitor(track_refs=(remainder,))
+        visitor.track_callable('argparse', 'ArgumentParser', Mock())
+        visitor.visit(ast.parse('import argparse\nfrom argparse import REMAINDER as R\np = argparse.ArgumentParser()'))
+        refs = visitor.get_tracked_refs()
+        self.assertEqual({'R', 'argparse.REMAINDER'}, refs[remainder])
+        self.assertIs(refs, visitor.get_tracked_refs())
+        visitor.visit(ast.parse('q = argparse.ArgumentParser()'))
+        self.assertIs(refs, visitor.get_tracked_refs())  # No tracked refs were (un)bound
+        visitor.visit(ast.parse('R = p'))
+        self.assertEqual({'argparse.REMAINDER'}, visitor.get_tracked_refs()[remainder])
+
+    def test_tracked_ref_visible_after_shadowing_scope_ends(self):
+        code = prep_args("'foo', nargs=REMAINDER", remainder=True).replace(
+            'p = AP()', "def foo():\n    REMAINDER = AP()\n    REMAINDER.add_argument('--bar')\np = AP()"
+        )
+        expected = prep_expected('foo = PassThru()', name='Command1')
+        self.assert_str_contains(expected.split('\n\n\n')[-1], convert_script(Script(code)))
+
+    def test_visit_dispatch_tables(self):
+        self.assertEqual(AstArgumentParser.visit_funcs, set(AstArgumentParser.visit_dispatch))
+        expected = {'add_argument', 'add_argument_group', 'add_mutually_exclusive_group', 'add_subparsers'}
+        self.assertEqual(expected, set(AstArgumentParser.visit_dispatch))
+        self.assertEqual({'add_parser'}, set(SubparsersAction.visit_dispatch))
+
     def test_extra_import_and_def_in_func(self):
         code = """import logging\nfrom argparse import ArgumentParser\nlog = logging.getLogger(__name__)
 def main():\n    parser = ArgumentParser()\n    parser.add_argument('test')"""
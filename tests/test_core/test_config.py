@@ -1,11 +1,12 @@
 #!/usr/bin/env python
 
+import pickle
 from itertools import product, starmap
 from operator import or_
 from unittest import TestCase, main
 
 from cli_command_parser import AllowLeadingDash, Command, CommandConfig, OptionNameMode, ShowDefaults, SubCommand
-from cli_command_parser.config import DEFAULT_CONFIG, ConfigItem
+from cli_command_parser.config import DEFAULT_CONFIG, ConfigItem, ConfigSnapshot
 from cli_command_parser.core import get_config
 from cli_command_parser.exceptions import CommandDefinitionError
 from cli_command_parser.testing import ParserTest
@@ -126,6 +127,51 @@ class ConfigTest(ParserTest):
 
     # endregion
 
+    # region Snapshot
+
+    def test_snapshot_values(self):
+        config = CommandConfig(CommandConfig(add_help=False), show_group_tree=True)
+        snapshot = config.snapshot
+        self.assertIsInstance(snapshot, ConfigSnapshot)
+        self.assertEqual(config.as_dict(), {key: getattr(snapshot, key) for key in ConfigSnapshot.__slots__})
+        self.assertFalse(snapshot.add_help)
+        self.assertTrue(snapshot.show_group_tree)
+
+    def test_snapshot_frozen(self):
+        snapshot = CommandConfig().snapshot
+        with self.assertRaises(AttributeError):
+            snapshot.add_help = False
+        with self.assertRaises(AttributeError):
+            del snapshot.add_help
+
+    def test_snapshot_cached_until_mutated(self):
+        config = CommandConfig()
+        snapshot = config.snapshot
+        self.assertIs(snapshot, config.snapshot)
+        config.add_help = False
+        self.assertIsNot(snapshot, config.snapshot)
+        self.assertTrue(snapshot.add_help)
+        self.assertFalse(config.snapshot.add_help)
+        del config.add_help
+        self.assertTrue(config.snapshot.add_help)
+
+    def test_parent_mutation_invalidates_child_snapshot(self):
+        parent = CommandConfig()
+        child = CommandConfig(parent)
+        self.assertTrue(child.snapshot.add_help)
+        parent.add_help = False
+        self.assertFalse(child.add_help)
+        self.assertFalse(child.snapshot.add_help)
+
+    def test_config_pickle(self):
+        config = CommandConfig(CommandConfig(add_help=False), show_group_tree=True)
+        config.snapshot  # noqa
+        clone = pickle.loads(pickle.dumps(config))
+        self.assertEqual(config.as_dict(), clone.as_dict())
+        self.assertEqual(repr(config.snapshot), repr(clone.snapshot))
+
+    # endregion
+
     def test_validate_wrap_usage_str(self):
         with self.assertRaisesRegex(TypeError, 'Invalid value=.*a bool or a positive integer'):
             CommandConfig(wrap_usage_str='foo')
@@ -1,8 +1,9 @@
 #!/usr/bin/env python
 
 from unittest import main
+from unittest.mock import patch
 
-from cli_command_parser import Command, CommandConfig, Flag, Option, Positional, SubCommand
+from cli_command_parser import Command, CommandConfig, Flag, Option, ParamGroup, Positional, SubCommand
 from cli_command_parser.context import (
     ActionPhase,
     Context,
@@ -12,8 +13,9 @@ from cli_command_parser.context import (
     get_parsed,
     get_raw_arg,
 )
-from cli_command_parser.core import CommandMeta
+from cli_command_parser.core import CommandMeta, get_params
 from cli_command_parser.error_handling import extended_error_handler
+from cli_command_parser.formatting.utils import _bind_help_context, _help_context, format_help_entry
 from cli_command_parser.testing import ParserTest
 
 
@@ -105,6 +107,61 @@ class ContextTest(ParserTest):
 
     # endregion
 
+    # region Bound Context
+
+    def test_help_rendering_does_not_use_proxy(self):
+        class Foo(Command, show_group_tree=True):
+            with ParamGroup('Things'):
+                bar = Option('-b', env_var='BAR', default='x', help='The bar')
+                baz = Flag(help='The baz')
+            sub = SubCommand()
+
+        class Qux(Foo):
+            pass
+
+        formatter = get_params(Foo).formatter
+        with Context([], Foo, terminal_width=80):
+            expected = formatter.format_help(allow_sys_argv=False)
+            with patch('cli_command_parser.context.get_current_context', wraps=get_current_context) as get_mock:
+                self.assertEqual(expected, formatter.format_help(allow_sys_argv=False))
+
+        self.assertEqual(0, get_mock.call_count)  # The bound Context was used instead
+
+    def test_help_entry_uses_bound_context(self):
+        narrow, wide = Context(terminal_width=40), Context(terminal_width=200)
+        description = ' '.join(['word'] * 30)
+        with wide, _bind_help_context(), narrow:
+            wide_entry = format_help_entry(['--foo'], description)
+        with narrow:
+            narrow_entry = format_help_entry(['--foo'], description)
+
+        self.assertEqual(1, len(wide_entry.splitlines()))
+        self.assertLess(1, len(narrow_entry.splitlines()))
+
+    def test_bound_context_cleared_after_render(self):
+        class Foo(Command):
+            bar = Option()
+
+        formatter = get_params(Foo).formatter
+        with Context([], Foo) as context:
+            chunks = formatter.iter_help(allow_sys_argv=False)
+            next(chunks)
+            self.assertIs(context, _help_context())
+            chunks.close()
+            self.assertIsNot(context, _help_context())
+
+    def test_result_does_not_reenter_active_context(self):
+        class Foo(Command):
+            bar = Option()
+
+        foo = Foo.parse(['--bar', 'a'])
+        with foo.ctx, patch.object(Context, '__enter__') as enter_mock:
+            self.assertEqual('a', foo.bar)
+
+        self.assertEqual(0, enter_mock.call_count)
+
+    # endregion
+
     # region No Command / Defaults
 
     def test_params_none_with_no_cmd(self):
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import pickle
+from abc import ABC
 from contextlib import contextmanager, redirect_stdout
 from typing import Type, Union
 from unittest import TestCase, main
@@ -115,6 +116,82 @@ class ErrorHandlingTest(TestCase):
         self.assertNotIn(BrokenPipeError, ErrorHandler().exc_handler_map)
         self.assertIn(BrokenPipeError, error_handler.copy().exc_handler_map)  # -> _handle_broken_pipe
 
+    # region Handler Dispatch Cache
+
+    def test_handlers_ordered_by_mro(self):
+        class TestExc(KeyError, ValueError):
+            pass
+
+        def handle_value_error(e):
+            pass
+
+        def handle_lookup_error(e):
+            pass
+
+        def handle_key_error(e):
+            pass
+
+        handler = ErrorHandler()
+        handler.register(handle_value_error, ValueError)
+        handler.register(handle_lookup_error, LookupError)
+        handler.register(handle_key_error, KeyError)
+        expected = [handle_key_error, handle_lookup_error, handle_value_error]
+        self.assertEqual(expected, list(handler.iter_handlers(TestExc, TestExc())))
+
+    def test_handler_for_abc_included(self):
+        class TestAbc(ABC):
+            pass
+
+        class TestExc(Exception):
+            pass
+
+        TestAbc.register(TestExc)
+        handler = ErrorHandler()
+        mock = Mock()
+        handler.register(mock, TestAbc)
+        self.assertEqual([mock], list(handler.iter_handlers(TestExc, TestExc())))
+
+    def test_handlers_cached_per_type(self):
+        handler = ErrorHandler()
+        handler.register(Mock(), ValueError)
+        first = list(handler.iter_handlers(ValueError, ValueError()))
+        self.assertIn(ValueError, handler._handler_cache)
+        with patch.object(ErrorHandler, '_get_handlers') as get_mock:
+            self.assertEqual(first, list(handler.iter_handlers(ValueError, ValueError())))
+        get_mock.assert_not_called()
+
+    def test_register_and_unregister_invalidate_cache(self):
+        handler = ErrorHandler()
+        generic, specific = Mock(), Mock()
+        handler.register(generic, Exception)
+        self.assertEqual([generic], list(handler.iter_handlers(KeyError, KeyError())))
+        handler.register(specific, KeyError)
+        self.assertEqual([specific, generic], list(handler.iter_handlers(KeyError, KeyError())))
+        handler.unregister(Exception)
+        self.assertEqual([specific], list(handler.iter_handlers(KeyError, KeyError())))
+
+    def test_cls_handler_invalidates_cache(self):
+        class TestErrorHandler(ErrorHandler):
+            _exc_handler_map = {}
+
+        handler = TestErrorHandler()
+        self.assertEqual([], list(handler.iter_handlers(KeyError, KeyError())))
+        mock = Mock()
+        TestErrorHandler.cls_handler(KeyError)(mock)
+        self.assertEqual([mock], list(handler.iter_handlers(KeyError, KeyError())))
+
+    def test_pickled_handler_excludes_cache(self):
+        list(error_handler.iter_handlers(BrokenPipeError, BrokenPipeError()))
+        clone = pickle.loads(pickle.dumps(error_handler))
+        self.assertEqual({}, clone._handler_cache)
+        self.assertEqual(error_handler.exc_handler_map.keys(), clone.exc_handler_map.keys())
+        self.assertEqual(
+            list(error_handler.iter_handlers(BrokenPipeError, BrokenPipeError())),
+            list(clone.iter_handlers(BrokenPipeError, BrokenPipeError())),
+        )
+
+    # endregion
+
 
 class TestCommandErrorHandling(TestCase):
     def test_no_error_handler_run(self):
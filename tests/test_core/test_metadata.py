@@ -159,6 +159,15 @@ class MetadataProgTest(TestCase):
             with patch('sys.argv', [tmp_path.as_posix()]), Context():
                 self.assertEqual(name, _prog_finder.normalize(THIS_FILE, None, True, 'foo.bar', 'Baz')[0])
 
+    def test_prog_from_sys_argv_with_extension(self):
+        with TemporaryDirectory() as tmp_dir:
+            tmp_dir = Path(tmp_dir)
+            tmp_dir.joinpath('example_test_123.exe').touch()
+            with patch('sys.argv', [tmp_dir.joinpath('example_test_123').as_posix()]), Context() as ctx:
+                prog = _prog_finder.normalize(THIS_FILE, None, True, 'foo.bar', 'Baz')[0]
+                self.assertEqual('example_test_123', prog)
+                self.assertIn(tmp_dir.as_posix(), ctx.stat_cache._listings)
+
     def test_entry_points_new(self):
         entry_points = ep_scripts(('bar.py', 'foo:bar'), ('baz.py', 'foo:baz'))
         expected = {'foo': {'bar': 'bar.py', 'baz': 'baz.py'}}
@@ -8,7 +8,14 @@ from unittest.mock import Mock, patch, seal
 import cli_command_parser.utils
 from cli_command_parser.formatting.utils import PartWrapper, _normalize_column_width, _single_line_strs
 from cli_command_parser.testing import ParserTest
-from cli_command_parser.utils import FixedFlag, Terminal, camel_to_snake_case, short_repr, wcswidth
+from cli_command_parser.utils import (
+    FixedFlag,
+    SuggestionIndex,
+    Terminal,
+    camel_to_snake_case,
+    short_repr,
+    wcswidth,
+)
 
 
 class UtilsTest(ParserTest):
@@ -114,6 +121,31 @@ class UtilsTest(ParserTest):
     def test_wcswidth_non_printable(self):
         self.assertEqual(-1, wcswidth('foo\rbar'))
 
+    def test_wcswidth_matches_wcwidth(self):
+        from wcwidth import wcswidth as real_wcswidth
+
+        for text in ('', 'foo', '--foo-bar FOO', 'foo\tbar', 'foo\x00', 'ｆｏｏ', 'foo é', '\u200bfoo', 'ü' * 3):
+            with self.subTest(text=text):
+                self.assertEqual(real_wcswidth(text), wcswidth(text))
+                self.assertEqual(real_wcswidth(text), wcswidth(text))  # memoized
+
+    def test_wcswidth_ascii_skips_wcwidth(self):
+        with patch('cli_command_parser.utils.wcwidth') as wcwidth_mock:
+            self.assertEqual(13, wcswidth('--foo-bar FOO'))
+
+        wcwidth_mock.assert_not_called()
+
+    def test_wc_text_wrapper(self):
+        from textwrap import TextWrapper
+
+        from cli_command_parser.compat import WCTextWrapper
+
+        ascii_text = (
+            'Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore'
+        )
+        self.assertEqual(TextWrapper(width=30).wrap(ascii_text), WCTextWrapper(width=30).wrap(ascii_text))
+        self.assertEqual(['ｆｏｏ ｂａｒ', 'ｂａｚ'], WCTextWrapper(width=15).wrap('ｆｏｏ ｂａｒ ｂａｚ'))
+
     def test_wcswidth_not_available(self):
         real_wcwidth = sys.modules['wcwidth']
         mock_module = Mock()
@@ -129,6 +161,43 @@ class UtilsTest(ParserTest):
             reload(cli_command_parser.utils)
 
 
+class SuggestionIndexTest(ParserTest):
+    def test_suggestions_ordered_by_distance(self):
+        index = SuggestionIndex(['stat', 'statuses', 'status', 'restart'])
+        self.assertEqual(['status', 'stat', 'statuses'], index.suggest('statue'))
+        self.assertEqual(['restart'], index.suggest('restrat'))
+
+    def test_suggestions_case_insensitive(self):
+        self.assertEqual(['Status'], SuggestionIndex(['Status', 'other']).suggest('STATSU'))
+
+    def test_no_suggestions(self):
+        index = SuggestionIndex(['status', 'start'])
+        self.assertEqual([], index.suggest('xyz'))
+        self.assertEqual([], index.suggest(''))
+        self.assertEqual([], SuggestionIndex([]).suggest('foo'))
+
+    def test_index_built_lazily(self):
+        candidates = Mock(__iter__=Mock(return_value=iter(['foo', None, 1, 'bar'])))
+        index = SuggestionIndex(candidates)
+        candidates.__iter__.assert_not_called()
+        self.assertEqual(['foo'], index.suggest('fo'))
+        self.assertEqual(['bar'], index.suggest('baz'))
+        candidates.__iter__.assert_called_once()
+
+    def test_limit(self):
+        index = SuggestionIndex([f'item-{c}' for c in 'abcdef'], limit=2)
+        self.assertEqual(2, len(index.suggest('item-z')))
+
+    def test_common_bigrams_skipped_for_large_index(self):
+        options = [f'--option-{i}' for i in range(5000)] + ['--verbose']
+        self.assertEqual(['--verbose'], SuggestionIndex(options).suggest('--verbsoe'))
+
+    def test_tied_bigram_counts_all_compared(self):
+        # Many values share the same number of bigrams with the provided value; the closest ones must not be cut off
+        index = SuggestionIndex([f'region-{i}' for i in range(100_000)])
+        self.assertEqual(['region-99999', 'region-9999', 'region-90999'], index.suggest('region-99999'))
+
+
 if __name__ == '__main__':
     try:
         main(verbosity=2, exit=False)
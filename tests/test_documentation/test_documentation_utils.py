@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+import ast
 import sys
 from abc import ABC
 from inspect import getfile
@@ -10,14 +11,17 @@ from cli_command_parser import Command, Option
 from cli_command_parser.config import OptionNameMode
 from cli_command_parser.core import get_config
 from cli_command_parser.documentation import (
+    _ImportRequired,
     _module_name,
     _render_commands_rst,
+    _StaticModuleBuilder,
+    discover_commands,
     filtered_commands,
     import_module,
     load_commands,
     top_level_commands,
 )
-from cli_command_parser.testing import ParserTest
+from cli_command_parser.testing import ParserTest, TemporaryDir
 from cli_command_parser.typing import CommandCls
 
 THIS_FILE = Path(__file__).resolve()
@@ -98,6 +102,123 @@ class DocumentationUtilsTest(ParserTest):
             self.assertEqual('cli_command_parser.parameters', _module_name(params_pkg_path))
 
 
+class StaticDiscoveryTest(ParserTest):
+    def test_examples_match_imported(self):
+        for path in sorted(EXAMPLES_DIR.glob('*.py')):
+            with self.subTest(script=path.name):
+                commands, import_reason = discover_commands(path)
+                self.assertIsNone(import_reason)
+                self.assertTrue(commands)
+                static_rst = _render_commands_rst(commands)
+                sys.modules.pop(_module_name(path), None)
+                self.assert_strings_equal(_render_commands_rst(load_commands(path)), static_rst)
+
+    def test_module_level_code_not_executed(self):
+        code = """
+import not_a_real_module
+from cli_command_parser import Command, Option
+
+raise RuntimeError
+
+class Foo(Command):
+    bar = Option(type=int, help='Bar')
+
+    def main(self):
+        not_a_real_module.run(self.bar)
+"""
+        with TemporaryDir() as tmp_path:
+            path = tmp_path.joinpath('static_side_effects.py')
+            path.write_text(code)
+            commands, import_reason = discover_commands(path)
+            self.assertIsNone(import_reason)
+            self.assertEqual(['Foo'], list(commands))
+            self.assertEqual(['--bar'], commands['Foo'].bar.option_strs.long)
+            self.assertEqual(['Foo'], list(load_commands(path, static=True)))
+
+    def test_runtime_error_not_raised(self):
+        self.assertEqual(({}, None), discover_commands(CMD_CASES_DIR.joinpath('runtime_error.py')))
+
+    def test_import_required(self):
+        base = 'from cli_command_parser import Command, Option\n'
+        cases = {
+            'static_base': (
+                'def make_base():\n    return Command\n\nBase = make_base()\n\nclass Foo(Base):\n    pass\n',
+                'unable to resolve a base class for Foo',
+            ),
+            'static_modified': (
+                'class Foo(Command):\n    pass\n\nFoo.bar = Option()\n',
+                'module-level code on line 5 uses Foo, Option',
+            ),
+            'static_lambda': (
+                'class Foo(Command):\n    bar = Option(default_cb=lambda: 1)\n',
+                'unable to resolve an expression in Foo',
+            ),
+        }
+        with TemporaryDir() as tmp_path:
+            for name, (code, expected) in cases.items():
+                with self.subTest(case=name):
+                    path = tmp_path.joinpath(f'{name}.py')
+                    path.write_text(base + code)
+                    commands, import_reason = discover_commands(path)
+                    self.assertEqual(['Foo'], list(commands))
+                    self.assert_str_contains(expected, import_reason)
+
+    def test_side_effect_constructors_not_called(self):
+        with TemporaryDir() as tmp_path:
+            log_path, popen_path, sub_path = (tmp_path.joinpath(name) for name in ('log', 'popen', 'sub'))
+            code = f"""
+import io
+import re
+import subprocess
+import sys
+import numpy
+from cli_command_parser import Command, Option
+
+LOG = io.FileIO({log_path.as_posix()!r}, 'w')
+P = subprocess.Popen([sys.executable, '-c', 'import sys; open(sys.argv[1], "w")', {popen_path.as_posix()!r}])
+P.wait()
+
+class Log(io.FileIO):
+    pass
+
+SUB_LOG = Log({sub_path.as_posix()!r}, 'w')
+PATTERN = re.compile('a+')
+
+class Foo(Command):
+    bar = Option(default=PATTERN.pattern)
+"""
+            path = tmp_path.joinpath('static_constructors.py')
+            path.write_text(code)
+            commands, import_reason = discover_commands(path)
+            self.assertIsNone(import_reason)
+            self.assertEqual('a+', commands['Foo'].bar.default)
+            self.assertFalse(log_path.exists())
+            self.assertFalse(popen_path.exists())
+            self.assertFalse(sub_path.exists())
+
+    def test_side_effect_constructors_require_import(self):
+        base = 'import io\nfrom cli_command_parser import Command, Option\n'
+        cases = {
+            'referenced': (
+                "LOG = io.FileIO('log', 'w')\n\nclass Foo(Command):\n    bar = Option(default=LOG)\n",
+                'LOG',
+            ),
+            'in_command': ("class Foo(Command):\n    bar = Option(default=io.FileIO('log', 'w'))\n", 'io.FileIO'),
+            'subclass': (
+                "class Log(io.FileIO):\n    pass\n\nclass Foo(Command):\n    bar = Option(default=Log('log', 'w'))\n",
+                'calls Log',
+            ),
+        }
+        for name, (code, expected) in cases.items():
+            with self.subTest(case=name), self.assertRaisesRegex(_ImportRequired, expected):
+                _StaticModuleBuilder().build(ast.parse(base + code))
+
+    def test_package_requires_import(self):
+        commands, import_reason = discover_commands(EXAMPLES_DIR.joinpath('complex'))
+        self.assertEqual("'Example' was imported from .base", import_reason)
+        self.assertSetEqual({'Example'}, set(top_level_commands(commands)))
+
+
 if __name__ == '__main__':
     # import logging
     # logging.basicConfig(level=logging.DEBUG, format='%(message)s')
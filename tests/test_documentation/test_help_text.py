@@ -11,11 +11,12 @@ from unittest import TestCase, main
 from unittest.mock import Mock, patch
 
 from cli_command_parser import Command, Context, ShowDefaults, no_exit_handler, print_help
-from cli_command_parser.core import CommandMeta
-from cli_command_parser.exceptions import MissingArgument
+from cli_command_parser.core import CommandMeta, get_params
+from cli_command_parser.exceptions import MissingArgument, ParamConflict
 from cli_command_parser.formatting.commands import CommandHelpFormatter, get_usage_sub_cmds
 from cli_command_parser.formatting.params import (
     ChoiceGroup,
+    OptionHelpFormatter,
     ParameterHelpFormatter,
     ParamHelpFormatter,
     PositionalHelpFormatter,
@@ -23,6 +24,7 @@ from cli_command_parser.formatting.params import (
 from cli_command_parser.formatting.restructured_text import RstTable
 from cli_command_parser.inputs import Date, Day
 from cli_command_parser.parameters import Counter, Flag, Option, ParamGroup, PassThru, Positional, TriFlag, action_flag
+from cli_command_parser.parameters.base import BaseOption
 from cli_command_parser.parameters.choice_map import Action, Choice, ChoiceMap, SubCommand
 from cli_command_parser.testing import (
     ParserTest,
@@ -952,6 +954,25 @@ class FormatterTest(ParserTest):
         with Foo().ctx:
             self.assertEqual('test help', Foo.bar.format_help())
 
+    def test_custom_formatter_with_original_signatures(self):
+        class CustomFormatter(OptionHelpFormatter):
+            def format_usage(self, include_meta=False, full=False, delim=', '):
+                return super().format_usage(include_meta, full, delim).upper()
+
+        def param_formatter(param):
+            return CustomFormatter(param) if isinstance(param, BaseOption) else ParamHelpFormatter(param)
+
+        class Foo(Command, param_formatter=param_formatter, error_handler=None):
+            with ParamGroup(mutually_exclusive=True):
+                bar = Option('-b')
+                baz = Flag()
+
+        help_text = get_help_text(Foo)
+        self.assert_str_contains('[--BAR BAR] [--BAZ]', help_text)
+        self.assert_str_contains('--bar BAR, -b BAR', help_text)
+        with self.assert_raises_contains_str(ParamConflict, '--BAZ'):  # The group usage is included in the error
+            Foo.parse(['-b', 'a', '--baz'])
+
     def test_formatter_no_config(self):
         class Foo(ABC, metaclass=CommandMeta):
             pass
@@ -1024,6 +1045,103 @@ class PrintHelpTest(ParserTest):
         self.assertEqual('', streams.stderr)
         self.assert_str_contains('Optional arguments:\n  --bar                       Include bar\n', sio.getvalue())
 
+    def test_write_help_matches_format_help(self):
+        class Foo(Command, description=TEST_DESCRIPTION, epilog=TEST_EPILOG, show_group_tree=True):
+            sub_cmd = SubCommand()
+            with ParamGroup('outer', mutually_exclusive=True):
+                with ParamGroup('inner'):
+                    a = Flag()
+                    b = Option()
+                c = Flag()
+            with ParamGroup('only nested'):
+                with ParamGroup('inner 2'):
+                    d = Flag()
+
+        class Bar(Foo, help='Run bar'):
+            e = Positional(choices=('x', 'y'))
+
+        for cmd in (Foo, Bar):
+            with self.subTest(cmd=cmd), Context(command=cmd):
+                formatter = get_params(cmd).formatter
+                expected = formatter.format_help()
+                self.assertEqual(expected, '\n'.join(formatter.iter_help()))
+                sio = StringIO()
+                formatter.write_help(sio)
+                self.assertEqual(expected + '\n', sio.getvalue())
+
+    def test_pager_used_for_terminal(self):
+        class Foo(Command):
+            bar = Flag(help='Include bar')
+
+        stdout = Mock(isatty=Mock(return_value=True), encoding='utf-8')
+        with (
+            patch('cli_command_parser.formatting.commands.Popen') as popen_mock,
+            patch.dict('os.environ', PAGER='less -R'),
+        ):
+            print_help(Foo(), exit=False, file=stdout, pager=True)
+
+        self.assertEqual(['less', '-R'], popen_mock.call_args.args[0])
+        stdin = popen_mock.return_value.stdin
+        self.assertIn('--bar', ''.join(c.args[0] for c in stdin.write.call_args_list))
+        stdin.close.assert_called_once()
+        popen_mock.return_value.wait.assert_called_once()
+        stdout.write.assert_not_called()
+
+    def test_pager_not_used(self):
+        class Foo(Command):
+            bar = Flag(help='Include bar')
+
+        cases = [(False, True, 'less'), (True, False, 'less'), (True, True, '')]
+        for pager, is_tty, pager_cmd in cases:
+            stdout = Mock(isatty=Mock(return_value=is_tty), encoding='utf-8')
+            with self.subTest(pager=pager, is_tty=is_tty, pager_cmd=pager_cmd):
+                with patch('cli_command_parser.formatting.commands.Popen') as popen_mock:
+                    with patch.dict('os.environ', PAGER=pager_cmd):
+                        print_help(Foo(), exit=False, file=stdout, pager=pager)
+
+                popen_mock.assert_not_called()
+                self.assertIn('--bar', ''.join(c.args[0] for c in stdout.write.call_args_list))
+
+    def test_missing_pager_falls_back_to_stream(self):
+        class Foo(Command):
+            bar = Flag(help='Include bar')
+
+        stdout = Mock(isatty=Mock(return_value=True), encoding='utf-8')
+        with patch('cli_command_parser.formatting.commands.Popen', side_effect=FileNotFoundError):
+            with patch.dict('os.environ', PAGER='not-a-real-pager'):
+                print_help(Foo(), exit=False, file=stdout, pager=True)
+
+        self.assertIn('--bar', ''.join(c.args[0] for c in stdout.write.call_args_list))
+
+    def test_closed_pager_ignored(self):
+        class Foo(Command):
+            bar = Flag(help='Include bar')
+
+        stdout = Mock(isatty=Mock(return_value=True), encoding='utf-8')
+        with (
+            patch('cli_command_parser.formatting.commands.Popen') as popen_mock,
+            patch.dict('os.environ', PAGER='less'),
+        ):
+            popen_mock.return_value.stdin.write.side_effect = BrokenPipeError
+            popen_mock.return_value.stdin.close.side_effect = BrokenPipeError
+            print_help(Foo(), exit=False, file=stdout, pager=True)
+
+        popen_mock.return_value.wait.assert_called_once()
+
+    def test_help_pager_config(self):
+        class Bar(Command, help_pager=True):
+            pass
+
+        stdout = Mock(isatty=Mock(return_value=True), encoding='utf-8')
+        with (
+            patch('cli_command_parser.formatting.commands.Popen') as popen_mock,
+            patch.dict('os.environ', PAGER='less'),
+        ):
+            with Bar().ctx:
+                print_help(Bar(), exit=False, file=stdout)
+
+        popen_mock.assert_called_once()
+
 
 def _get_output(command: CommandCls, args: Sequence[str]) -> tuple[str, str]:
     with RedirectStreams() as streams:
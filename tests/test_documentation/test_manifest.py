@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import main
+
+from cli_command_parser import (
+    Action,
+    Command,
+    Context,
+    Counter,
+    Flag,
+    Option,
+    ParamGroup,
+    PassThru,
+    Positional,
+    SubCommand,
+)
+from cli_command_parser.core import get_params
+from cli_command_parser.manifest import MANIFEST_VERSION, CommandManifest, build_manifest, dump_manifest
+from cli_command_parser.testing import ParserTest
+
+
+class Foo(Command, prog='foo.py', description='Foo desc'):
+    sub_cmd = SubCommand()
+    verbose = Counter('-v', help='Increase logging verbosity')
+    with ParamGroup('Output', mutually_exclusive=True):
+        fmt = Option('-f', choices=('json', 'yaml'), default='json', env_var='FOO_FMT', help='Output format')
+        raw = Flag(help='Output raw data')
+
+
+class Bar(Foo, choices=('bar', 'b'), help='Run bar'):
+    action = Action()
+    name = Positional(choices=('x', 'y'))
+
+    @action('do it')
+    def do_it(self):
+        pass
+
+    @action
+    def other(self):
+        pass
+
+
+class Baz(Foo, choice='baz qux'):
+    items = Option(nargs='+', hide=True)
+    extra = PassThru()
+
+
+class ManifestExportTest(ParserTest):
+    def test_manifest_structure(self):
+        manifest = build_manifest(Foo)
+        self.assertEqual(MANIFEST_VERSION, manifest['manifest_version'])
+        self.assertEqual({'', 'bar', 'baz qux'}, set(manifest['commands']))
+        root = manifest['commands']['']
+        self.assertEqual({'bar': 'bar', 'b': 'bar', 'baz qux': 'baz qux'}, root['subcommands'])
+
+        fmt = next(param for param in root['params'] if param['name'] == 'fmt')
+        expected = {
+            'kind': 'option',
+            'option_strs': ['--fmt', '-f'],
+            'nargs': {'min': 1, 'max': 1},
+            'required': False,
+            'choices': ['json', 'yaml'],
+            'env_vars': ['FOO_FMT'],
+            'default': 'json',
+            'help': 'Output format',
+            'group': 'Output',
+        }
+        self.assertEqual(expected, {key: fmt[key] for key in expected})
+        group = root['groups'][0]
+        self.assertEqual(['fmt', 'raw'], group['members'])
+        self.assertTrue(group['mutually_exclusive'])
+
+    def test_manifest_is_json_serializable(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir).joinpath('manifest.json')
+            serialized = dump_manifest(Foo, path)
+            self.assertEqual(serialized, path.read_text('utf-8'))
+            self.assertEqual(build_manifest(Foo), json.loads(serialized))
+            self.assertEqual('Foo', CommandManifest.load(path).root.name)
+
+    def test_non_json_default(self):
+        class Cmd(Command):
+            path = Option(default=Path('foo'))
+            items = Option(nargs='+', default=(1, Path('bar')))
+
+        params = {param['name']: param for param in build_manifest(Cmd)['commands']['']['params']}
+        self.assertEqual('foo', params['path']['default'])
+        self.assertEqual([1, 'bar'], params['items']['default'])
+
+
+class ManifestLoadTest(ParserTest):
+    @classmethod
+    def setUpClass(cls):
+        cls.manifest = CommandManifest.loads(dump_manifest(Foo))
+
+    def test_unsupported_version_rejected(self):
+        manifest = build_manifest(Foo)
+        manifest['manifest_version'] = MANIFEST_VERSION + 1
+        with self.assert_raises_contains_str(ValueError, 'Unsupported manifest_version='):
+            CommandManifest(manifest)
+
+    def test_help_and_usage(self):
+        cases = [([], Foo), (['-v', 'bar'], Bar), (['b', 'do'], Bar), (['--fmt', 'yaml', 'baz', 'qux'], Baz)]
+        for args, command in cases:
+            with self.subTest(args=args), Context([], command, terminal_width=80, allow_argv_prog=False):
+                formatter = get_params(command).formatter
+                self.assertEqual(formatter.format_help(allow_sys_argv=False), self.manifest.format_help(args))
+                self.assertEqual(formatter.format_usage(allow_sys_argv=False), self.manifest.format_usage(args))
+
+    def test_get_command(self):
+        self.assertEqual('Bar', self.manifest.get_command(['bar']).name)
+        self.assertEqual('Baz', self.manifest.get_command(['baz', 'qux']).name)
+        self.assertEqual('Foo', self.manifest.get_command(['baz']).name)
+        self.assertEqual('yaml', self.manifest.root.get_param('fmt')['choices'][1])
+        with self.assertRaises(KeyError):
+            self.manifest.root.get_param('foo')
+
+    def test_completion(self):
+        cases = [
+            ([], '', ['b', 'bar', 'baz']),
+            ([], '--', ['--fmt', '--help', '--raw', '--verbose']),
+            ([], '-', ['--fmt', '--help', '--raw', '--verbose', '-f', '-h', '-v']),
+            (['-f'], '', ['json', 'yaml']),
+            (['-f'], 'y', ['yaml']),
+            (['--fmt=json'], '', ['b', 'bar', 'baz']),
+            (['-v', 'bar'], '', ['do', 'other', 'x', 'y']),
+            (['bar', 'do'], '', ['it']),
+            (['bar'], 'o', ['other']),
+            (['baz'], '', ['qux']),
+            (['baz', 'qux'], '--', ['--fmt', '--help', '--raw', '--verbose']),  # --items is hidden
+            (['baz', 'qux', '--'], '', []),
+        ]
+        for args, incomplete, expected in cases:
+            with self.subTest(args=args, incomplete=incomplete):
+                self.assertEqual(expected, self.manifest.complete(args, incomplete))
+
+
+if __name__ == '__main__':
+    try:
+        main(verbosity=2, exit=False)
+    except KeyboardInterrupt:
+        print()
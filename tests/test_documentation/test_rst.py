@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+import os
 from functools import cached_property
 from pathlib import Path
 from unittest import main
@@ -96,6 +97,56 @@ Commands Module
             self.assertTrue(any('[DRY RUN] Would write' in line for line in log_ctx.output))
             self.assertFalse(tmp_path.joinpath('test.rst').exists())
 
+    def test_write_script_rsts_parallel(self):
+        with TemporaryDir() as tmp_path:
+            serial_dir, parallel_dir = tmp_path.joinpath('serial'), tmp_path.joinpath('parallel')
+            RstWriter(serial_dir).document_scripts(sorted(EXAMPLES_DIR.glob('*.py')), index_name='examples')
+            RstWriter(parallel_dir, workers=2).document_scripts(
+                sorted(EXAMPLES_DIR.glob('*.py')), index_name='examples'
+            )
+
+            expected = {path.name: path.read_text() for path in serial_dir.iterdir()}
+            self.assertEqual(expected, {path.name: path.read_text() for path in parallel_dir.iterdir()})
+
+    def test_write_script_rsts_static(self):
+        paths = [*sorted(EXAMPLES_DIR.glob('*.py')), EXAMPLES_DIR.joinpath('complex')]
+        with TemporaryDir() as tmp_path:
+            imported_dir, static_dir = tmp_path.joinpath('imported'), tmp_path.joinpath('static')
+            RstWriter(imported_dir).document_scripts(paths, index_name='examples')
+            writer = RstWriter(static_dir, static=True)
+            writer.document_scripts(paths, index_name='examples')
+
+            expected = {path.name: path.read_text() for path in imported_dir.iterdir()}
+            self.assertEqual(expected, {path.name: path.read_text() for path in static_dir.iterdir()})
+            self.assertEqual([EXAMPLES_DIR.joinpath('complex')], list(writer.imported_scripts))
+
+    def test_unchanged_rst_not_rewritten(self):
+        with TemporaryDir() as tmp_path:
+            writer = RstWriter(tmp_path, newline='\r\n')
+            writer.write_rst('test', 'foo\nbar\n')
+            path = tmp_path.joinpath('test.rst')
+            self.assertEqual(b'foo\r\nbar\r\n', path.read_bytes())
+            os.utime(path, (1_000_000, 1_000_000))
+
+            with self.assertLogs('cli_command_parser.documentation', 'DEBUG') as log_ctx:
+                writer.write_rst('test', 'foo\nbar\n')
+
+            self.assertTrue(any('Skipping unchanged' in line for line in log_ctx.output))
+            self.assertEqual(1_000_000, path.stat().st_mtime)
+
+            writer.write_rst('test', 'foo\nbaz\n')
+            self.assertEqual(b'foo\r\nbaz\r\n', path.read_bytes())
+            self.assertNotEqual(1_000_000, path.stat().st_mtime)
+
+    def test_unchanged_rst_rewritten_when_configured(self):
+        with TemporaryDir() as tmp_path:
+            writer = RstWriter(tmp_path, skip_unchanged=False)
+            writer.write_rst('test', 'foo')
+            path = tmp_path.joinpath('test.rst')
+            os.utime(path, (1_000_000, 1_000_000))
+            writer.write_rst('test', 'foo')
+            self.assertNotEqual(1_000_000, path.stat().st_mtime)
+
 
 class CommandRstTest(ParserTest):
     def test_inherited_description_included(self):
@@ -2,6 +2,7 @@
 
 from enum import Enum
 from unittest import main
+from unittest.mock import patch
 
 from cli_command_parser import Command, Option
 from cli_command_parser.exceptions import UsageError
@@ -21,6 +22,18 @@ class ChoiceInputTest(ParserTest):
         e = InvalidChoiceError(('y', 'z'), ('a', 'b', 'c'))
         self.assertEqual("invalid choices: 'y', 'z' (choose from: 'a', 'b', 'c')", str(e))
 
+    def test_invalid_choice_suggestions(self):
+        with self.assertRaises(InvalidChoiceError) as ctx:
+            Choices(('apple', 'banana', 'cherry'))('bananna')
+        self.assertEqual(
+            "invalid choice: 'bananna' (choose from: 'apple', 'banana', 'cherry') - did you mean: 'banana'?",
+            str(ctx.exception),
+        )
+
+    def test_enum_choice_suggestions(self):
+        self.assertEqual(['Bar'], EnumChoices(EnumExample).suggest('bra'))
+        self.assertEqual([], ChoiceMap({'a': 1}).suggest('xyz'))
+
     def test_enum_replaced(self):
         class Foo(Command):
             bar = Option(type=EnumExample)
@@ -140,6 +153,71 @@ class ChoiceInputTest(ParserTest):
         for val in ('test', 'BAT', '0', '4'):
             self.assertNotIn(val, cm)
 
+    def test_choices_insensitive_returns_choice(self):
+        self.assertEqual('Bar', Choices(('FOO', 'Bar'), case_sensitive=False)('bAR'))
+        # Sets/mappings have historically returned the provided value when it only differed by upper/lower case
+        self.assertEqual('foo', Choices({'FOO', 'Bar'}, case_sensitive=False)('foo'))
+        self.assertEqual('Bar', Choices({'FOO', 'Bar'}, case_sensitive=False)('bAR'))
+
+    def test_casefold_collision_first_wins(self):
+        self.assertEqual('foo', Choices(('foo', 'FOO', 'Foo'), case_sensitive=False)('fOO'))
+        self.assertEqual(1, ChoiceMap({'foo': 1, 'FOO': 2}, case_sensitive=False)('fOO'))
+
+    def test_large_choices_use_index(self):
+        choices = [f'Region-{i}' for i in range(10_000)]
+        c = Choices(choices, case_sensitive=False)
+        c.choices = ()  # Any remaining linear scan of the original choices would fail to find a match
+        self.assertEqual('Region-9999', c('region-9999'))
+        self.assertIn('REGION-5000', c)
+
+    def test_unhashable_choices(self):
+        c = Choices(([1], [2]))
+        self.assertEqual([2], c([2]))
+        self.assertIn([1], c)
+        self.assertNotIn([3], c)
+        self.assertNotIn([1], ChoiceMap({'a': 1}))
+
+    def test_contains_does_not_raise(self):
+        for choices in (Choices(('a', 'b'), case_sensitive=False), ChoiceMap({'a': 1}), EnumChoices(EnumExample)):
+            with self.subTest(choices=choices), patch.object(InvalidChoiceError, '__init__') as init_mock:
+                self.assertNotIn('c', choices)
+            init_mock.assert_not_called()
+
+    def test_enum_values_case_insensitive(self):
+        class Letters(Enum):
+            A = 'alpha'
+            B = 'Beta'
+
+        ec = EnumChoices(Letters)
+        for value, expected in {'a': Letters.A, 'ALPHA': Letters.A, 'beta': Letters.B, 'Beta': Letters.B}.items():
+            with self.subTest(value=value):
+                self.assertIs(expected, ec(value))
+
+        with self.assertRaises(InvalidChoiceError):
+            EnumChoices(Letters, case_sensitive=True)('beta')
+
+    def test_enum_missing_hook_used(self):
+        class Size(Enum):
+            SMALL = 's'
+
+            @classmethod
+            def _missing_(cls, value):
+                return cls.SMALL if value == 'tiny' else None
+
+        self.assertIs(Size.SMALL, EnumChoices(Size, case_sensitive=True)('tiny'))
+        self.assertNotIn('huge', EnumChoices(Size))
+
+    def test_convert_many(self):
+        self.assertEqual(['a', 'b', 'a'], Choices(('a', 'b'), case_sensitive=False).convert_many(['A', 'b', 'a']))
+        expected = [EnumExample.FOO, EnumExample.Bar]
+        self.assertEqual(expected, EnumChoices(EnumExample).convert_many(['foo', 'BAR']))
+
+    def test_convert_many_reports_all_invalid(self):
+        with self.assert_raises_contains_str(InvalidChoiceError, "invalid choices: 'c', 'd' (choose from: 'a', 'b')"):
+            Choices(('a', 'b')).convert_many(['a', 'c', 'b', 'd'])
+        with self.assert_raises_contains_str(InvalidChoiceError, "invalid choice: 'c' (choose from: 'a', 'b')"):
+            Choices(('a', 'b')).convert_many(['a', 'c'])
+
 
 class ParseInputTest(ParserTest):
     def test_int_choices(self):
@@ -156,6 +234,15 @@ class ParseInputTest(ParserTest):
         self.assert_parse_results_cases(Foo, success_cases)
         self.assert_parse_fails_cases(Foo, fail_cases, UsageError)
 
+    def test_choice_suggestions_in_usage_error(self):
+        class Foo(Command):
+            bar = Option(choices=('north', 'south', 'east', 'west'))
+
+        with self.assert_raises_contains_str(
+            UsageError, "(choose from: 'north', 'south', 'east', 'west') - did you mean: 'north'?"
+        ):
+            Foo.parse(['--bar', 'nrth'])
+
     def test_choices_with_nargs_plus(self):
         class Foo(Command):
             bar: int = Option('-b', choices=(1, 2), nargs='+')
@@ -1,21 +1,44 @@
 #!/usr/bin/env python
 
+import bz2
+import gzip
 import json
+import lzma
 import os
 import pickle
+import warnings
 from contextlib import contextmanager
-from io import StringIO
+from io import BytesIO, StringIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from threading import current_thread
 from typing import Iterator
 from unittest import TestCase, main
 from unittest.mock import Mock, PropertyMock, call, patch
 
-from cli_command_parser import Command, Option, Positional
-from cli_command_parser.exceptions import BadArgument
-from cli_command_parser.inputs import File, Json, Path as PathInput, Pickle, Serialized, StatMode
+from cli_command_parser import Command, Context, Option, Positional
+from cli_command_parser.exceptions import BadArgument, UsageError
+from cli_command_parser.inputs import (
+    Compression,
+    File,
+    GlobPaths,
+    Json,
+    JsonLines,
+    MMap,
+    Path as PathInput,
+    Pickle,
+    Serialized,
+    StatMode,
+    StreamMode,
+)
 from cli_command_parser.inputs.exceptions import InputValidationError
-from cli_command_parser.inputs.utils import FileWrapper, InputParam, SerializedFileWrapper, fix_windows_path
+from cli_command_parser.inputs.utils import (
+    FileWrapper,
+    InputParam,
+    SerializedFileWrapper,
+    StatCache,
+    fix_windows_path,
+)
 from cli_command_parser.testing import ParserTest, RedirectStreams
 
 PKG = 'cli_command_parser.inputs'
@@ -402,6 +425,207 @@ class ReadFileTest(ParserTest):
                 Foo.parse_and_run(['-b', b.as_posix()])
 
 
+@contextmanager
+def glob_tree() -> Iterator[Path]:
+    with temp_path() as tmp_dir, temp_chdir(tmp_dir):
+        for name in ('data/a/b/z.txt', 'data/a/y.txt', 'data/x.txt', 'data/.h/h.txt', 'data/a/b/w.csv'):
+            path = Path(name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+        yield tmp_dir
+
+
+class GlobPathsTest(ParserTest):
+    def assert_glob_results(self, expected: list[str], pattern: str, **kwargs):
+        self.assertEqual(sorted(map(Path, expected)), sorted(GlobPaths(**kwargs)(pattern)))
+
+    def test_recursive(self):
+        with glob_tree():
+            self.assert_glob_results(['data/a/b/z.txt', 'data/a/y.txt', 'data/x.txt'], 'data/**/*.txt')
+            self.assert_glob_results(['data/a/b'], 'data/**/b')
+            expected = ['data/a', 'data/a/b', 'data/a/b/w.csv', 'data/a/b/z.txt', 'data/a/y.txt', 'data/x.txt']
+            self.assert_glob_results(expected, 'data/**')
+
+    def test_non_recursive(self):
+        with glob_tree():
+            self.assert_glob_results(['data/a/y.txt'], 'data/**/*.txt', recursive=False)
+
+    def test_wildcards(self):
+        with glob_tree():
+            self.assert_glob_results(['data/a', 'data/x.txt'], 'data/*')
+            self.assert_glob_results(['data/a/b/z.txt'], 'data/a/?/[xz].txt')
+
+    def test_literal(self):
+        with glob_tree():
+            self.assert_glob_results(['data/x.txt'], 'data/x.txt')
+            self.assert_glob_results([], 'data/nope.txt')
+
+    def test_absolute(self):
+        with glob_tree() as tmp_dir:
+            pattern = tmp_dir.joinpath('data/*/*.txt').as_posix()
+            self.assertEqual([tmp_dir.joinpath('data/a/y.txt')], list(GlobPaths()(pattern)))
+
+    def test_hidden(self):
+        with glob_tree():
+            self.assert_glob_results(['data/.h/h.txt'], 'data/.*/*.txt')
+            expected = ['data/.h/h.txt', 'data/a/b/z.txt', 'data/a/y.txt', 'data/x.txt']
+            self.assert_glob_results(expected, 'data/**/*.txt', include_hidden=True)
+
+    def test_type_filter(self):
+        with glob_tree():
+            self.assert_glob_results(['data/a', 'data/a/b'], 'data/**', type='dir')
+            self.assert_glob_results(['data/x.txt'], 'data/*', type=StatMode.FILE)
+
+    def test_parallel(self):
+        with glob_tree():
+            expected = ['data/a/b/z.txt', 'data/a/y.txt', 'data/x.txt']
+            self.assert_glob_results(expected, 'data/**/*.txt', workers=3)
+
+    def test_lazy(self):
+        with glob_tree(), patch('os.scandir', side_effect=os.scandir) as scandir_mock:
+            paths = GlobPaths()('data/**/*.txt')
+            self.assertEqual(0, scandir_mock.call_count)
+            next(paths)
+            self.assertLess(0, scandir_mock.call_count)
+
+    def test_allow_empty(self):
+        with glob_tree():
+            self.assertEqual([], list(GlobPaths()('data/*.csv')))
+            with self.assert_raises_contains_str(InputValidationError, 'no paths matched'):
+                GlobPaths(allow_empty=False)('data/*.csv')
+            self.assertEqual([Path('data/x.txt')], list(GlobPaths(allow_empty=False)('data/*.txt')))
+
+    def test_invalid(self):
+        with self.assertRaises(InputValidationError):
+            GlobPaths()('  ')
+        with self.assertRaises(ValueError):
+            GlobPaths(workers=-1)
+
+    def test_parse(self):
+        class Foo(Command):
+            paths = Positional(type=GlobPaths())
+
+        with glob_tree():
+            self.assertEqual([Path('data/x.txt')], list(Foo.parse(['data/*.txt']).paths))
+
+    def test_repr(self):
+        self.assertEqual('<GlobPaths()>', repr(GlobPaths()))
+        self.assertEqual('<GlobPaths(recursive=False, workers=2)>', repr(GlobPaths(recursive=False, workers=2)))
+
+
+class StreamFileTest(ParserTest):
+    def test_stream_lines(self):
+        with temp_path('a') as a:
+            a.write_text('a\nb\nc')
+            lines = File(stream='lines')(a.as_posix())
+            self.assertNotIsInstance(lines, (str, FileWrapper))
+            self.assertEqual(['a\n', 'b\n', 'c'], list(lines))
+
+    def test_stream_lines_small_buffer(self):
+        with temp_path('a') as a:
+            a.write_bytes(b'a\nb')
+            for mode in ('r', 'rb'):
+                with self.subTest(mode=mode), warnings.catch_warnings():
+                    warnings.simplefilter('error')  # buffering=1 is not supported in binary mode
+                    lines = File(mode=mode, stream='lines', buffer_size=1)(a.as_posix())
+                    self.assertEqual(['a\n', 'b'] if mode == 'r' else [b'a\n', b'b'], list(lines))
+
+    def test_stream_chunks(self):
+        with temp_path('a') as a:
+            a.write_bytes(b'abcdefg')
+            chunks = File(mode='rb', stream=StreamMode.CHUNKS, buffer_size=3)(a.as_posix())
+            self.assertEqual([b'abc', b'def', b'g'], list(chunks))
+
+    def test_stream_closed_on_exhaustion(self):
+        with temp_path('a') as a:
+            a.write_text('a\nb\n')
+            file_input = File(stream='lines')
+            with patch.object(FileWrapper, 'close', autospec=True, side_effect=FileWrapper.close) as close_mock:
+                lines = file_input(a.as_posix())
+                self.assertEqual(0, close_mock.call_count)
+                self.assertEqual('a\n', next(lines))
+                self.assertEqual(0, close_mock.call_count)
+                lines.close()
+                self.assertEqual(1, close_mock.call_count)
+
+    def test_stream_not_opened_until_iterated(self):
+        with temp_path('a') as a:
+            a.write_text('a\n')
+            with patch.object(FileWrapper, '_open') as open_mock:
+                File(stream='lines')(a.as_posix())
+            open_mock.assert_not_called()
+
+    def test_stream_stdin(self):
+        with RedirectStreams('a\nb\n'):
+            self.assertEqual(['a\n', 'b\n'], list(File(allow_dash=True, stream='lines')('-')))
+
+    def test_stream_in_command(self):
+        class Foo(Command):
+            bar = Positional(type=File(stream='lines'))
+
+        with temp_path('a') as a:
+            a.write_text('a\nb\n')
+            self.assertEqual(['a\n', 'b\n'], list(Foo.parse([a.as_posix()]).bar))
+
+    def test_stream_invalid_combos_rejected(self):
+        cases = [
+            {'mode': 'w', 'stream': 'lines'},
+            {'lazy': False, 'stream': 'lines'},
+            {'stream': 'chunks', 'buffer_size': 0},
+        ]
+        for kwargs in cases:
+            with self.subTest(kwargs=kwargs), self.assertRaises(ValueError):
+                File(**kwargs)
+
+    def test_stream_repr(self):
+        self.assertEqual("<File(exists=True, stream=<StreamMode.LINES: 'lines'>)>", repr(File(stream='lines')))
+
+
+class MMapTest(ParserTest):
+    def test_mmap_read(self):
+        with temp_path('a') as a:
+            a.write_bytes(b'abc\x00def')
+            mapped = MMap()(a.as_posix())
+            self.assertEqual(b'abc\x00def', mapped[:])
+            self.assertEqual(b'def', mapped[4:])
+            mapped.close()
+
+    def test_mmap_read_only(self):
+        with temp_path('a') as a:
+            a.write_bytes(b'abc')
+            mapped = MMap()(a.as_posix())
+            with self.assertRaises(TypeError):
+                mapped[0] = 1
+            mapped.close()
+
+    def test_mmap_empty_rejected(self):
+        with temp_path('a', True) as a:
+            with self.assert_raises_contains_str(InputValidationError, 'Unable to memory-map'):
+                MMap()(a.as_posix())
+
+    def test_mmap_missing_rejected(self):
+        with temp_path('a') as a:
+            with self.assert_raises_contains_str(InputValidationError, 'does not exist'):
+                MMap()(a.as_posix())
+
+    def test_mmap_dash_rejected(self):
+        with self.assertRaises(ValueError):
+            MMap(allow_dash=True)
+
+    def test_mmap_in_command(self):
+        class Foo(Command):
+            bar = Positional(type=MMap())
+
+        with temp_path('a') as a:
+            a.write_bytes(b'abc')
+            foo = Foo.parse([a.as_posix()])
+            self.assertEqual(b'abc', foo.bar[:])
+            foo.bar.close()
+
+    def test_mmap_repr(self):
+        self.assertEqual('<MMap(exists=True)>', repr(MMap()))
+
+
 class ReadJsonTest(ParserTest):
     def test_json_read_stdin(self):
         with RedirectStreams('{"a": 1, "b": 2}'):
@@ -432,6 +656,174 @@ class ReadJsonTest(ParserTest):
                 Json(lazy=False, wrap_errors=False)(data_path.as_posix())
 
 
+class SerializedCacheTest(ParserTest):
+    def test_cache_hit_when_unchanged(self):
+        with temp_path('a.json') as a:
+            a.write_text('{"a": 1}')
+            json_input = Json(lazy=False, cache_size=2)
+            with patch('json.load', side_effect=json.load) as load_mock:
+                first = json_input(a.as_posix())
+                self.assertIs(first, json_input(a.as_posix()))
+                self.assertEqual(1, load_mock.call_count)
+            self.assertEqual((1, 1), (json_input._cache.hits, json_input._cache.misses))
+
+    def test_cache_lazy_wrapper(self):
+        with temp_path('a.json') as a:
+            a.write_text('{"a": 1}')
+            json_input = Json(cache_size=2)
+            self.assertIs(json_input(a.as_posix()).read(), json_input(a.as_posix()).read())
+
+    def test_cache_miss_when_modified(self):
+        with temp_path('a.json') as a:
+            a.write_text('{"a": 1}')
+            json_input = Json(lazy=False, cache_size=2)
+            self.assertEqual({'a': 1}, json_input(a.as_posix()))
+            a.write_text('{"a": 22}')
+            self.assertEqual({'a': 22}, json_input(a.as_posix()))
+            self.assertEqual(1, len(json_input._cache))
+
+    def test_cache_copy(self):
+        with temp_path('a.pkl') as a:
+            a.write_bytes(pickle.dumps({'a': [1]}))
+            pkl_input = Pickle(lazy=False, cache_size=1, cache_copy=True)
+            first = pkl_input(a.as_posix())
+            first['a'].append(2)
+            self.assertEqual({'a': [1]}, pkl_input(a.as_posix()))
+
+    def test_cache_lru_eviction(self):
+        with temp_path() as tmp_dir:
+            paths = [tmp_dir.joinpath(f'{i}.json') for i in range(3)]
+            for i, path in enumerate(paths):
+                path.write_text(str(i))
+
+            json_input = Json(lazy=False, cache_size=2)
+            self.assertEqual([0, 1], [json_input(p.as_posix()) for p in paths[:2]])
+            json_input(paths[0].as_posix())  # Mark 0 as most recently used
+            json_input(paths[2].as_posix())
+            cached = {path for path, _ in json_input._cache._data}
+            self.assertEqual({paths[0].resolve(), paths[2].resolve()}, cached)
+
+    def test_cache_disabled_by_default_and_for_writes(self):
+        self.assertIsNone(Json()._cache)
+        self.assertIsNone(Json(mode='w', cache_size=2)._cache)
+        with self.assertRaises(ValueError):
+            Json(cache_size=-1)
+
+    def test_cache_repr(self):
+        self.assertEqual('<Json(exists=True, cache_size=3)>', repr(Json(cache_size=3)))
+
+
+class JsonLinesTest(ParserTest):
+    def test_json_lines_read(self):
+        with temp_path('a') as a:
+            a.write_text('{"a": 1}\n\n[1, 2]\n"b"\n')
+            records = JsonLines()(a.as_posix())
+            self.assertNotIsInstance(records, list)
+            self.assertEqual([{'a': 1}, [1, 2], 'b'], list(records))
+
+    def test_json_lines_read_stdin(self):
+        for stdin, mode in (('{"a": 1}\n{"b": 2}\n', 'r'), (b'{"a": 1}\n{"b": 2}\n', 'rb')):
+            with self.subTest(mode=mode), RedirectStreams(stdin):
+                self.assertEqual([{'a': 1}, {'b': 2}], list(JsonLines(allow_dash=True, mode=mode)('-')))
+
+    def test_json_lines_error_line_number(self):
+        with temp_path('a') as a:
+            a.write_text('{"a": 1}\n{"b": 2\n')
+            records = JsonLines()(a.as_posix())
+            self.assertEqual({'a': 1}, next(records))
+            with self.assert_raises_contains_str(InputValidationError, 'on line 2'):
+                next(records)
+
+    def test_json_lines_error_stdin(self):
+        with RedirectStreams('x\n'):
+            with self.assert_raises_contains_str(InputValidationError, 'Unable to load json from stdin on line 1'):
+                list(JsonLines(allow_dash=True)('-'))
+
+    def test_json_lines_skip_errors(self):
+        with temp_path('a') as a:
+            a.write_text('{"a": 1}\nx\n{"b": 2}\n')
+            self.assertEqual([{'a': 1}, {'b': 2}], list(JsonLines(skip_errors=True)(a.as_posix())))
+
+    def test_json_lines_write_rejected(self):
+        with self.assertRaises(ValueError):
+            JsonLines(mode='w')
+
+    def test_json_lines_repr(self):
+        self.assertEqual('<JsonLines(exists=True)>', repr(JsonLines()))
+        self.assertEqual('<JsonLines(exists=True, skip_errors=True)>', repr(JsonLines(skip_errors=True)))
+
+
+class CompressedFileTest(ParserTest):
+    def test_read_explicit_compression(self):
+        for compression, module, suffix in (('gzip', gzip, '.gz'), ('bz2', bz2, '.bz2'), ('lzma', lzma, '.xz')):
+            with self.subTest(compression=compression), temp_path(f'a{suffix}') as a:
+                a.write_bytes(module.compress(b'foo\nbar\n'))
+                self.assertEqual('foo\nbar\n', File(compression=compression, lazy=False)(a.as_posix()))
+                self.assertEqual(b'foo\nbar\n', File(mode='rb', compression=compression, lazy=False)(a.as_posix()))
+
+    def test_read_auto_detects_by_content(self):
+        for module in (gzip, bz2, lzma):
+            with self.subTest(module=module.__name__), temp_path('a.txt') as a:
+                a.write_bytes(module.compress(b'foo'))
+                self.assertEqual('foo', File(compression=Compression.AUTO, lazy=False)(a.as_posix()))
+
+    def test_read_auto_uncompressed(self):
+        with temp_path('a.gz') as a:
+            a.write_text('foo')
+            self.assertEqual('foo', File(compression='auto', lazy=False)(a.as_posix()))
+
+    def test_read_invalid_data(self):
+        with temp_path('a') as a:
+            a.write_text('foo')
+            with self.assertRaises(OSError):
+                File(compression='gzip', lazy=False)(a.as_posix())
+
+    def test_write_auto_uses_suffix(self):
+        for module, suffix in ((gzip, '.gz'), (bz2, '.bz2'), (lzma, '.xz'), (lzma, '.lzma')):
+            with self.subTest(suffix=suffix), temp_path(f'a{suffix}') as a:
+                File(mode='w', compression='auto')(a.as_posix()).write('foo')
+                self.assertEqual(b'foo', module.decompress(a.read_bytes()))
+
+    def test_write_auto_no_suffix_match(self):
+        with temp_path('a.txt') as a:
+            File(mode='w', compression='auto')(a.as_posix()).write('foo')
+            self.assertEqual('foo', a.read_text())
+
+    def test_json_and_pickle(self):
+        with temp_path('a.json.gz') as a:
+            Json(mode='w', compression='auto')(a.as_posix()).write({'a': 1})
+            self.assertEqual({'a': 1}, json.loads(gzip.decompress(a.read_bytes())))
+            self.assertEqual({'a': 1}, Json(compression='auto', lazy=False)(a.as_posix()))
+        with temp_path('a.pkl.bz2') as a:
+            Pickle(mode='wb', compression='bz2')(a.as_posix()).write({'a': 1})
+            self.assertEqual({'a': 1}, Pickle(compression='bz2', lazy=False)(a.as_posix()))
+
+    def test_stream_lines(self):
+        with temp_path('a.gz') as a:
+            a.write_bytes(gzip.compress(b'a\nb\n'))
+            self.assertEqual(['a\n', 'b\n'], list(File(stream='lines', compression='auto')(a.as_posix())))
+
+    def test_stdin(self):
+        with RedirectStreams(gzip.compress(b'foo')):
+            self.assertEqual('foo', File(allow_dash=True, compression='gzip', lazy=False)('-'))
+
+    def test_stdout(self):
+        with RedirectStreams() as streams, patch('sys.stdout.buffer', create=True, new_callable=BytesIO) as buffer:
+            wrapper = File(allow_dash=True, mode='wb', compression='gzip')('-')
+            wrapper.write(b'foo')
+            self.assertEqual(b'foo', gzip.decompress(buffer.getvalue()))
+            self.assertEqual('', streams.stdout)
+
+    def test_invalid_compression(self):
+        with self.assertRaises(ValueError):
+            File(compression='zip')
+        with self.assertRaises(ValueError):
+            File(mode='r+', compression='gzip')
+
+    def test_repr(self):
+        self.assertEqual("<File(exists=True, compression=<Compression.GZIP: 'gzip'>)>", repr(File(compression='gzip')))
+
+
 class ParseInputTest(ParserTest):
     def test_short_option_no_space(self):
         class Foo(Command):
@@ -475,6 +867,137 @@ class ParseInputTest(ParserTest):
                 self.assertEqual(expected, foo.config_path)
 
 
+class StatCacheTest(ParserTest):
+    def test_stat_cached(self):
+        with temp_path('a', touch=True) as a:
+            cache, expected_mode = StatCache(), a.stat().st_mode
+            with patch('os.stat', side_effect=os.stat) as stat_mock:
+                self.assertTrue(cache.exists(a))
+                self.assertTrue(cache.exists(a.as_posix()))
+                self.assertEqual(expected_mode, cache.stat(a).st_mode)
+            self.assertEqual(1, stat_mock.call_count)
+            self.assertEqual((2, 1), (cache.hits, cache.misses))
+
+    def test_missing_path(self):
+        with temp_path() as tmp_dir:
+            self.assertFalse(StatCache().exists(tmp_dir.joinpath('a')))
+
+    def test_scandir_cached(self):
+        with temp_path() as tmp_dir:
+            tmp_dir.joinpath('a').touch()
+            cache = StatCache()
+            with patch('os.scandir', side_effect=os.scandir) as scandir_mock:
+                self.assertEqual({'a'}, set(cache.scandir(tmp_dir)))
+                self.assertEqual({'a'}, set(cache.scandir(tmp_dir)))
+            self.assertEqual(1, scandir_mock.call_count)
+            self.assertEqual({}, cache.scandir(tmp_dir.joinpath('b')))
+
+    def test_stat_uses_dir_listing(self):
+        with temp_path() as tmp_dir:
+            tmp_dir.joinpath('a').touch()
+            cache = StatCache()
+            cache.scandir(tmp_dir)
+            with patch('os.stat', side_effect=os.stat) as stat_mock:
+                self.assertTrue(cache.exists(tmp_dir.joinpath('a')))
+                self.assertFalse(cache.exists(tmp_dir.joinpath('b')))  # Missing entries fall back to os.stat
+            self.assertEqual(1, stat_mock.call_count)
+
+    def test_shared_during_parsing(self):
+        class Foo(Command):
+            foo = Option('-f', type=PathInput(exists=True, type='file'))
+            bar = Positional(nargs='+', type=PathInput(exists=True))
+
+        with temp_path('a', touch=True) as a:
+            path = a.as_posix()
+            with patch('os.stat', side_effect=os.stat) as stat_mock:
+                foo = Foo.parse(['-f', path, path, path])
+                self.assertEqual([a, a], foo.bar)
+            self.assertEqual(1, stat_mock.call_count)
+            self.assertEqual((5, 1), (foo.ctx.stat_cache.hits, foo.ctx.stat_cache.misses))
+
+
+class ParallelFileInputTest(ParserTest):
+    def test_values_converted_concurrently_in_order(self):
+        class Foo(Command, file_input_workers=4):
+            foo = Positional(nargs='+', type=Json(lazy=False))
+            bar = Option('-b', nargs='+', type=Json(lazy=False))
+
+        with temp_path() as tmp_dir:
+            paths = [tmp_dir.joinpath(f'{i}.json') for i in range(6)]
+            for i, path in enumerate(paths):
+                path.write_text(str(i))
+
+            threads = set()
+            orig_call = Json.__call__
+
+            def record_thread(json_input, value):
+                threads.add(current_thread().name)
+                return orig_call(json_input, value)
+
+            argv = [p.as_posix() for p in paths[:3]] + ['-b'] + [p.as_posix() for p in paths[3:]]
+            with patch.object(Json, '__call__', autospec=True, side_effect=record_thread):
+                foo = Foo.parse(argv)
+                self.assertEqual([0, 1, 2], foo.foo)
+                self.assertEqual([3, 4, 5], foo.bar)
+
+        self.assertTrue(all(name.startswith('cli_command_parser') for name in threads))
+
+    def test_errors_match_serial_conversion(self):
+        class Serial(Command):
+            foo = Positional(nargs='+', type=PathInput(exists=True))
+
+        class Parallel(Serial, file_input_workers=4):
+            pass
+
+        with temp_path() as tmp_dir:
+            a, b = tmp_dir.joinpath('a'), tmp_dir.joinpath('b')
+            a.touch()
+            for argv in ([a.as_posix(), b.as_posix()], [b.as_posix(), a.as_posix()]):
+                with self.subTest(argv=argv):
+                    with self.assertRaises(UsageError) as serial_ctx:
+                        Serial.parse(argv)
+                    with self.assertRaises(UsageError) as parallel_ctx:
+                        Parallel.parse(argv)
+
+                    self.assertIs(type(serial_ctx.exception), type(parallel_ctx.exception))
+                    self.assertEqual(str(serial_ctx.exception), str(parallel_ctx.exception))
+
+    def test_disabled_by_default(self):
+        class Foo(Command):
+            foo = Positional(nargs='+', type=PathInput())
+
+        with patch('cli_command_parser.context.Context.prefetch_conversions') as prefetch_mock:
+            self.assertEqual([Path('a'), Path('b')], Foo.parse(['a', 'b']).foo)
+
+        prefetch_mock.assert_not_called()
+
+    def test_values_prefetched_once(self):
+        class Foo(Command, file_input_workers=4):
+            foo = Positional(nargs='+', type=PathInput())
+            bar = Option('-b', nargs='+', type=PathInput())
+
+        prefetch = Context.prefetch_conversions
+        with patch.object(Context, 'prefetch_conversions', autospec=True, side_effect=prefetch) as prefetch_mock:
+            foo = Foo.parse(['a', 'b', 'c', '-b', 'd', 'e', 'f'])
+            self.assertEqual([Path('a'), Path('b'), Path('c')], foo.foo)
+            self.assertEqual([Path('d'), Path('e'), Path('f')], foo.bar)
+
+        expected = [['a', 'b', 'c'], ['d', 'e', 'f']]
+        self.assertEqual(expected, [c.args[2] for c in prefetch_mock.call_args_list])
+
+    def test_no_context_lookup_without_prefetch(self):
+        class Foo(Command):
+            foo = Positional(nargs='+', type=PathInput())
+
+        with Context():
+            with patch('cli_command_parser.context.get_current_context') as context_mock:
+                with patch('cli_command_parser.parameters.base.get_current_context') as base_mock:
+                    self.assertEqual(Path('a'), Foo.foo.prepare_value('a'))
+
+        context_mock.assert_not_called()
+        base_mock.assert_not_called()
+
+
 if __name__ == '__main__':
     # import logging
     # logging.basicConfig(level=logging.DEBUG, format='%(message)s')
@@ -147,6 +147,28 @@ class NumericInputTest(ParserTest):
     def test_init_from_tuple(self):
         self.assertEqual(range(1, 3), Range((1, 3)).range)
 
+    def test_convert_many_matches_call(self):
+        values = ['-5', '0', '3', '9', '10', '15']
+        for input_type in (Range(range(10), snap=True), NumRange(min=0, max=10, snap=True), NumRange(float, min=0)):
+            with self.subTest(input_type=input_type):
+                in_range = [v for v in values if float(v) >= 0 and float(v) < 10]
+                self.assertEqual([input_type(v) for v in in_range], input_type.convert_many(in_range))
+                if input_type.snap:
+                    self.assertEqual([input_type(v) for v in values], input_type.convert_many(values))
+
+        self.assertEqual([], NumRange(min=0).convert_many([]))
+
+    def test_convert_many_out_of_range_rejected(self):
+        for input_type in (Range(range(10)), NumRange(min=0, max=10)):
+            with self.subTest(input_type=input_type):
+                with self.assert_raises_contains_str(InputValidationError, 'expected a value in the range'):
+                    input_type.convert_many(['1', '2', '12'])
+
+    def test_convert_many_nan(self):
+        rng = NumRange(float, min=0, max=10)
+        with self.assertRaises(InputValidationError):
+            rng.convert_many(['nan', '1', '11'])
+
 
 class BytesInputTest(ParserTest):
     def test_invalid_base_rejected(self):
@@ -199,6 +221,16 @@ class BytesInputTest(ParserTest):
         with self.assert_raises_contains_str(InputValidationError, "invalid byte unit='A'"):
             Bytes()._get_multiplier('A')
 
+    def test_convert_many_matches_call(self):
+        values = ['1', '15 KB', '2KiB', '3 KB', '10 MB', '1 kb']
+        for bytes_type in (Bytes(), Bytes(short=False), Bytes(base=2)):
+            with self.subTest(bytes_type=bytes_type):
+                self.assertEqual([bytes_type(v) for v in values], bytes_type.convert_many(values))
+
+    def test_convert_many_rejects_invalid(self):
+        with self.assert_raises_contains_str(InputValidationError, 'with optional unit'):
+            Bytes().convert_many(['1 KB', 'foo'])
+
 
 class ParseInputTest(ParserTest):
     def test_num_range_validation(self):
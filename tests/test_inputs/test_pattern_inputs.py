@@ -91,6 +91,49 @@ class RegexInputTest(ParserTest):
         with self.assert_raises_contains_str(InputValidationError, 'expected a value matching'):
             Regex(PAT, 'foobar')('barbaz')
 
+    # region Combined Patterns
+
+    def test_combined_only_for_string_mode(self):
+        self.assertIsNotNone(Regex('a', 'b')._combined)
+        self.assertIsNone(Regex('a')._combined)
+        for kwargs in ({'group': 1}, {'groups': (1,)}, {'mode': 'match'}, {'mode': 'dict'}):
+            with self.subTest(kwargs=kwargs):
+                self.assertIsNone(Regex('(a)', '(b)', **kwargs)._combined)
+
+    def test_combined_pattern_order_preserved(self):
+        # The first pattern that matches anywhere in the value should win, even if a later pattern matches earlier
+        self.assertEqual('b', Regex('(b)', '(a)', group=1)('ab'))
+
+    def test_combined_results_match_sequential(self):
+        patterns = ('^x(?P<a>\\d+)', re.compile('FOO(?P<b>.)', re.IGNORECASE), re.compile('z  # comment', re.VERBOSE))
+        r = Regex(*patterns)
+        self.assertIsNotNone(r._combined)
+        for value in ('x12', 'a foo!', 'yz'):
+            with self.subTest(value=value):
+                self.assertEqual(value, r(value))
+                self.assertEqual({'a': '12'}, Regex(*patterns, mode='dict')('x12'))
+
+        for value in ('abc', 'y12', 'fo', '#'):
+            with self.subTest(value=value), self.assert_raises_contains_str(InputValidationError, 'expected a value'):
+                r(value)
+
+    def test_uncombinable_patterns(self):
+        cases = [
+            ('(?P<n>a)', '(?P<n>b)'),  # Duplicate group names
+            ('(a)\\1', 'b'),  # Numbered back-reference
+            (re.compile(b'a'), 'b'),  # Non-str pattern
+        ]
+        for patterns in cases:
+            with self.subTest(patterns=patterns):
+                self.assertIsNone(Regex(*patterns)._combined)
+
+        self.assertEqual('b', Regex('(?P<n>a)', '(?P<n>b)')('b'))
+        self.assertEqual('xaa', Regex('(a)\\1', 'b')('xaa'))
+        with self.assertRaises(InputValidationError):
+            Regex('(a)\\1', 'b')('xa')
+
+    # endregion
+
     def test_strings(self):
         r = Regex('foo', 'bar')
         self.assertEqual('bar | foo', r.format_metavar(sort_choices=True))
@@ -125,6 +168,16 @@ class GlobInputTest(ParserTest):
         self.assertEqual('barbaz', Glob('foo*', '*bar*')('barbaz'))
         self.assertEqual('foo', Glob('FOO')('foo'))
 
+    def test_combined_patterns(self):
+        g = Glob('*.txt', 'foo*', '[ab]?c')
+        self.assertIsNotNone(g._combined)
+        for value in ('a.TXT', 'foobar', 'bxc'):
+            with self.subTest(value=value):
+                self.assertEqual(value, g(value))
+        for value in ('a.txt.bak', 'xfoo', 'cxc'):
+            with self.subTest(value=value), self.assertRaises(InputValidationError):
+                g(value)
+
 
 class ParseInputTest(ParserTest):
     def test_regex_parsing(self):
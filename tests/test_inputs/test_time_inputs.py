@@ -1,12 +1,28 @@
 #!/usr/bin/env python
 
+import locale
+from calendar import day_abbr, day_name, month_abbr, month_name
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import date, datetime, time, timedelta
-from unittest import main
+from locale import setlocale
+from unittest import main, skipUnless
 from unittest.mock import patch
 
 from cli_command_parser import BadArgument, Command, Option
 from cli_command_parser.inputs import InputValidationError, InvalidChoiceError, TimeDelta
-from cli_command_parser.inputs.time import Date, DateTime, Day, Month, Time, different_locale, dt_repr, normalize_dt
+from cli_command_parser.inputs.time import (
+    Date,
+    DateTime,
+    Day,
+    LocaleTables,
+    Month,
+    Time,
+    _langinfo_format,
+    different_locale,
+    dt_repr,
+    normalize_dt,
+)
 from cli_command_parser.testing import ParserTest, get_help_text
 
 # fmt: off
@@ -23,6 +39,25 @@ MONTHS = {
 EN_US = 'en_US.utf-8'
 KO_KR = 'ko_KR.utf-8'
 FR_FR = 'fr_FR.utf-8'
+FAKE_FR = 'xx_FAKE_FR'
+FAKE_FR_TABLES = LocaleTables(
+    FAKE_FR,
+    {
+        day_name: ('lundi', 'mardi', 'mercredi', 'jeudi', 'vendredi', 'samedi', 'dimanche'),
+        day_abbr: ('lun.', 'mar.', 'mer.', 'jeu.', 'ven.', 'sam.', 'dim.'),
+        month_name: (
+            '', 'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+            'juillet', 'août', 'septembre', 'octobre', 'novembre', 'décembre',
+        ),
+        month_abbr: (
+            '', 'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.', 'août', 'sept.', 'oct.', 'nov.', 'déc.'
+        ),
+    },
+    am_pm=('', ''),
+    date_time_fmt='%a %d %b %Y %H:%M:%S',
+    date_fmt='%d/%m/%Y',
+    time_fmt='%H:%M:%S',
+)
 # fmt: on
 
 JAN_1_2022 = date(2022, 1, 1)
@@ -38,6 +73,72 @@ class MiscDTInputTest(ParserTest):
 
         self.assertFalse(setlocale.called)
 
+    # region Locale Tables
+
+    def test_locale_tables_used_without_setlocale(self):
+        with patch.dict(LocaleTables._cache, {FAKE_FR: FAKE_FR_TABLES}):
+            with patch('cli_command_parser.inputs.time.setlocale') as setlocale:
+                self.assertEqual('lundi', Day(locale=FAKE_FR)('LUNDI'))
+                self.assertEqual('Monday', Day(locale=FAKE_FR, out_locale='C')('lun.'))
+                self.assertEqual('août', Month(locale=FAKE_FR)('8'))
+                self.assertEqual(8, Month(locale=FAKE_FR, out_format='numeric')('Août'))
+                with self.assert_raises_contains_str(InputValidationError, 'between 1 (janvier) and 12 (décembre)'):
+                    Month(locale=FAKE_FR)('13')
+
+                dt_input = DateTime('%A %d %B %Y', '%c', locale=FAKE_FR)
+                self.assertEqual(datetime(2022, 2, 1), dt_input('mardi 01 février 2022'))
+                self.assertEqual(datetime(2022, 2, 1, 13, 5, 9), dt_input('mar. 01 févr. 2022 13:05:09'))
+                self.assertEqual(date(2022, 3, 3), Date('%x', locale=FAKE_FR)('03/03/2022'))
+                with self.assertRaises(InputValidationError):
+                    dt_input('mardi 01 February 2022')
+
+        setlocale.assert_not_called()
+
+    def test_locale_tables_match_strptime(self):
+        tables = LocaleTables.for_locale('C')
+        formats = ('%A %d %B %Y', '%a, %d %b %Y %I:%M %p', '%c', '%x', '%X', '%I %p', '%d%b%Y', '%%%B')
+        dt = datetime(2000, 1, 1, 0, 0, 30)
+        for _ in range(40):
+            dt += timedelta(days=17, hours=5, minutes=7)
+            for fmt in formats:
+                value = dt.strftime(fmt)
+                for variant in (value, value.upper(), value.replace(' ', '  ')):
+                    with self.subTest(fmt=fmt, value=variant):
+                        self.assertEqual(datetime.strptime(variant, fmt), tables.strptime(variant, fmt))
+
+    def test_locale_tables_loaded_once(self):
+        with patch.dict(LocaleTables._cache, clear=True):
+            with patch('cli_command_parser.inputs.time.setlocale', wraps=setlocale) as setlocale_mock:
+                day = Day(locale='C')
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    results = set(executor.map(day, ['monday', 'Tue', 'WEDNESDAY', 'thu'] * 10))
+
+        self.assertEqual({'Monday', 'Tuesday', 'Wednesday', 'Thursday'}, results)
+        self.assertEqual(3, setlocale_mock.call_count)  # Get original, set for the tables, then restore original
+
+    def test_locale_table_formats(self):
+        expected = ('%a %b %d %H:%M:%S %Y', '%m/%d/%y', '%H:%M:%S')
+        for langinfo in (True, False):
+            with self.subTest(langinfo=langinfo), patch.dict(LocaleTables._cache, clear=True):
+                with patch('cli_command_parser.inputs.time.nl_langinfo', None) if not langinfo else nullcontext():
+                    tables = LocaleTables.for_locale('C')
+                self.assertEqual(expected, (tables.date_time_fmt, tables.date_fmt, tables.time_fmt))
+
+    @skipUnless(hasattr(locale, 'nl_langinfo'), 'nl_langinfo is not available on this platform')
+    def test_langinfo_format_normalized(self):
+        langinfo = {
+            locale.D_T_FMT: '%a %e %b %Y %r %Z',
+            locale.D_FMT: '%Ey/%Om/%d',
+            locale.T_FMT: '%T',
+            locale.T_FMT_AMPM: '%l:%M:%S %p',
+        }
+        with patch('cli_command_parser.inputs.time.nl_langinfo', langinfo.get):
+            self.assertEqual('%a %d %b %Y %I:%M:%S %p %Z', _langinfo_format(locale.D_T_FMT))
+            self.assertEqual('%y/%m/%d', _langinfo_format(locale.D_FMT))
+            self.assertEqual('%H:%M:%S', _langinfo_format(locale.T_FMT))
+
+    # endregion
+
     # region normalize_dt
 
     def test_normalize_dt_bad_type(self):
@@ -314,6 +415,32 @@ class TimeDeltaInputTest(ParserTest):
         self.assert_parse_fails(Foo, ['-b', '4.5'], BadArgument, 'expected an integer, not a float')
         self.assert_parse_fails(Foo, ['-b', '-3.5'], BadArgument, 'expected an integer, not a float')
 
+    def test_convert_many_matches_call(self):
+        values = ['1', '2.5', '-3', '1,000', '0.000001', '1e-7', 1, 2.25]
+        for unit in ('days', 'seconds', 'microseconds', 'weeks'):
+            with self.subTest(unit=unit):
+                td = TimeDelta(unit)
+                self.assertEqual([td(v) for v in values], td.convert_many(values))
+
+    def test_convert_many_validation(self):
+        with self.assert_raises_contains_str(InputValidationError, 'hours=15.0 - expected a value in the range'):
+            TimeDelta('hours', min=1, max=10).convert_many(['2', '15', '3'])
+        with self.assert_raises_contains_str(InputValidationError, 'hours=4.5 - expected an integer, not a float'):
+            TimeDelta('hours', int_only=True).convert_many(['2', '4.5'])
+        with self.assert_raises_contains_str(InputValidationError, "hours='x' - expected an integer or float"):
+            TimeDelta('hours').convert_many(['2', 'x'])
+
+    def test_convert_many_error_order_matches_call(self):
+        td = TimeDelta('hours', max=10, int_only=True)
+        cases = [['4.5', '15'], ['15', '4.5'], ['15', 'x'], ['x', '15'], ['11.5']]
+        for values in cases:
+            with self.subTest(values=values):
+                with self.assertRaises(InputValidationError) as serial_ctx:
+                    [td(v) for v in values]  # noqa
+                with self.assertRaises(InputValidationError) as bulk_ctx:
+                    td.convert_many(values)
+                self.assertEqual(str(serial_ctx.exception), str(bulk_ctx.exception))
+
 
 class DateTimeInputTest(ParserTest):
     _CASES = {
@@ -398,6 +525,48 @@ class DateTimeInputTest(ParserTest):
         expected = '[2000-01-01 <= {%Y-%m-%d} <= 2005-12-31]'
         self.assertEqual(expected, Date(earliest=earliest, latest=latest).format_metavar())
 
+    def test_iso_fast_path_matches_strptime(self):
+        cases = {
+            '%Y-%m-%d %H:%M:%S': (
+                '2000-01-31 02:30:45',
+                '2000-01-31 2:30:45',
+                '2000-02-30 02:30:45',
+                '2000-01-31 24:00:00',
+            ),
+            '%Y-%m-%dT%H:%M:%S': ('2000-01-31T23:59:59', '2000-01-31t23:59:59', '2000-13-01T00:00:00'),
+            '%Y-%m-%d': ('2000-01-31', '2000-1-31', '0000-01-01', '2000-01-31 '),
+            '%H:%M:%S': ('02:30:45', '2:30:45', '23:59:60', '24:00:00'),
+        }
+        for fmt, values in cases.items():
+            dt_input = DateTime(fmt)
+            for value in values:
+                with self.subTest(fmt=fmt, value=value):
+                    try:
+                        expected = datetime.strptime(value, fmt)
+                    except ValueError:
+                        with self.assertRaises(InputValidationError):
+                            dt_input(value)
+                    else:
+                        self.assertEqual(expected, dt_input(value))
+
+    def test_setlocale_skipped_without_locale_directives(self):
+        with patch('cli_command_parser.inputs.time.setlocale') as setlocale:
+            self.assertEqual(date(2000, 1, 2), Date('%d/%m/%Y', locale=FR_FR)('02/01/2000'))
+        setlocale.assert_not_called()
+
+    def test_most_recent_format_tried_first(self):
+        dt_input = Date('%Y-%m-%d', '%d/%m/%Y', '%Y%m%d')
+        self.assertEqual(date(2000, 1, 2), dt_input('02/01/2000'))
+        with patch('cli_command_parser.inputs.time.datetime', wraps=datetime) as dt_mock:
+            self.assertEqual(date(2000, 1, 3), dt_input('03/01/2000'))
+        dt_mock.strptime.assert_called_once_with('03/01/2000', '%d/%m/%Y')
+        self.assertEqual(date(2000, 1, 4), dt_input('20000104'))
+
+    def test_ambiguous_formats_keep_order(self):
+        dt_input = Date('%d/%m/%Y', '%m/%d/%Y')
+        self.assertEqual(date(2000, 1, 13), dt_input('01/13/2000'))
+        self.assertEqual(date(2000, 2, 1), dt_input('01/02/2000'))
+
 
 class ParseInputTest(ParserTest):
     def test_date_default_type_fix(self):
@@ -36,6 +36,36 @@ class ChoiceMapTest(ParserTest):
             with self.assertRaises(InvalidChoice):
                 Foo.action.action.add_value('baz')
 
+    def test_unknown_choice_suggestions(self):
+        class Foo(Command):
+            sub_cmd = SubCommand()
+
+        class Status(Foo):
+            pass
+
+        class Start(Foo):
+            pass
+
+        class RemoteStatus(Foo, choice='remote status'):
+            pass
+
+        with self.assert_raises_contains_str(InvalidChoice, "did you mean: 'status'"):
+            Foo.parse(['stauts'])
+        with self.assert_raises_contains_str(InvalidChoice, "did you mean: 'remote'?"):
+            Foo.parse(['remtoe', 'status'])
+        with self.assertRaises(InvalidChoice) as ctx:
+            Foo.parse(['xyz'])
+        self.assertNotIn('did you mean', str(ctx.exception))
+
+    def test_suggestions_reflect_new_choices(self):
+        class Foo(Command):
+            action = Action()
+            action('alpha')(lambda self: None)
+
+        self.assertEqual(['alpha'], Foo.action.suggest('alha'))
+        Foo.action.register(lambda self: None, choice='aloha')
+        self.assertEqual(['alpha', 'aloha'], Foo.action.suggest('alha'))
+
     def test_missing_action_target(self):
         class Foo(Command):
             action = Action()
@@ -3,18 +3,21 @@
 import pickle
 import re
 from unittest import main
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from cli_command_parser import Command, Context, Flag, Option, ParamGroup, get_parsed
 from cli_command_parser.exceptions import (
     BadArgument,
+    InvalidChoice,
     MissingArgument,
     ParamConflict,
     ParameterDefinitionError,
     ParamsMissing,
     ParamUsageError,
+    TooManyArguments,
     UsageError,
 )
+from cli_command_parser.inputs import NumRange
 from cli_command_parser.nargs import REMAINDER
 from cli_command_parser.testing import ParserTest, get_help_text, get_usage_text
 
@@ -266,6 +269,53 @@ class OptionNargsTest(ParserTest):
 
     # endregion
 
+    # region Multiple Values
+
+    def test_add_values_converts_together(self):
+        class Foo(Command):
+            bar = Option(nargs='+', type=NumRange(int, min=0, max=10))
+
+        with patch.object(NumRange, 'convert_many', autospec=True, side_effect=NumRange.convert_many) as convert_many:
+            with Context() as ctx:
+                self.assertEqual(3, Foo.bar.action.add_values(['1', '2', '3']))
+                self.assertEqual([1, 2, 3], ctx.get_parsed_value(Foo.bar))
+
+        convert_many.assert_called_once()
+
+    def test_add_values_errors(self):
+        class Foo(Command):
+            bar = Option(nargs=(1, 3), type=NumRange(int, min=0, max=10))
+            baz = Option(nargs='+', choices=('a', 'b'))
+
+        fail_cases = [
+            (Foo.bar, ['1', '20'], BadArgument, 'invalid input - expected a value in the range'),
+            (Foo.bar, ['1', 'x'], BadArgument, "bad value='x' for type="),
+            (Foo.bar, ['1', '2', '3', '4'], TooManyArguments, 'already found 0 values'),
+            (Foo.baz, ['a', 'c', 'd'], InvalidChoice, "invalid choices: 'c', 'd' (choose from: 'a', 'b')"),
+        ]
+        for param, values, exc, expected in fail_cases:
+            with self.subTest(param=param, values=values), Context():
+                with self.assert_raises_contains_str(exc, expected):
+                    param.action.add_values(values)
+
+    def test_add_values_error_no_reconversion(self):
+        converted = []
+
+        def convert(value: str) -> int:
+            converted.append(value)
+            return int(value)
+
+        class Foo(Command):
+            bar = Option(nargs='+', type=NumRange(convert, min=0, max=10))
+
+        converted.clear()  # The min and max are converted during initialization
+        with Context(), self.assert_raises_contains_str(BadArgument, "bad value='x' for type="):
+            Foo.bar.action.add_values(['1', '2', 'x', '3'])
+
+        self.assertEqual(['1', '2', 'x'], converted)
+
+    # endregion
+
 
 class OptionBasicParsingTest(ParserTest):
     def test_choice_ok(self):
@@ -1,10 +1,17 @@
 #!/usr/bin/env python
 
 from unittest import main
-
-from cli_command_parser import Command, Context, ParamGroup, Positional, SubCommand
-from cli_command_parser.exceptions import CommandDefinitionError, ParameterDefinitionError, TooManyArguments, UsageError
-from cli_command_parser.testing import ParserTest
+from unittest.mock import Mock, patch
+
+from cli_command_parser import Command, Context, Option, ParamGroup, Positional, SubCommand
+from cli_command_parser.exceptions import (
+    BadArgument,
+    CommandDefinitionError,
+    ParameterDefinitionError,
+    TooManyArguments,
+    UsageError,
+)
+from cli_command_parser.testing import ParserTest, RedirectStreams
 from cli_command_parser.utils import _NotSet
 
 
@@ -133,6 +140,69 @@ class PositionalTest(ParserTest):
                 param.action.add_value('bar')
 
 
+class StdinPositionalTest(ParserTest):
+    def test_stdin_store_rejected(self):
+        for kwargs in ({}, {'nargs': 1}, {'nargs': '?'}, {'action': 'store'}):
+            with self.subTest(kwargs=kwargs), self.assertRaises(ParameterDefinitionError):
+                Positional(stdin=True, **kwargs)
+
+    def test_dash_reads_stdin_lazily(self):
+        class Foo(Command):
+            bar = Positional(nargs='+', type=int, stdin=True)
+
+        with RedirectStreams('1\n2\n\n3\n') as streams:
+            cmd = Foo.parse(['-'])
+            values = cmd.bar
+            self.assertNotIsInstance(values, list)
+            self.assertEqual(1, next(values))
+            self.assertEqual('2\n\n3\n', streams._stdin.read())
+
+    def test_dash_mixed_with_values(self):
+        class Foo(Command):
+            bar = Positional(nargs='+', stdin=True)
+            baz = Option('-b')
+
+        with RedirectStreams('x\ny\n'):
+            self.assertEqual(['a', 'x', 'y', 'b'], list(Foo.parse(['a', '-', 'b', '-b', 'c']).bar))
+
+    def test_no_values_reads_non_tty_stdin(self):
+        class Foo(Command):
+            bar = Positional(nargs='+', stdin=True)
+
+        with RedirectStreams('a\nb\n'):
+            self.assertEqual(['a', 'b'], list(Foo.parse([]).bar))
+
+    def test_no_values_tty_stdin_missing(self):
+        class Foo(Command):
+            bar = Positional(nargs='+', stdin=True)
+
+        with patch('sys.stdin', Mock(isatty=Mock(return_value=True))):
+            self.assert_parse_fails(Foo, [], UsageError, 'the following argument is required')
+
+    def test_explicit_values_ignore_stdin(self):
+        class Foo(Command):
+            bar = Positional(nargs='*', stdin=True)
+
+        with RedirectStreams('a\nb\n'):
+            self.assertEqual(['c'], Foo.parse(['c']).bar)
+
+    def test_invalid_stdin_value_raised_on_iteration(self):
+        class Foo(Command):
+            bar = Positional(nargs='+', type=int, stdin=True)
+
+        with RedirectStreams('1\nx\n'):
+            values = Foo.parse(['-']).bar
+            self.assertEqual(1, next(values))
+            with self.assert_raises_contains_str(BadArgument, "bad value='x'"):
+                next(values)
+
+    def test_dash_without_stdin_still_rejected(self):
+        class Foo(Command):
+            bar = Positional(nargs='+', type=int)
+
+        self.assert_parse_fails(Foo, ['-'], BadArgument)
+
+
 if __name__ == '__main__':
     try:
         main(verbosity=2, exit=False)
@@ -55,6 +55,21 @@ class OptionTest(ParserTest):
         self.assertEqual(Foo.parse(['bar', '--baz']).ctx.remaining, ['--baz'])
         self.assertEqual(Foo.parse(['bar', '--baz', 'a']).ctx.remaining, ['--baz', 'a'])
 
+    def test_unknown_option_suggestions(self):
+        class Foo(Command):
+            verbose = Flag('-v')
+            output = Option('-o')
+
+        with self.assert_raises_contains_str(
+            NoSuchOption, "unrecognized arguments: --verbsoe - did you mean: '--verbose'?"
+        ):
+            Foo.parse(['--verbsoe'])
+        with self.assert_raises_contains_str(NoSuchOption, "did you mean: '--output'?"):
+            Foo.parse(['--otuput=x'])
+        with self.assertRaises(NoSuchOption) as ctx:
+            Foo.parse(['--xyz'])
+        self.assertNotIn('did you mean', str(ctx.exception))
+
     def test_extra_short_option_deferred(self):
         class Foo(Command):
             bar = Positional()
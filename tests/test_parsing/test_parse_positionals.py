@@ -1,10 +1,12 @@
 #!/usr/bin/env python
 
 from unittest import main
+from unittest.mock import patch
 
 from cli_command_parser import REMAINDER, Command, Flag, Option, PassThru, Positional
 from cli_command_parser.core import CommandMeta
 from cli_command_parser.exceptions import BadArgument, NoSuchOption, UsageError
+from cli_command_parser.parameters.actions import Append
 from cli_command_parser.testing import ParserTest
 
 get_config = CommandMeta.config
@@ -132,6 +134,16 @@ class PositionalTest(ParserTest):
         fail_cases = [[], ['--bar']]
         self.assert_parse_fails_cases(Foo, fail_cases, UsageError)
 
+    def test_positional_remainder_added_together(self):
+        class Foo(Command):
+            bar = Flag()
+            baz = Positional(nargs='REMAINDER')
+
+        with patch.object(Append, 'add_values', autospec=True, side_effect=Append.add_values) as add_values:
+            self.assert_parse_results(Foo, ['--bar', 'a', '-b', 'c'], {'bar': True, 'baz': ['a', '-b', 'c']})
+
+        add_values.assert_called_once()
+
 
 class NargsParsingTest(ParserTest):
     def test_positional_even_range(self):